@@ -1,16 +1,10 @@
 import importlib
-import os
-import pkgutil
 
 from .version import version as __version__
+from .registry import DATASETS as _REGISTRY
 
 
-DATASETS = [
-    d.name
-    for d in pkgutil.iter_modules(
-        [os.path.dirname(os.path.abspath(__file__)) + "/datasets"]
-    )
-]
+DATASETS = list(_REGISTRY)
 
 
 def list_datasets():
@@ -22,6 +16,37 @@ def list_datasets():
     return DATASETS
 
 
+def dataset_info(dataset_name):
+    """Get information about a dataset without importing its loader
+
+    Example:
+        .. code-block:: python
+
+            info = mirdata.dataset_info('phenicx_anechoic')
+            info['has_multitracks']  # True
+            info['num_tracks']  # number of tracks in the index
+
+    Args:
+        dataset_name (str): the dataset's name
+            see mirdata.DATASETS for a complete list of possibilities
+
+    Returns:
+        dict: the dataset's registry entry, with keys
+
+            - module (str): the loader module
+            - has_tracks (bool): whether the dataset has a Track class
+            - has_multitracks (bool): whether the dataset has a MultiTrack class
+            - remote_index (bool): whether the index is downloaded with the dataset
+            - index_size (int or None): size of the index in bytes, None for remote indexes
+            - num_tracks (int or None): number of tracks, None for remote indexes
+            - num_multitracks (int or None): number of multitracks, None for remote indexes
+
+    """
+    if dataset_name not in _REGISTRY:
+        raise ValueError("Invalid dataset {}".format(dataset_name))
+    return dict(_REGISTRY[dataset_name])
+
+
 def initialize(dataset_name, data_home=None):
     """Load a mirdata dataset by name
 
@@ -45,8 +70,8 @@ def initialize(dataset_name, data_home=None):
         Dataset: a mirdata.core.Dataset object
 
     """
-    if dataset_name not in DATASETS:
+    if dataset_name not in _REGISTRY:
         raise ValueError("Invalid dataset {}".format(dataset_name))
 
-    module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
+    module = importlib.import_module(_REGISTRY[dataset_name]["module"])
     return module.Dataset(data_home=data_home)
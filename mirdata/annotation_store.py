@@ -0,0 +1,371 @@
+"""Annotation store utilities
+
+Parsing text annotations is often slower than the rest of a training
+epoch. An :class:`AnnotationStore` keeps each loaded annotation
+(``BeatData``, ``F0Data``, ``ChordData``, ...) as a binary ``.npz`` sidecar,
+keyed by the md5 checksum of its source file in the dataset index and by
+the loader which parsed it. Later loads memory-map the arrays back instead
+of parsing the file again.
+
+A store is set globally or per dataset with :func:`set_store`, usually
+through ``Dataset.set_annotation_store``, and is used by
+``Track.get_annotation``.
+
+Sidecars can also be written and read directly with :func:`save_annotation`
+and :func:`load_annotation`.
+
+"""
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+from mirdata import annotations
+from mirdata import version
+
+FORMAT_VERSION = 1
+
+_META_NAME = "__meta__"
+
+_LOCAL_HEADER_SIZE = 30
+
+# stores chosen with set_store: None for the global setting, or a dataset name
+_STORES = {}
+
+
+def _encode(name, value, arrays):
+    """Add an annotation attribute to the arrays to save, and return its kind"""
+    if value is None:
+        return "none"
+
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("{} has dtype object".format(name))
+        arrays[name] = value
+        return "array"
+
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        arrays[name] = np.array(value, dtype=str)
+        return "str_list"
+
+    if isinstance(value, list) and all(isinstance(v, list) for v in value):
+        values = np.array([x for v in value for x in v])
+        if values.dtype.kind not in "iuf":
+            raise TypeError("{} is not a list of lists of numbers".format(name))
+        arrays[name + ".values"] = values
+        arrays[name + ".lengths"] = np.array([len(v) for v in value], dtype=np.int64)
+        return "nested_list"
+
+    raise TypeError("{} has unsupported type {}".format(name, type(value)))
+
+
+def _decode(name, kind, arrays):
+    """Rebuild an annotation attribute from the loaded arrays"""
+    if kind == "none":
+        return None
+    if kind == "array":
+        return arrays[name]
+    if kind == "str_list":
+        return arrays[name].tolist()
+    if kind == "nested_list":
+        values = arrays[name + ".values"].tolist()
+        bounds = np.cumsum(arrays[name + ".lengths"]).tolist()
+        return [values[start:end] for start, end in zip([0] + bounds, bounds)]
+    raise ValueError("Unknown attribute kind {}".format(kind))
+
+
+def _loader_name(loader):
+    """Get a name identifying a loader across processes, or None
+
+    Lambdas, functions defined inside other functions and bound methods
+    have no such name: two of them can share a qualified name but parse
+    differently. A functools.partial is named by its function and by an md5
+    of its arguments, which must be serializable to json.
+    """
+    if isinstance(loader, functools.partial):
+        name = _loader_name(loader.func)
+        if name is None:
+            return None
+        try:
+            arguments = json.dumps(
+                [loader.args, sorted(loader.keywords.items())], sort_keys=True
+            )
+        except (TypeError, ValueError):
+            return None
+        return "{}-{}".format(name, hashlib.md5(arguments.encode()).hexdigest())
+
+    module = getattr(loader, "__module__", None)
+    qualname = getattr(loader, "__qualname__", None)
+    if not module or not qualname or "<" in qualname or inspect.ismethod(loader):
+        return None
+    return "{}.{}".format(module, qualname)
+
+
+def _annotation_class(name):
+    module_name, _, class_name = name.rpartition(".")
+    cls = getattr(importlib.import_module(module_name), class_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, annotations.Annotation)):
+        raise ValueError("{} is not an annotation class".format(name))
+    return cls
+
+
+def save_annotation(fhandle, annotation):
+    """Save an annotation as an uncompressed .npz file
+
+    Args:
+        fhandle (str or file-like): path or binary file handle to write to
+        annotation (annotations.Annotation): the annotation to save
+
+    Raises:
+        TypeError: if the annotation has an attribute which is not None, a
+            numeric or string array, a list of strings or a list of lists of
+            numbers
+
+    """
+    arrays = {}
+    kinds = {
+        name: _encode(name, value, arrays)
+        for name, value in sorted(vars(annotation).items())
+    }
+    cls = type(annotation)
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "mirdata_version": version.version,
+        "class": "{}.{}".format(cls.__module__, cls.__qualname__),
+        "attributes": kinds,
+    }
+    arrays[_META_NAME] = np.array(json.dumps(meta))
+    np.savez(fhandle, **arrays)
+
+
+def _read_npy_header(fhandle):
+    major, minor = np.lib.format.read_magic(fhandle)
+    if (major, minor) == (1, 0):
+        return np.lib.format.read_array_header_1_0(fhandle)
+    return np.lib.format.read_array_header_2_0(fhandle)
+
+
+def _memmap_npz(path):
+    """Memory-map the arrays of an uncompressed .npz file
+
+    np.load does not memory-map the members of a .npz file, but np.savez
+    stores them uncompressed, so each member's data can be mapped directly
+    from its offset in the zip file.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as fhandle:
+        for zinfo in archive.infolist():
+            if zinfo.compress_type != zipfile.ZIP_STORED:
+                raise ValueError("{} is compressed".format(path))
+            # the local file header is 30 bytes, ending with the lengths of
+            # the file name and of the extra field which precede the data
+            fhandle.seek(zinfo.header_offset)
+            name_length, extra_length = struct.unpack(
+                "<HH", fhandle.read(_LOCAL_HEADER_SIZE)[26:]
+            )
+            fhandle.seek(
+                zinfo.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+            )
+            shape, fortran_order, dtype = _read_npy_header(fhandle)
+            name = zinfo.filename[: -len(".npy")]
+            if dtype.hasobject:
+                raise ValueError("{} has dtype object".format(name))
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+                continue
+            arrays[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="c",
+                offset=fhandle.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
+
+
+def load_annotation(path, mmap_mode="c"):
+    """Load an annotation saved with save_annotation
+
+    The annotation is rebuilt without validating it again.
+
+    Args:
+        path (str): path to the .npz file
+        mmap_mode (str or None): if ``"c"``, numeric arrays are memory-mapped
+            copy-on-write, so only the parts which are used are read from
+            disk and modifying them does not modify the file. If None, the
+            arrays are read into memory.
+
+    Raises:
+        ValueError: if the file was saved by another version of mirdata or
+            of the file format, or if it does not hold an annotation
+
+    Returns:
+        annotations.Annotation: the annotation
+
+    """
+    if mmap_mode == "c":
+        arrays = _memmap_npz(path)
+    elif mmap_mode is None:
+        with np.load(path, allow_pickle=False) as npz:
+            arrays = dict(npz.items())
+    else:
+        raise ValueError("mmap_mode must be 'c' or None, got {}".format(mmap_mode))
+
+    meta = json.loads(str(arrays.pop(_META_NAME)[()]))
+    if (
+        meta.get("format_version") != FORMAT_VERSION
+        or meta.get("mirdata_version") != version.version
+    ):
+        raise ValueError(
+            "{} was saved by mirdata {} with format {}".format(
+                path, meta.get("mirdata_version"), meta.get("format_version")
+            )
+        )
+
+    cls = _annotation_class(meta["class"])
+    annotation = cls.__new__(cls)
+    for name, kind in meta["attributes"].items():
+        setattr(annotation, name, _decode(name, kind, arrays))
+    return annotation
+
+
+class AnnotationStore(object):
+    """Loaded annotations stored on disk as .npz sidecars
+
+    Entries are keyed by the md5 checksum of the annotation file in the
+    dataset index and by the loader function, so an entry is not used once
+    the index checksum changes, e.g. for a new version of a dataset.
+    Annotations parsed by loaders without a stable qualified name, such as
+    lambdas, are not stored. Entries saved by another version of mirdata are
+    ignored and overwritten. The store directory can be shared by processes.
+
+    Args:
+        store_dir (str): directory where the annotations are stored
+        mmap_mode (str or None): passed to load_annotation. If ``"c"``,
+            arrays are memory-mapped copy-on-write.
+
+    """
+
+    def __init__(self, store_dir, mmap_mode="c"):
+        self.store_dir = store_dir
+        self.mmap_mode = mmap_mode
+
+    def key(self, checksum, loader):
+        """Get the store key of an annotation
+
+        Args:
+            checksum (str): md5 checksum of the annotation file
+            loader (function): the function parsing the annotation file,
+                or a functools.partial of it
+
+        Returns:
+            str or None: the store key, or None if the loader is a lambda, a
+            function defined inside another function, a bound method, or a
+            partial with arguments which cannot be serialized to json, whose
+            annotations are not stored
+
+        """
+        name = _loader_name(loader)
+        if name is None:
+            return None
+        return "{}_{}".format(checksum, name)
+
+    def _path(self, key):
+        return os.path.join(self.store_dir, "{}.npz".format(key))
+
+    def get(self, key):
+        """Load a stored annotation
+
+        Args:
+            key (str): the store key, see AnnotationStore.key
+
+        Returns:
+            annotations.Annotation or None: the annotation, or None if it is
+            not in the store or was saved by another version of mirdata
+
+        """
+        try:
+            return load_annotation(self._path(key), mmap_mode=self.mmap_mode)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, zipfile.BadZipFile):
+            # stale or unreadable entries are replaced by the next put
+            return None
+
+    def put(self, key, annotation):
+        """Store an annotation
+
+        Args:
+            key (str): the store key, see AnnotationStore.key
+            annotation (annotations.Annotation): the annotation to store
+
+        Returns:
+            bool: True if the annotation was stored, False if it has
+            attributes which cannot be saved, see save_annotation
+
+        """
+        os.makedirs(self.store_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = os.path.join(
+            self.store_dir, ".{}.{}".format(os.path.basename(path), os.getpid())
+        )
+        try:
+            with open(tmp_path, "wb") as fhandle:
+                save_annotation(fhandle, annotation)
+        except TypeError:
+            os.remove(tmp_path)
+            return False
+        os.replace(tmp_path, path)
+        return True
+
+    def clear(self):
+        """Delete all of the stored annotations"""
+        if not os.path.isdir(self.store_dir):
+            return
+        for name in os.listdir(self.store_dir):
+            if name.endswith(".npz"):
+                try:
+                    os.remove(os.path.join(self.store_dir, name))
+                except FileNotFoundError:
+                    pass
+
+
+def set_store(store, dataset_name=None):
+    """Store loaded annotations on disk
+
+    Args:
+        store (AnnotationStore, False or None): the store to use. If False,
+            disables the store. If None, removes the setting, so a dataset
+            uses the global setting.
+        dataset_name (str or None): if given, only applies to this dataset's
+            tracks, otherwise applies to all datasets without their own
+            setting
+
+    """
+    if store is None:
+        _STORES.pop(dataset_name, None)
+    else:
+        _STORES[dataset_name] = store
+
+
+def get_store(dataset_name=None):
+    """Get the annotation store in use
+
+    Args:
+        dataset_name (str or None): the dataset's name
+
+    Returns:
+        AnnotationStore, False or None: the store, or False or None if
+        annotations are not stored
+
+    """
+    if dataset_name in _STORES:
+        return _STORES[dataset_name]
+    return _STORES.get(None)
@@ -0,0 +1,1160 @@
+"""Audio decoding utilities
+
+Dataset loaders decode audio with :func:`load`, which tries a list of
+decoding backends in order until one of them supports the file:
+
+- ``wav_memmap``: reads PCM and float WAV files by memory-mapping their data
+  chunk, without going through a decoding library
+- ``soundfile``: reads any format supported by libsndfile
+- ``librosa``: ``librosa.load``, which falls back to audioread
+
+The backends can be chosen globally or per dataset with :func:`set_backend`,
+and new backends can be added with :func:`register_backend`.
+
+Every backend can decode a window of a file, given by an ``offset`` and a
+``duration`` in seconds, without decoding the rest of the file. The window
+can also be set for all audio loaded in a block of code with :func:`window`,
+which is how ``Track.get_audio_window`` windows any of a track's audio
+properties. :func:`load_channels` loads only some channels of a
+multichannel file.
+
+Decoded audio can be cached on disk with an :class:`AudioCache`, set
+globally or per dataset with :func:`set_cache`.
+Tracks can also keep their decoded audio in memory, shared between the
+mono and multichannel views of a file, when enabled with :func:`set_memo`.
+
+Long recordings can be processed in constant memory with :func:`stream`,
+which yields fixed-size blocks of audio as they are decoded.
+
+"""
+import contextlib
+import contextvars
+import io
+import itertools
+import os
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from mirdata import core
+from mirdata import validate
+
+librosa = core.lazy_import("librosa")
+soundfile = core.lazy_import("soundfile")
+soxr = core.lazy_import("soxr")
+
+DEFAULT_BACKENDS = ["wav_memmap", "soundfile", "librosa"]
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (offset, duration) applied to loads which do not set their own window
+_WINDOW = contextvars.ContextVar("audio_window", default=(0.0, None))
+
+
+class UnsupportedAudioError(Exception):
+    """Raised by a backend which cannot decode an audio file, so that the
+    next backend is tried"""
+
+
+def _wav_layout(fhandle):
+    """Parse the header of a WAV file
+
+    Args:
+        fhandle (BinaryIO): file handle positioned at the start of the file
+
+    Returns:
+        * np.dtype - dtype of the samples
+        * int - number of channels
+        * int - sample rate
+        * int - offset of the data chunk in bytes
+        * int - number of frames
+
+    Raises:
+        UnsupportedAudioError: if the file is not a PCM or float WAV file
+            with 8, 16 or 32 bit integer or 32 or 64 bit float samples
+
+    """
+    header = fhandle.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        raise UnsupportedAudioError("not a WAV file")
+
+    fmt = None
+    while True:
+        chunk_header = fhandle.read(8)
+        if len(chunk_header) < 8:
+            raise UnsupportedAudioError("WAV file without a data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+        if chunk_id == b"fmt ":
+            fmt = fhandle.read(chunk_size)
+            if chunk_size % 2:
+                fhandle.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            data_offset = fhandle.tell()
+            data_size = chunk_size
+            break
+        else:
+            fhandle.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+    if fmt is None or len(fmt) < 16:
+        raise UnsupportedAudioError("WAV file without a valid fmt chunk")
+    audio_format, n_channels, sample_rate, _, block_align, bits = struct.unpack(
+        "<HHIIHH", fmt[:16]
+    )
+    if audio_format == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        audio_format = struct.unpack("<H", fmt[24:26])[0]
+
+    if audio_format == _WAVE_FORMAT_PCM and bits in (8, 16, 32):
+        dtype = np.dtype({8: "u1", 16: "<i2", 32: "<i4"}[bits])
+    elif audio_format == _WAVE_FORMAT_IEEE_FLOAT and bits in (32, 64):
+        dtype = np.dtype({32: "<f4", 64: "<f8"}[bits])
+    else:
+        raise UnsupportedAudioError(
+            "unsupported WAV format {} with {} bits".format(audio_format, bits)
+        )
+    if n_channels == 0 or block_align != n_channels * dtype.itemsize:
+        raise UnsupportedAudioError("unsupported WAV block alignment")
+
+    # some writers leave the data size at 0 or larger than the file
+    fhandle.seek(0, os.SEEK_END)
+    data_size = min(data_size, fhandle.tell() - data_offset)
+    n_frames = data_size // block_align
+    return dtype, n_channels, sample_rate, data_offset, n_frames
+
+
+def _frame_range(n_frames, sample_rate, offset, duration):
+    """Convert a window in seconds to a range of frames, rounding like
+    librosa.load
+
+    Args:
+        n_frames (int): number of frames in the file
+        sample_rate (int): sample rate of the file
+        offset (float): start of the window in seconds
+        duration (float or None): length of the window in seconds. If None,
+            the window ends at the end of the file.
+
+    Returns:
+        * int - first frame of the window
+        * int - frame after the last frame of the window
+
+    """
+    start = min(int(offset * sample_rate), n_frames)
+    if duration is None:
+        return start, n_frames
+    return start, min(start + int(duration * sample_rate), n_frames)
+
+
+def _downmix(samples):
+    """Average the channels of (n_frames, n_channels) samples
+
+    Adds the channels one at a time, which is much faster than a mean over
+    the (short, strided) channel axis.
+
+    Args:
+        samples (np.ndarray): samples with shape (n_frames, n_channels)
+
+    Returns:
+        np.ndarray: float32 audio with shape (n_frames,)
+
+    """
+    y = samples[:, 0].astype(np.float32)
+    for channel in range(1, samples.shape[1]):
+        y += samples[:, channel]
+    if samples.shape[1] > 1:
+        y /= samples.shape[1]
+    return y
+
+
+def downmix(y):
+    """Average the channels of decoded audio
+
+    Args:
+        y (np.ndarray): audio with shape (n_channels, n_samples) or (n_samples,)
+
+    Returns:
+        np.ndarray: float32 audio with shape (n_samples,)
+
+    """
+    if y.ndim == 1:
+        return y
+    return _downmix(y.T)
+
+
+def _sample_scale(dtype):
+    """Get the offset and scale mapping samples of a dtype to [-1, 1]"""
+    if dtype.kind == "u":
+        # unsigned 8 bit samples are centered around 128
+        return 128.0, 1.0 / 128
+    if dtype.kind == "i":
+        return 0.0, 1.0 / (1 << (8 * dtype.itemsize - 1))
+    return 0.0, 1.0
+
+
+def _to_float32(samples, mono):
+    """Convert (n_frames, n_channels) integer or float samples to float32
+
+    Args:
+        samples (np.ndarray): samples, e.g. a memmap of a WAV data chunk
+        mono (bool): if True, average the channels
+
+    Returns:
+        np.ndarray: float32 audio with shape (n_channels, n_frames), or
+        (n_frames,) if mono or if the audio has a single channel
+
+    """
+    offset, scale = _sample_scale(samples.dtype)
+    if mono or samples.shape[1] == 1:
+        y = _downmix(samples)
+    else:
+        y = samples.T.astype(np.float32)
+    if offset:
+        y -= offset
+    if scale != 1.0:
+        y *= scale
+    return y
+
+
+def load_wav_memmap(fhandle, mono, offset=0.0, duration=None):
+    """Decode a PCM or float WAV file by memory-mapping its data chunk
+
+    Only the pages of the data chunk inside the window are read.
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, a WAV file.
+            File handles must be backed by a file on disk.
+        mono (bool): if True, average the channels
+        offset (float): start of the audio to decode in seconds
+        duration (float or None): length of the audio to decode in seconds.
+            If None, decodes until the end of the file.
+
+    Returns:
+        * np.ndarray - float32 audio
+        * int - sample rate
+
+    Raises:
+        UnsupportedAudioError: if the file is not a supported WAV file
+
+    """
+    if isinstance(fhandle, str):
+        with open(fhandle, "rb") as opened:
+            return load_wav_memmap(opened, mono, offset, duration)
+
+    try:
+        fhandle.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        raise UnsupportedAudioError("file handle is not backed by a file")
+
+    dtype, n_channels, sample_rate, data_offset, n_frames = _wav_layout(fhandle)
+    start, stop = _frame_range(n_frames, sample_rate, offset, duration)
+    if stop <= start:
+        samples = np.zeros((0, n_channels), dtype=dtype)
+    else:
+        samples = np.memmap(
+            fhandle,
+            dtype=dtype,
+            mode="r",
+            offset=data_offset + start * n_channels * dtype.itemsize,
+            shape=(stop - start, n_channels),
+        )
+    return _to_float32(samples, mono), sample_rate
+
+
+def load_soundfile(fhandle, mono, offset=0.0, duration=None):
+    """Decode an audio file with soundfile, seeking to the start of the window
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+        mono (bool): if True, average the channels
+        offset (float): start of the audio to decode in seconds
+        duration (float or None): length of the audio to decode in seconds.
+            If None, decodes until the end of the file.
+
+    Returns:
+        * np.ndarray - float32 audio
+        * int - sample rate
+
+    Raises:
+        UnsupportedAudioError: if libsndfile cannot read the file
+
+    """
+    try:
+        with soundfile.SoundFile(fhandle) as sound_file:
+            sample_rate = sound_file.samplerate
+            start, stop = _frame_range(sound_file.frames, sample_rate, offset, duration)
+            if start:
+                sound_file.seek(start)
+            samples = sound_file.read(
+                max(stop - start, 0), dtype="float32", always_2d=True
+            )
+    except RuntimeError as exc:
+        # libsndfile errors, e.g. unsupported formats
+        raise UnsupportedAudioError(str(exc))
+    if mono or samples.shape[1] == 1:
+        return _downmix(samples), sample_rate
+    return samples.T, sample_rate
+
+
+def load_librosa(fhandle, mono, offset=0.0, duration=None):
+    """Decode an audio file with librosa.load
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+        mono (bool): if True, average the channels
+        offset (float): start of the audio to decode in seconds
+        duration (float or None): length of the audio to decode in seconds.
+            If None, decodes until the end of the file.
+
+    Returns:
+        * np.ndarray - float32 audio
+        * int - sample rate
+
+    """
+    return librosa.load(fhandle, sr=None, mono=mono, offset=offset, duration=duration)
+
+
+def info(fhandle):
+    """Read the sample rate, number of channels and length of an audio file
+    from its header, without decoding it
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+
+    Returns:
+        dict: with keys ``sample_rate`` (int), ``n_channels`` (int),
+        ``n_frames`` (int) and ``duration`` (float, in seconds)
+
+    Raises:
+        IOError: if the audio file does not exist
+        UnsupportedAudioError: if the file is neither a supported WAV file
+            nor readable by libsndfile
+
+    """
+    if isinstance(fhandle, str):
+        if not os.path.exists(fhandle):
+            raise IOError("audio file {} does not exist".format(fhandle))
+        with open(fhandle, "rb") as opened:
+            return info(opened)
+
+    start = fhandle.tell()
+    try:
+        _, n_channels, sample_rate, _, n_frames = _wav_layout(fhandle)
+    except UnsupportedAudioError:
+        fhandle.seek(start)
+        try:
+            sound_file_info = soundfile.info(fhandle)
+        except RuntimeError as exc:
+            raise UnsupportedAudioError(str(exc))
+        n_channels = sound_file_info.channels
+        sample_rate = sound_file_info.samplerate
+        n_frames = sound_file_info.frames
+    finally:
+        fhandle.seek(start)
+
+    return {
+        "sample_rate": sample_rate,
+        "n_channels": n_channels,
+        "n_frames": n_frames,
+        "duration": n_frames / float(sample_rate),
+    }
+
+
+BACKENDS = {
+    "wav_memmap": load_wav_memmap,
+    "soundfile": load_soundfile,
+    "librosa": load_librosa,
+}
+
+# backends chosen with set_backend: None for the global setting, or a dataset name
+_SELECTED_BACKENDS = {}
+
+# caches chosen with set_cache, with the same keys as _SELECTED_BACKENDS
+_CACHES = {}
+
+# decoded-audio memo settings chosen with set_memo, with the same keys
+_MEMOS = {}
+
+
+def register_backend(name, backend):
+    """Add an audio decoding backend
+
+    Args:
+        name (str): the backend's name, used in set_backend
+        backend (function): function taking a path or file handle, a
+            ``mono`` flag and an ``offset`` and ``duration`` in seconds, and
+            returning float32 audio with shape (n_channels, n_samples), or
+            (n_samples,) if mono, and its sample rate. It should raise
+            UnsupportedAudioError for files it cannot decode, so that the
+            next backend is tried.
+
+    """
+    BACKENDS[name] = backend
+
+
+def set_backend(backends, dataset_name=None):
+    """Choose the audio decoding backends
+
+    Args:
+        backends (str, list or None): a backend name, or a list of backend
+            names tried in order. If None, resets to the default.
+        dataset_name (str or None): if given, only applies to this dataset's
+            loaders, otherwise applies to all datasets without their own
+            setting
+
+    Raises:
+        ValueError: if a backend is not registered
+
+    """
+    if backends is None:
+        _SELECTED_BACKENDS.pop(dataset_name, None)
+        return
+
+    if isinstance(backends, str):
+        backends = [backends]
+    unknown = [name for name in backends if name not in BACKENDS]
+    if unknown or not backends:
+        raise ValueError(
+            "Unknown audio backends {}, choose from {}".format(unknown, list(BACKENDS))
+        )
+    _SELECTED_BACKENDS[dataset_name] = list(backends)
+
+
+def get_backend(dataset_name=None):
+    """Get the audio decoding backends in use
+
+    Args:
+        dataset_name (str or None): the dataset's name
+
+    Returns:
+        list: backend names, tried in order
+
+    """
+    if dataset_name in _SELECTED_BACKENDS:
+        return list(_SELECTED_BACKENDS[dataset_name])
+    return list(_SELECTED_BACKENDS.get(None, DEFAULT_BACKENDS))
+
+
+class AudioCache(object):
+    """Decoded audio stored on disk, evicted least recently used first
+
+    Entries are ``.npy`` files keyed by the md5 checksum of the audio file,
+    the sample rate, the mono flag and the dtype. They are loaded with
+    ``np.load(mmap_mode="c")``, so only the samples which are used are read
+    from disk, and modifying the loaded audio does not modify the cache.
+    The cache directory can be shared by processes: each cache keeps a
+    ledger of the entries and their sizes, and only lists the directory
+    again when entries were added or removed by another process.
+
+    Args:
+        cache_dir (str): directory where the decoded audio is stored
+        max_bytes (int): maximum size of the cache in bytes. The least
+            recently used entries are deleted to make space for new ones.
+        checksums (dict or None): md5 checksums of audio files by absolute
+            path, e.g. from a dataset index. Files without a checksum are
+            hashed when they are loaded.
+
+    Raises:
+        ValueError: if max_bytes is negative
+
+    """
+
+    def __init__(self, cache_dir, max_bytes, checksums=None):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative, got {}".format(max_bytes))
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.checksums = checksums if checksums is not None else {}
+        # ledger of the entries, built by _scan: key to file name, and file
+        # name to size, least recently used first
+        self._entries = {}
+        self._sizes = None
+        self._total = 0
+        self._dir_mtime = None
+
+    def key(self, path, sr, mono):
+        """Get the cache key of decoded audio
+
+        Args:
+            path (str): path to the audio file
+            sr (int or None): sample rate of the decoded audio, or None for
+                the file's sample rate
+            mono (bool): if the decoded audio is mono
+
+        Returns:
+            str: the cache key
+
+        """
+        path = os.path.abspath(path)
+        checksum = self.checksums.get(path)
+        if checksum is None:
+            checksum = validate.md5(path)
+        return "{}_{}_{}_float32".format(
+            checksum, "native" if sr is None else int(sr), "mono" if mono else "multi"
+        )
+
+    def _dir_stat(self):
+        try:
+            return os.stat(self.cache_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _scan(self):
+        """Build the ledger from the files in cache_dir"""
+        self._dir_mtime = self._dir_stat()
+        entries = []
+        if self._dir_mtime is not None:
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".npy") or name.startswith("."):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        self._entries = {}
+        self._sizes = OrderedDict()
+        for _, size, name in sorted(entries):
+            self._entries[name[:-4].rpartition("_")[0]] = name
+            self._sizes[name] = size
+        self._total = sum(self._sizes.values())
+
+    def _refresh(self):
+        """Rescan cache_dir if entries were added or removed since the ledger
+        was built, e.g. by another process
+        """
+        if self._sizes is None or self._dir_stat() != self._dir_mtime:
+            self._scan()
+
+    def _forget(self, name):
+        self._entries.pop(name[:-4].rpartition("_")[0], None)
+        self._total -= self._sizes.pop(name, 0)
+
+    def get(self, key):
+        """Load cached audio
+
+        Args:
+            key (str): the cache key, see AudioCache.key
+
+        Returns:
+            * np.ndarray or None - the memory-mapped audio, or None if it is
+              not in the cache
+            * int or None - sample rate
+
+        """
+        if self._sizes is None:
+            self._scan()
+        for refresh in (False, True):
+            if refresh:
+                self._refresh()
+            name = self._entries.get(key)
+            if name is None:
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                y = np.load(path, mmap_mode="c")
+            except FileNotFoundError:
+                # evicted by another process
+                self._forget(name)
+                continue
+            self._sizes.move_to_end(name)
+            try:
+                # the modification time orders entries for eviction
+                os.utime(path)
+            except OSError:
+                pass
+            return y, int(name[len(key) + 1 : -4])
+        return None, None
+
+    def put(self, key, y, sample_rate):
+        """Store decoded audio, evicting the least recently used entries
+
+        Audio larger than max_bytes is not stored.
+
+        Args:
+            key (str): the cache key, see AudioCache.key
+            y (np.ndarray): the decoded audio
+            sample_rate (int): its sample rate
+
+        """
+        if y.nbytes > self.max_bytes:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._refresh()
+
+        name = "{}_{}.npy".format(key, int(sample_rate))
+        tmp_path = os.path.join(self.cache_dir, ".{}.{}".format(name, os.getpid()))
+        with open(tmp_path, "wb") as fhandle:
+            np.save(fhandle, y)
+        size = os.path.getsize(tmp_path)
+        if size > self.max_bytes:
+            os.remove(tmp_path)
+            return
+        self._forget(name)
+        self._evict(self.max_bytes - size)
+        os.replace(tmp_path, os.path.join(self.cache_dir, name))
+        self._entries[key] = name
+        self._sizes[name] = size
+        self._total += size
+        self._dir_mtime = self._dir_stat()
+
+    def _evict(self, max_bytes):
+        """Delete the least recently used entries until the cache is at most
+        max_bytes
+        """
+        while self._total > max_bytes and self._sizes:
+            name = next(iter(self._sizes))
+            self._forget(name)
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """Delete all of the cached audio"""
+        self._scan()
+        self._evict(0)
+
+
+def set_cache(cache, dataset_name=None):
+    """Cache decoded audio on disk
+
+    Args:
+        cache (AudioCache or None): the cache to use. If None, disables
+            caching.
+        dataset_name (str or None): if given, only applies to this dataset's
+            loaders, otherwise applies to all datasets without their own
+            setting
+
+    """
+    if cache is None:
+        _CACHES.pop(dataset_name, None)
+    else:
+        _CACHES[dataset_name] = cache
+
+
+def get_cache(dataset_name=None):
+    """Get the audio cache in use
+
+    Args:
+        dataset_name (str or None): the dataset's name
+
+    Returns:
+        AudioCache or None: the cache, or None if decoded audio is not cached
+
+    """
+    if dataset_name in _CACHES:
+        return _CACHES[dataset_name]
+    return _CACHES.get(None)
+
+
+def set_memo(enabled, dataset_name=None):
+    """Keep decoded audio on tracks, see mirdata.core.Track.get_decoded_audio
+
+    Args:
+        enabled (bool or None): if True, tracks keep their decoded audio in
+            memory and share it between mono and multichannel loads. If None,
+            resets to the default of the dataset's tracks.
+        dataset_name (str or None): if given, only applies to this dataset's
+            tracks, otherwise applies to all datasets without their own
+            setting
+
+    """
+    if enabled is None:
+        _MEMOS.pop(dataset_name, None)
+    else:
+        _MEMOS[dataset_name] = bool(enabled)
+
+
+def get_memo(dataset_name=None):
+    """Get the decoded-audio memo setting
+
+    Args:
+        dataset_name (str or None): the dataset's name
+
+    Returns:
+        bool or None: the setting, or None if it was not set
+
+    """
+    if dataset_name in _MEMOS:
+        return _MEMOS[dataset_name]
+    return _MEMOS.get(None)
+
+
+def _get_settings():
+    # backend, cache and memo settings, to copy them to worker processes
+    return dict(_SELECTED_BACKENDS), dict(_CACHES), dict(_MEMOS)
+
+
+def _set_settings(settings):
+    backends, caches, memos = settings
+    _SELECTED_BACKENDS.update(backends)
+    _CACHES.update(caches)
+    _MEMOS.update(memos)
+
+
+def resample(y, orig_sr, target_sr):
+    """Resample audio with soxr's high quality filter
+
+    This is the filter used by librosa.load from librosa 0.10. If soxr cannot
+    be imported, falls back to librosa.resample with its default filter,
+    which differs between librosa versions. Either way, the output is float32
+    with ``ceil(n_samples * target_sr / orig_sr)`` samples.
+
+    Args:
+        y (np.ndarray): audio with shape (n_channels, n_samples) or (n_samples,)
+        orig_sr (int): sample rate of y
+        target_sr (int): target sample rate
+
+    Returns:
+        np.ndarray: resampled audio
+
+    """
+    if orig_sr == target_sr:
+        return y
+    try:
+        y_hat = soxr.resample(y.T, orig_sr, target_sr, quality="HQ").T
+    except ImportError:
+        y_hat = librosa.resample(y, orig_sr=orig_sr, target_sr=target_sr)
+
+    n_samples = int(np.ceil(y.shape[-1] * float(target_sr) / orig_sr))
+    if y_hat.shape[-1] > n_samples:
+        y_hat = y_hat[..., :n_samples]
+    elif y_hat.shape[-1] < n_samples:
+        padding = [(0, 0)] * (y_hat.ndim - 1) + [(0, n_samples - y_hat.shape[-1])]
+        y_hat = np.pad(y_hat, padding)
+    return np.ascontiguousarray(y_hat, dtype=np.float32)
+
+
+@contextlib.contextmanager
+def window(offset=0.0, duration=None):
+    """Load a window of the audio in all calls to :func:`load` in a block
+
+    Calls which set their own offset or duration are not affected.
+
+    Example:
+        >>> with audio_utils.window(offset=10.0, duration=5.0):
+        ...     y, sr = track.audio
+
+    Args:
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
+
+    Raises:
+        ValueError: if offset or duration is negative
+
+    """
+    _check_window(offset, duration)
+    token = _WINDOW.set((offset, duration))
+    try:
+        yield
+    finally:
+        _WINDOW.reset(token)
+
+
+def get_window():
+    """Get the window set with :func:`window` for the current block
+
+    Returns:
+        * float - offset in seconds
+        * float or None - duration in seconds, None if loading until the end
+
+    """
+    return _WINDOW.get()
+
+
+def _check_window(offset, duration):
+    if offset < 0:
+        raise ValueError("offset must be non-negative, got {}".format(offset))
+    if duration is not None and duration < 0:
+        raise ValueError("duration must be non-negative, got {}".format(duration))
+
+
+def load(fhandle, sr=None, mono=True, offset=0.0, duration=None, dataset_name=None):
+    """Load audio with the selected backends, like librosa.load
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+        sr (int or None): sample rate to resample to. If None, keeps the
+            file's sample rate.
+        mono (bool): if True, average the channels
+        offset (float): start of the audio to load in seconds. Only the
+            requested window of the file is decoded.
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
+        dataset_name (str or None): the dataset loading the audio, used to
+            pick the dataset's backends and cache
+
+    Returns:
+        * np.ndarray - float32 audio with shape (n_channels, n_samples), or
+          (n_samples,) if mono or if the audio has a single channel
+        * int - sample rate
+
+    Raises:
+        IOError: if the audio file does not exist
+        UnsupportedAudioError: if none of the backends can decode the file
+        ValueError: if offset or duration is negative
+
+    """
+    if isinstance(fhandle, str) and not os.path.exists(fhandle):
+        raise IOError("audio file {} does not exist".format(fhandle))
+
+    if not offset and duration is None:
+        offset, duration = _WINDOW.get()
+    _check_window(offset, duration)
+
+    cache = get_cache(dataset_name)
+    path = fhandle if isinstance(fhandle, str) else getattr(fhandle, "name", None)
+    if cache is None or not isinstance(path, str) or not os.path.isfile(path):
+        return _decode(fhandle, sr, mono, offset, duration, dataset_name)
+
+    # the whole file is cached, and windows are read from the cached audio
+    key = cache.key(path, sr, mono)
+    y, file_sr = cache.get(key)
+    if y is None:
+        y, file_sr = _decode(fhandle, sr, mono, 0.0, None, dataset_name)
+        cache.put(key, y, file_sr)
+    if offset or duration is not None:
+        start, stop = _frame_range(y.shape[-1], file_sr, offset, duration)
+        y = y[..., start:stop]
+    return y, file_sr
+
+
+def load_channels(
+    fhandle, channels, sr=None, offset=0.0, duration=None, dataset_name=None
+):
+    """Load some of the channels of a multichannel audio file
+
+    With the ``wav_memmap`` backend, only the requested channels of the
+    interleaved WAV data are converted, through a strided view of the memory
+    map, so loading one of six channels takes a sixth of the memory. Other
+    backends, and audio read from the cache, decode all channels and select
+    the requested ones.
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+        channels (int or list): index of the channel to load, or list of
+            channel indexes
+        sr (int or None): sample rate to resample to. If None, keeps the
+            file's sample rate.
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
+        dataset_name (str or None): the dataset loading the audio, used to
+            pick the dataset's backends and cache
+
+    Returns:
+        * np.ndarray - float32 audio with shape (n_samples,) if channels is an
+          int, or (len(channels), n_samples) if it is a list
+        * int - sample rate
+
+    Raises:
+        IOError: if the audio file does not exist
+        IndexError: if a channel is not in the file
+        UnsupportedAudioError: if none of the backends can decode the file
+        ValueError: if offset or duration is negative
+
+    """
+    if isinstance(fhandle, str):
+        if not os.path.exists(fhandle):
+            raise IOError("audio file {} does not exist".format(fhandle))
+        with open(fhandle, "rb") as opened:
+            return load_channels(
+                opened, channels, sr, offset, duration, dataset_name=dataset_name
+            )
+
+    if not offset and duration is None:
+        offset, duration = _WINDOW.get()
+    _check_window(offset, duration)
+
+    y = None
+    if get_cache(dataset_name) is None and "wav_memmap" in get_backend(dataset_name):
+        start = fhandle.tell()
+        try:
+            y, file_sr = _load_wav_channels(fhandle, channels, offset, duration)
+        except UnsupportedAudioError:
+            fhandle.seek(start)
+    if y is None:
+        y, file_sr = load(
+            fhandle,
+            sr=None,
+            mono=False,
+            offset=offset,
+            duration=duration,
+            dataset_name=dataset_name,
+        )
+        if y.ndim == 1:
+            y = y[np.newaxis]
+        y = y[channels]
+
+    if sr is not None and sr != file_sr:
+        return resample(y, file_sr, sr), sr
+    return y, file_sr
+
+
+def _load_wav_channels(fhandle, channels, offset, duration):
+    """Convert the requested channels of a memory-mapped WAV file"""
+    try:
+        fhandle.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        raise UnsupportedAudioError("file handle is not backed by a file")
+
+    dtype, n_channels, sample_rate, data_offset, n_frames = _wav_layout(fhandle)
+    start, stop = _frame_range(n_frames, sample_rate, offset, duration)
+    index = np.arange(n_channels)[channels]
+    if stop <= start:
+        return np.zeros(np.shape(index) + (0,), dtype=np.float32), sample_rate
+    samples = np.memmap(
+        fhandle,
+        dtype=dtype,
+        mode="r",
+        offset=data_offset + start * n_channels * dtype.itemsize,
+        shape=(stop - start, n_channels),
+    )
+    # a strided view of one column per channel, converted one at a time
+    y = np.empty((np.size(index), stop - start), dtype=np.float32)
+    for row, channel in enumerate(np.atleast_1d(index)):
+        y[row] = samples[:, channel]
+    offset, scale = _sample_scale(dtype)
+    if offset:
+        y -= offset
+    if scale != 1.0:
+        y *= scale
+    if np.ndim(index) == 0:
+        return y[0], sample_rate
+    return y, sample_rate
+
+
+def _decode(fhandle, sr, mono, offset, duration, dataset_name):
+    start = fhandle.tell() if hasattr(fhandle, "tell") else None
+    error = None
+    for name in get_backend(dataset_name):
+        try:
+            y, file_sr = BACKENDS[name](fhandle, mono, offset, duration)
+            break
+        except UnsupportedAudioError as exc:
+            error = exc
+            if start is not None:
+                fhandle.seek(start)
+    else:
+        raise error
+
+    if sr is not None and sr != file_sr:
+        return resample(y, file_sr, sr), sr
+    return y, file_sr
+
+
+# frames decoded at a time by stream
+STREAM_CHUNK_SIZE = 65536
+
+
+def _stream_wav_memmap(fhandle, mono, chunk_size):
+    """Decode a WAV file in chunks from a memory map of its data chunk
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, a WAV file
+        mono (bool): if True, average the channels
+        chunk_size (int): number of frames per chunk
+
+    Returns:
+        * iterator - float32 chunks, as returned by load_wav_memmap
+        * int - sample rate
+
+    Raises:
+        UnsupportedAudioError: if the file is not a supported WAV file
+
+    """
+    if isinstance(fhandle, str):
+        with open(fhandle, "rb") as opened:
+            return _stream_wav_memmap(opened, mono, chunk_size)
+
+    try:
+        fhandle.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        raise UnsupportedAudioError("file handle is not backed by a file")
+
+    dtype, n_channels, sample_rate, data_offset, n_frames = _wav_layout(fhandle)
+    if n_frames == 0:
+        return iter([]), sample_rate
+    # the memory map stays valid after the file is closed
+    samples = np.memmap(
+        fhandle,
+        dtype=dtype,
+        mode="r",
+        offset=data_offset,
+        shape=(n_frames, n_channels),
+    )
+    chunks = (
+        _to_float32(samples[start : start + chunk_size], mono)
+        for start in range(0, n_frames, chunk_size)
+    )
+    return chunks, sample_rate
+
+
+def _stream_soundfile(fhandle, mono, chunk_size):
+    """Decode an audio file in chunks with soundfile
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+        mono (bool): if True, average the channels
+        chunk_size (int): number of frames per chunk
+
+    Returns:
+        * iterator - float32 chunks, as returned by load_soundfile
+        * int - sample rate
+
+    Raises:
+        UnsupportedAudioError: if libsndfile cannot read the file
+
+    """
+    try:
+        sound_file = soundfile.SoundFile(fhandle)
+    except RuntimeError as exc:
+        raise UnsupportedAudioError(str(exc))
+
+    def chunks():
+        with sound_file:
+            for samples in sound_file.blocks(
+                blocksize=chunk_size, dtype="float32", always_2d=True
+            ):
+                if mono or samples.shape[1] == 1:
+                    yield _downmix(samples)
+                else:
+                    yield samples.T
+
+    return chunks(), sound_file.samplerate
+
+
+STREAM_BACKENDS = {
+    "wav_memmap": _stream_wav_memmap,
+    "soundfile": _stream_soundfile,
+}
+
+
+def _resample_chunks(chunks, orig_sr, target_sr):
+    resampler = None
+    for chunk in chunks:
+        if resampler is None:
+            n_channels = 1 if chunk.ndim == 1 else chunk.shape[0]
+            try:
+                resampler = soxr.ResampleStream(
+                    orig_sr, target_sr, n_channels, dtype="float32", quality="HQ"
+                )
+            except ImportError:
+                yield from _resample_each_chunk(
+                    itertools.chain([chunk], chunks), orig_sr, target_sr
+                )
+                return
+        yield resampler.resample_chunk(np.ascontiguousarray(chunk.T)).T
+    if resampler is not None:
+        empty = np.zeros(chunk.T[:0].shape, dtype=np.float32)
+        yield resampler.resample_chunk(empty, last=True).T
+
+
+def _resample_each_chunk(chunks, orig_sr, target_sr):
+    """Resample chunks independently with resample, when soxr is not installed
+
+    Each chunk is trimmed so that the total length matches resampling the
+    whole signal at once. The filter state is not carried across chunks.
+    """
+    n_in = 0
+    n_out = 0
+    for chunk in chunks:
+        n_in += chunk.shape[-1]
+        n_expected = -(-n_in * target_sr // orig_sr)
+        y_hat = resample(chunk, orig_sr, target_sr)[..., : n_expected - n_out]
+        n_out += y_hat.shape[-1]
+        yield y_hat
+
+
+def stream(fhandle, block_size, hop_size=None, sr=None, mono=True, dataset_name=None):
+    """Stream audio in fixed-size, possibly overlapping, blocks
+
+    The file is decoded (and resampled) a chunk at a time, so that memory
+    use does not depend on the file's length. Backends which cannot stream
+    (e.g. librosa) decode the whole file before it is split into blocks.
+    If soxr is not installed, each chunk is resampled separately with
+    :func:`resample`, which can leave small discontinuities at chunk edges.
+
+    Example:
+        >>> for block in audio_utils.stream(path, block_size=2048, hop_size=512):
+        ...     features.append(extract(block))
+
+    Args:
+        fhandle (str or BinaryIO): path to, or file handle of, an audio file
+        block_size (int): number of samples per block
+        hop_size (int or None): number of samples between the starts of
+            consecutive blocks. Default: block_size, i.e. no overlap.
+        sr (int or None): sample rate to resample to. If None, keeps the
+            file's sample rate.
+        mono (bool): if True, average the channels
+        dataset_name (str or None): the dataset loading the audio, used to
+            pick the dataset's backends
+
+    Returns:
+        iterator: float32 blocks with shape (n_channels, block_size), or
+        (block_size,) if mono or if the audio has a single channel. The last
+        block is shorter if the audio does not fill it.
+
+    Raises:
+        IOError: if the audio file does not exist
+        UnsupportedAudioError: if none of the backends can decode the file
+        ValueError: if block_size or hop_size is not positive
+
+    """
+    if hop_size is None:
+        hop_size = block_size
+    if block_size <= 0 or hop_size <= 0:
+        raise ValueError(
+            "block_size and hop_size must be positive, got {} and {}".format(
+                block_size, hop_size
+            )
+        )
+    if isinstance(fhandle, str) and not os.path.exists(fhandle):
+        raise IOError("audio file {} does not exist".format(fhandle))
+
+    chunk_size = max(block_size, STREAM_CHUNK_SIZE)
+    start = fhandle.tell() if hasattr(fhandle, "tell") else None
+    error = None
+    for name in get_backend(dataset_name):
+        try:
+            if name in STREAM_BACKENDS:
+                chunks, file_sr = STREAM_BACKENDS[name](fhandle, mono, chunk_size)
+            else:
+                y, file_sr = BACKENDS[name](fhandle, mono, 0.0, None)
+                chunks = iter([y])
+            break
+        except UnsupportedAudioError as exc:
+            error = exc
+            if start is not None:
+                fhandle.seek(start)
+    else:
+        raise error
+
+    if sr is not None and sr != file_sr:
+        chunks = _resample_chunks(chunks, file_sr, sr)
+    return _blocks(chunks, block_size, hop_size)
+
+
+def _blocks(chunks, block_size, hop_size):
+    buffer = None
+    skip = 0  # samples between the end of the buffer and the next block
+    n_blocks = 0
+    for chunk in chunks:
+        if skip:
+            n_skipped = min(skip, chunk.shape[-1])
+            chunk = chunk[..., n_skipped:]
+            skip -= n_skipped
+        buffer = chunk if buffer is None else np.concatenate([buffer, chunk], -1)
+        while buffer.shape[-1] >= block_size:
+            yield np.array(buffer[..., :block_size])
+            n_blocks += 1
+            skip = max(hop_size - buffer.shape[-1], 0)
+            buffer = buffer[..., hop_size:]
+
+    # the last, shorter block, unless all of its samples were in the last block
+    if buffer is not None and buffer.shape[-1] > 0:
+        if n_blocks == 0 or buffer.shape[-1] > block_size - hop_size:
+            yield np.array(buffer)
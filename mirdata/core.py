@@ -1,17 +1,26 @@
 """Core mirdata classes
 """
+import concurrent.futures
+import copy
+import functools
+import importlib
 import json
 import os
 import random
+import sys
 import types
+from collections import OrderedDict, deque
+from collections.abc import Mapping
 from typing import Any
 
 import numpy as np
 
 from mirdata import download_utils
+from mirdata import index_utils
 from mirdata import validate
 
 MAX_STR_LEN = 100
+TRACK_CACHE_SIZE = 128
 DOCS_URL = "https://mirdata.readthedocs.io/en/stable/source/mirdata.html"
 DISCLAIMER = """
 ******************************************************************************************
@@ -46,6 +55,38 @@ class cached_property(object):
         return value
 
 
+class track_path(object):
+    """Track attribute which resolves the path of an index key on access
+
+    Equivalent to setting ``self.<attribute> = self.get_path(key)`` in a
+    Track's ``__init__``, without building and storing the path on every
+    Track object.
+
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def __get__(self, obj: Any, cls: type) -> Any:
+        if obj is None:
+            return self
+        return obj.get_path(self.key)
+
+
+def is_track_attribute(class_attribute):
+    """Check if a class attribute is exposed as a plain attribute on instances,
+    i.e. a ``track_path`` or a slot, rather than a property or a method
+
+    Args:
+        class_attribute (object): the attribute of the class
+
+    Returns:
+        bool: True if the attribute is a track_path or a slot
+
+    """
+    return isinstance(class_attribute, (track_path, types.MemberDescriptorType))
+
+
 def docstring_inherit(parent):
     """Decorator function to inherit docstrings from the parent class.
 
@@ -78,9 +119,202 @@ def copy_docs(original):
     return wrapper
 
 
+##### lazy imports #####
+
+
+class _LazyModule(types.ModuleType):
+    """Placeholder for a module which is imported on first attribute access"""
+
+    def __init__(self, name, install_message):
+        super().__init__(name)
+        self._install_message = install_message
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        try:
+            module = importlib.import_module(self.__name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != self.__name__ or self._install_message is None:
+                raise
+            raise ImportError(self._install_message) from exc
+        return getattr(module, attr)
+
+
+def lazy_import(name, install_message=None):
+    """Import a module the first time one of its attributes is accessed.
+
+    Used for heavy dependencies (e.g. librosa, jams, pretty_midi) which are
+    only needed to load audio or annotations, so that initializing a
+    dataset does not pay for importing them. The placeholder is not added to
+    sys.modules, so code scanning sys.modules does not trigger the import.
+
+    Args:
+        name (str): the module's name
+        install_message (str or None): message of the ImportError raised
+            when the module is used but not installed
+
+    Returns:
+        module: the module if it is already imported, otherwise a placeholder
+        forwarding attribute access to the module
+
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name, install_message)
+
+
 ##### Core Classes #####
 
 
+# Datasets unpickled in this process, least recently used first, see _load_dataset
+_LOADED_DATASETS = OrderedDict()
+LOADED_DATASETS_SIZE = 8
+
+
+def _load_dataset(dataset_class, data_home, index_path=None):
+    """Get a Dataset object shared by this process.
+
+    Used to unpickle datasets, tracks and multitracks: they are pickled as
+    the dataset's class, data_home and index path (plus the track id), and
+    all of them unpickled in the same process share one Dataset object, so
+    the index and metadata are loaded once per process. This keeps pickles
+    small enough to send tracks to process pools. At most
+    ``LOADED_DATASETS_SIZE`` datasets are kept alive for sharing, the least
+    recently used ones are dropped first.
+
+    Args:
+        dataset_class (type): the dataset's Dataset class
+        data_home (str or None): path where mirdata will look for the dataset
+        index_path (str or None): path to the dataset's index. If None, uses
+            the dataset's default index.
+
+    Returns:
+        Dataset: the shared Dataset object
+
+    """
+    key = (dataset_class, data_home, index_path)
+    if key in _LOADED_DATASETS:
+        _LOADED_DATASETS.move_to_end(key)
+        return _LOADED_DATASETS[key]
+
+    dataset = dataset_class(data_home=data_home)
+    if index_path is not None:
+        dataset.index_path = index_path
+    _LOADED_DATASETS[key] = dataset
+    while len(_LOADED_DATASETS) > LOADED_DATASETS_SIZE:
+        _LOADED_DATASETS.popitem(last=False)
+    return dataset
+
+
+def _load_track(dataset, track_id):
+    return dataset.track(track_id)
+
+
+def _load_multitrack(dataset, mtrack_id):
+    return dataset.multitrack(mtrack_id)
+
+
+def _load_track_audio(dataset, track_id, audio_property, offset, duration):
+    return dataset.track(track_id).get_audio_window(offset, duration, audio_property)
+
+
+def _init_audio_worker(audio_settings):
+    from mirdata import audio_utils
+
+    audio_utils._set_settings(audio_settings)
+
+
+class _DatasetMetadata(object):
+    """Picklable function returning a dataset's metadata, shared by its tracks"""
+
+    __slots__ = ("dataset",)
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def __call__(self):
+        return self.dataset._metadata
+
+
+class TrackCollection(Mapping):
+    """Read-only mapping of ids to Track (or MultiTrack) objects, which are
+    created when accessed instead of all at once.
+
+    At most ``cache_size`` of the created objects are kept alive by the
+    collection, the least recently used ones are dropped first. Indexing
+    with a list of ids returns a TrackCollection of those ids, sharing the
+    same cache.
+
+    Examples:
+        .. code-block:: python
+
+            tracks = dataset.load_tracks(lazy=True)
+            len(tracks)  # does not create any Track
+            track = tracks[track_id]
+            some_tracks = tracks[[track_id, other_track_id]]
+
+    """
+
+    def __init__(self, ids, load_func, cache_size=TRACK_CACHE_SIZE, _cache=None):
+        """TrackCollection init method.
+
+        Args:
+            ids (Mapping or dict): the collection's ids as keys, e.g. the "tracks"
+                section of a dataset index. Only the keys are used.
+            load_func (function): function creating the object of an id,
+                e.g. Dataset.track
+            cache_size (int): maximum number of objects kept alive by the
+                collection. 0 disables caching.
+
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self._ids = ids
+        self._load_func = load_func
+        self.cache_size = cache_size
+        self._cache = OrderedDict() if _cache is None else _cache
+
+    def __getitem__(self, key):
+        if isinstance(key, list):
+            missing = [item_id for item_id in key if item_id not in self._ids]
+            if missing:
+                raise KeyError(missing[0])
+            return TrackCollection(
+                dict.fromkeys(key), self._load_func, self.cache_size, self._cache
+            )
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        if key not in self._ids:
+            raise KeyError(key)
+
+        item = self._load_func(key)
+        if self.cache_size > 0:
+            self._cache[key] = item
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return item
+
+    def __contains__(self, key):
+        try:
+            return key in self._ids
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return "<TrackCollection of {} items, {} loaded>".format(
+            len(self), len(self._cache)
+        )
+
+
 class Dataset(object):
     """mirdata Dataset class
 
@@ -106,6 +340,7 @@ class Dataset(object):
         download_info=None,
         license_info=None,
         custom_index_path=None,
+        index_shard_key=None,
     ):
         """Dataset init method
 
@@ -119,6 +354,8 @@ class Dataset(object):
             download_info (str or None): download instructions or caveats
             license_info (str or None): license of the dataset
             custom_index_path (str or None): overwrites the default index path for remote indexes
+            index_shard_key (function or None): maps a track id to the name of its index
+                shard (e.g. a split), so that shards can be loaded without scanning the index
 
         """
         self.name = name
@@ -139,14 +376,27 @@ class Dataset(object):
         self.remotes = remotes
         self._download_info = download_info
         self._license_info = license_info
+        self._index_shard_key = index_shard_key
         self.readme = "{}#module-mirdata.datasets.{}".format(DOCS_URL, self.name)
 
         # this is a hack to be able to have dataset-specific docstrings
-        self.track = lambda track_id: self._track(track_id)
+        self.track = functools.partial(self._track)
         self.track.__doc__ = self._track_class.__doc__  # set the docstring
-        self.multitrack = lambda mtrack_id: self._multitrack(mtrack_id)
+        self.multitrack = functools.partial(self._multitrack)
         self.multitrack.__doc__ = self._multitrack_class.__doc__  # set the docstring
 
+    def __reduce__(self):
+        # pickled as its class, data_home and index path, see _load_dataset
+        return (_load_dataset, (self.__class__, self.data_home, self.index_path))
+
+    def __deepcopy__(self, memo):
+        # unlike unpickling, which shares one Dataset per process, deepcopy
+        # returns an independent copy, including the loaded index and metadata
+        dataset = self.__class__.__new__(self.__class__)
+        memo[id(self)] = dataset
+        dataset.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return dataset
+
     def __repr__(self):
         repr_string = "The {} dataset\n".format(self.name)
         repr_string += "-" * MAX_STR_LEN
@@ -167,6 +417,28 @@ class Dataset(object):
 
     @cached_property
     def _index(self):
+        # prefer the compiled index if it exists and is up to date,
+        # then the index cache in data_home
+        compiled_path = index_utils.compiled_index_path(self.index_path)
+        if index_utils.is_compiled_index_current(compiled_path, self.index_path):
+            return index_utils.load_compiled_index(compiled_path)
+
+        if index_utils.is_compiled_index_current(
+            self._index_cache_path, self.index_path
+        ):
+            return index_utils.load_compiled_index(self._index_cache_path)
+
+        index = self._load_json_index()
+        if os.path.isdir(self.data_home):
+            index_utils.write_index_cache(
+                index,
+                self._index_cache_path,
+                self.index_path,
+                shard_key=self._index_shard_key,
+            )
+        return index
+
+    def _load_json_index(self):
         if self.remote_index and not os.path.exists(self.index_path):
             raise FileNotFoundError(
                 "This dataset's index is not available locally. You may need to first run .download()"
@@ -175,10 +447,71 @@ class Dataset(object):
             index = json.load(fhandle)
         return index
 
+    @property
+    def _index_cache_path(self):
+        return index_utils.index_cache_path(self.data_home, self.index_path)
+
+    def clear_index_cache(self):
+        """Delete this dataset's cached index from data_home, if it exists"""
+        if os.path.exists(self._index_cache_path):
+            os.remove(self._index_cache_path)
+
+    def rebuild_index_cache(self):
+        """Parse this dataset's json index and rewrite its cache in data_home
+
+        The index cache is created automatically the first time the index is
+        loaded, and is reused by other processes as long as the json index
+        does not change.
+
+        Returns:
+            str: path to the cached index
+
+        Raises:
+            OSError: if the cache could not be written
+
+        """
+        index = self._load_json_index()
+        os.makedirs(os.path.dirname(self._index_cache_path), exist_ok=True)
+        index_utils.write_compiled_index(
+            index,
+            self._index_cache_path,
+            source=index_utils.source_stat(self.index_path),
+            shard_key=self._index_shard_key,
+        )
+        return self._index_cache_path
+
+    @cached_property
+    def _index_shards(self):
+        """Index tracks grouped by shard
+
+        Returns:
+            dict: {`shard name`: {`track_id`: track data}}
+
+        """
+        if self._index_shard_key is None:
+            raise AttributeError("This dataset's index is not sharded")
+
+        if isinstance(self._index, index_utils.CompiledIndex):
+            shards = self._index["tracks"].shards
+            if shards:
+                return shards
+
+        shards = {}
+        for track_id, track_data in self._index["tracks"].items():
+            shards.setdefault(self._index_shard_key(track_id), {})[
+                track_id
+            ] = track_data
+        return shards
+
     @cached_property
     def _metadata(self):
         return None
 
+    @cached_property
+    def _metadata_getter(self):
+        # shared by all of the dataset's tracks, instead of one closure per track
+        return _DatasetMetadata(self)
+
     @property
     def default_path(self):
         """Get the default path for the dataset
@@ -193,7 +526,7 @@ class Dataset(object):
     def _track(self, track_id):
         """Load a track by track_id.
 
-        Hidden helper function that gets called as a lambda.
+        Hidden helper function that gets called by Dataset.track.
 
         Args:
             track_id (str): track id of the track
@@ -210,13 +543,13 @@ class Dataset(object):
                 self.data_home,
                 self.name,
                 self._index,
-                lambda: self._metadata,
+                self._metadata_getter,
             )
 
     def _multitrack(self, mtrack_id):
         """Load a multitrack by mtrack_id.
 
-        Hidden helper function that gets called as a lambda.
+        Hidden helper function that gets called by Dataset.multitrack.
 
         Args:
             mtrack_id (str): mtrack id of the multitrack
@@ -234,35 +567,281 @@ class Dataset(object):
                 self.name,
                 self._index,
                 self._track_class,
-                lambda: self._metadata,
+                self._metadata_getter,
             )
 
-    def load_tracks(self):
+    def load_tracks(self, lazy=False, cache_size=TRACK_CACHE_SIZE):
         """Load all tracks in the dataset
 
+        Args:
+            lazy (bool): If True, return a TrackCollection which creates tracks
+                when they are accessed, instead of a dictionary of all tracks
+            cache_size (int): If lazy, the maximum number of tracks kept alive
+                by the TrackCollection
+
         Returns:
-            dict:
+            dict or TrackCollection:
                 {`track_id`: track data}
 
         Raises:
-            NotImplementedError: If the dataset does not support Tracks
+            AttributeError: If the dataset does not have tracks
 
         """
+        if lazy:
+            if self._track_class is None or "tracks" not in self._index:
+                raise AttributeError("This dataset does not have tracks")
+            return TrackCollection(self._index["tracks"], self.track, cache_size)
         return {track_id: self.track(track_id) for track_id in self.track_ids}
 
-    def load_multitracks(self):
+    def load_multitracks(self, lazy=False, cache_size=TRACK_CACHE_SIZE):
         """Load all multitracks in the dataset
 
+        Args:
+            lazy (bool): If True, return a TrackCollection which creates multitracks
+                when they are accessed, instead of a dictionary of all multitracks
+            cache_size (int): If lazy, the maximum number of multitracks kept
+                alive by the TrackCollection
+
         Returns:
-            dict:
+            dict or TrackCollection:
                 {`mtrack_id`: multitrack data}
 
         Raises:
-            NotImplementedError: If the dataset does not support Multitracks
+            AttributeError: If the dataset does not have multitracks
 
         """
+        if lazy:
+            if self._multitrack_class is None or "multitracks" not in self._index:
+                raise AttributeError("This dataset does not have multitracks")
+            return TrackCollection(
+                self._index["multitracks"], self.multitrack, cache_size
+            )
         return {mtrack_id: self.multitrack(mtrack_id) for mtrack_id in self.mtrack_ids}
 
+    def set_audio_backend(self, backends):
+        """Choose the audio decoding backends used by this dataset's loaders
+
+        See mirdata.audio_utils for the available backends.
+
+        Args:
+            backends (str, list or None): a backend name, or a list of backend
+                names tried in order. If None, uses the global setting.
+
+        """
+        from mirdata import audio_utils
+
+        audio_utils.set_backend(backends, dataset_name=self.name)
+
+    def set_audio_cache(self, max_bytes, cache_dir=None):
+        """Cache this dataset's decoded audio on disk
+
+        Decoded audio is stored as .npy files, keyed by the audio file's md5
+        checksum in the index, the sample rate and the number of channels,
+        and is memory-mapped instead of decoded when it is loaded again.
+        The least recently used audio is deleted when the cache is full.
+
+        Args:
+            max_bytes (int or None): maximum size of the cache in bytes.
+                If None, disables the cache.
+            cache_dir (str or None): directory where the decoded audio is
+                stored. Default: ``data_home/.mirdata_cache/audio``
+
+        """
+        from mirdata import audio_utils
+
+        if max_bytes is None:
+            audio_utils.set_cache(None, dataset_name=self.name)
+            return
+
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                self.data_home, index_utils.INDEX_CACHE_DIR, "audio"
+            )
+        audio_utils.set_cache(
+            audio_utils.AudioCache(cache_dir, max_bytes, self._file_checksums),
+            dataset_name=self.name,
+        )
+
+    def set_audio_memo(self, enabled):
+        """Keep decoded audio in memory on this dataset's tracks
+
+        When enabled, a track decodes each audio file once per window and
+        shares it between its audio properties, e.g. a mono property is
+        downmixed from the stereo decode. The audio is kept as long as the
+        track object.
+
+        Args:
+            enabled (bool or None): if True, keeps decoded audio. If None,
+                uses the global setting, or the dataset's default.
+
+        """
+        from mirdata import audio_utils
+
+        audio_utils.set_memo(enabled, dataset_name=self.name)
+
+    def set_annotation_store(self, enabled, store_dir=None):
+        """Store this dataset's loaded annotations on disk
+
+        Annotations loaded with Track.get_annotation are saved as .npz files,
+        keyed by the annotation file's md5 checksum in the index and by the
+        loader, and are memory-mapped instead of parsed when they are loaded
+        again, also by other processes and in later sessions.
+
+        Args:
+            enabled (bool or None): if True, stores annotations. If False,
+                disables the store for this dataset. If None, uses the
+                global setting.
+            store_dir (str or None): directory where the annotations are
+                stored. Default: ``data_home/.mirdata_cache/annotations``
+
+        """
+        from mirdata import annotation_store
+
+        if enabled is None:
+            annotation_store.set_store(None, dataset_name=self.name)
+            return
+
+        if store_dir is None:
+            store_dir = os.path.join(
+                self.data_home, index_utils.INDEX_CACHE_DIR, "annotations"
+            )
+        annotation_store.set_store(
+            annotation_store.AnnotationStore(store_dir) if enabled else False,
+            dataset_name=self.name,
+        )
+
+    @cached_property
+    def _file_checksums(self):
+        # md5 checksums of the files in the index, by absolute path
+        data_home = os.path.abspath(self.data_home)
+        checksums = {}
+        for section in ("tracks", "multitracks"):
+            for files in self._index.get(section, {}).values():
+                for key, value in files.items():
+                    if key != "tracks" and value[0] is not None:
+                        path = os.path.normpath(os.path.join(data_home, value[0]))
+                        checksums[path] = value[1]
+        return checksums
+
+    def load_audio_batch(
+        self,
+        track_ids=None,
+        audio_property="audio",
+        n_workers=None,
+        executor="thread",
+        ordered=True,
+        offset=0.0,
+        duration=None,
+    ):
+        """Load the audio of many tracks concurrently
+
+        Audio is decoded by a pool of workers, a few tracks ahead of the ones
+        which have been consumed. A track which fails to load is reported
+        with its error, and does not stop the batch.
+
+        Examples:
+            .. code-block:: python
+
+                for track_id, audio, error in dataset.load_audio_batch(
+                    n_workers=8, executor="process", ordered=False
+                ):
+                    if error is None:
+                        y, sr = audio
+
+        Args:
+            track_ids (list or None): ids of the tracks to load. Default: all
+                of the dataset's tracks.
+            audio_property (str): name of the tracks' audio property,
+                e.g. ``"audio"`` or ``"audio_mono"``
+            n_workers (int or None): number of workers. Default: the number
+                of CPUs.
+            executor (str): ``"thread"`` or ``"process"``. Processes decode
+                in parallel regardless of the GIL, but send the audio back to
+                the main process.
+            ordered (bool): if True, yields tracks in the order of
+                track_ids, otherwise as soon as they are loaded
+            offset (float): start of the audio to load in seconds
+            duration (float or None): length of the audio to load in seconds.
+                If None, loads until the end of the files.
+
+        Yields:
+            * str - track id
+            * tuple or None - the audio property's value, usually
+              (audio signal, sample rate), or None if loading failed
+            * Exception or None - the error raised while loading the track
+
+        Raises:
+            ValueError: if executor is not "thread" or "process"
+
+        """
+        from mirdata import audio_utils
+
+        if track_ids is None:
+            track_ids = self.track_ids
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        if executor == "thread":
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=n_workers)
+        elif executor == "process":
+            # backend and cache settings are per process
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_audio_worker,
+                initargs=(audio_utils._get_settings(),),
+            )
+        else:
+            raise ValueError(
+                "executor must be 'thread' or 'process', got {}".format(executor)
+            )
+
+        track_ids = iter(track_ids)
+        pending = deque()
+
+        def submit():
+            for track_id in track_ids:
+                future = pool.submit(
+                    _load_track_audio,
+                    self,
+                    track_id,
+                    audio_property,
+                    offset,
+                    duration,
+                )
+                pending.append((track_id, future))
+                # bound the decoded audio waiting to be consumed
+                if len(pending) >= 2 * n_workers:
+                    break
+
+        try:
+            submit()
+            while pending:
+                if ordered:
+                    track_id, future = pending.popleft()
+                    concurrent.futures.wait([future])
+                else:
+                    concurrent.futures.wait(
+                        [future for _, future in pending],
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    track_id, future = next(
+                        (track_id, future)
+                        for track_id, future in pending
+                        if future.done()
+                    )
+                    pending.remove((track_id, future))
+
+                error = future.exception()
+                if error is None:
+                    yield track_id, future.result(), None
+                else:
+                    yield track_id, None, error
+                submit()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown()
+
     def choice_track(self):
         """Choose a random track
 
@@ -363,6 +942,41 @@ class Dataset(object):
         return missing_files, invalid_checksums
 
 
+def _get_audio_info(entry, path):
+    """Get the audio information of an index entry, reading the file's
+    header if the index does not record it
+    """
+    if path is None:
+        return None
+    if len(entry) > 2 and entry[2] is not None:
+        return dict(entry[2])
+    from mirdata import audio_utils
+
+    return audio_utils.info(path)
+
+
+def _get_annotation(entry, path, loader, dataset_name):
+    """Load an annotation file with a loader, through the annotation store
+    if one is set
+    """
+    from mirdata import annotation_store, annotations
+
+    store = annotation_store.get_store(dataset_name)
+    if not store or path is None or entry[1] is None:
+        return loader(path)
+
+    key = store.key(entry[1], loader)
+    if key is None:
+        return loader(path)
+
+    annotation = store.get(key)
+    if annotation is None:
+        annotation = loader(path)
+        if isinstance(annotation, annotations.Annotation):
+            store.put(key, annotation)
+    return annotation
+
+
 class Track(object):
     """Track base class
 
@@ -370,6 +984,21 @@ class Track(object):
 
     """
 
+    # tracks are lightweight handles on the index: the boilerplate attributes
+    # live in slots, paths are resolved on access (see track_path) and the
+    # instance __dict__ is only created for cached properties
+    __slots__ = (
+        "track_id",
+        "_dataset_name",
+        "_data_home",
+        "_track_paths",
+        "_metadata",
+        "__dict__",
+    )
+
+    # default of the decoded-audio memo, see get_decoded_audio
+    _memo_audio = False
+
     def __init__(
         self,
         track_id,
@@ -394,7 +1023,10 @@ class Track(object):
             metadata (function or None): a function returning a dictionary of metadata or None
 
         """
-        if track_id not in index["tracks"]:
+        try:
+            # rows of a compiled index are decoded when their keys are accessed
+            track_paths = index_utils.index_row(index["tracks"], track_id)
+        except KeyError:
             raise ValueError(
                 "{} is not a valid track_id in {}".format(track_id, dataset_name)
             )
@@ -403,9 +1035,30 @@ class Track(object):
         self._dataset_name = dataset_name
 
         self._data_home = data_home
-        self._track_paths = index["tracks"][track_id]
+        self._track_paths = track_paths
         self._metadata = metadata
 
+    def __reduce_ex__(self, protocol):
+        # tracks of a dataset are pickled as the dataset and the track id
+        if isinstance(self._metadata, _DatasetMetadata):
+            return (_load_track, (self._metadata.dataset, self.track_id))
+        return super().__reduce_ex__(protocol)
+
+    def __deepcopy__(self, memo):
+        # tracks of a dataset are handles on its index: the copy shares the
+        # dataset, unless the dataset is being copied too
+        if isinstance(self._metadata, _DatasetMetadata):
+            load_func, (dataset, item_id) = self.__reduce_ex__(2)
+            return load_func(memo.get(id(dataset), dataset), item_id)
+
+        track = self.__class__.__new__(self.__class__)
+        memo[id(self)] = track
+        for name in Track.__slots__:
+            if name != "__dict__":
+                setattr(track, name, copy.deepcopy(getattr(self, name), memo))
+        track.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return track
+
     @property
     def _track_metadata(self):
         metadata = self._metadata()
@@ -416,9 +1069,16 @@ class Track(object):
         raise AttributeError("This Track does not have metadata.")
 
     def __repr__(self):
-        properties = [v for v in dir(self.__class__) if not v.startswith("_")]
+        properties = [
+            v
+            for v in dir(self.__class__)
+            if not v.startswith("_")
+            and not is_track_attribute(getattr(self.__class__, v))
+        ]
         attributes = [
-            v for v in dir(self) if not v.startswith("_") and v not in properties
+            v
+            for v in dir(self)
+            if not v.startswith("_") and v not in properties and hasattr(self, v)
         ]
 
         repr_str = "Track(\n"
@@ -466,6 +1126,156 @@ class Track(object):
         else:
             return os.path.join(self._data_home, self._track_paths[key][0])
 
+    def get_audio_info(self, key="audio"):
+        """Get the sample rate, number of channels and length of an audio file
+        of the track, without decoding it
+
+        Uses the information recorded in the dataset index if available, and
+        otherwise reads it from the file's header.
+
+        Args:
+            key (string): Index key of the audio file, e.g. ``"audio"``
+
+        Returns:
+            dict or None: with keys ``sample_rate`` (int), ``n_channels`` (int),
+            ``n_frames`` (int) and ``duration`` (float, in seconds).
+            None if the path in the index is None.
+
+        """
+        return _get_audio_info(self._track_paths[key], self.get_path(key))
+
+    def get_annotation(self, key, loader):
+        """Load an annotation file of the track
+
+        When an annotation store is set (see Dataset.set_annotation_store),
+        the annotation is parsed once and memory-mapped from the store on
+        later loads.
+
+        Args:
+            key (string): Index key of the annotation file
+            loader (function): function parsing the file, given its path
+
+        Returns:
+            the loader's output
+
+        """
+        return _get_annotation(
+            self._track_paths[key], self.get_path(key), loader, self._dataset_name
+        )
+
+    def _audio_memo_enabled(self):
+        from mirdata import audio_utils
+
+        enabled = audio_utils.get_memo(self._dataset_name)
+        return self._memo_audio if enabled is None else enabled
+
+    def get_decoded_audio(self, key="audio", mono=True, sr=None):
+        """Decode the audio file of an index key
+
+        When the decoded-audio memo is on (see Dataset.set_audio_memo), the
+        file is decoded once with all of its channels and kept on the track
+        for the current window; mono loads are downmixed from it. Memoized
+        audio is read-only.
+
+        Args:
+            key (string): Index key of the audio file, e.g. ``"audio"``
+            mono (bool): if True, average the channels
+            sr (int or None): sample rate to resample to. If None, keeps the
+                file's sample rate.
+
+        Returns:
+            * np.ndarray - audio signal
+            * float - sample rate
+
+            or None if the path in the index is None
+
+        """
+        from mirdata import audio_utils
+
+        path = self.get_path(key)
+        if path is None:
+            return None
+        if not self._audio_memo_enabled():
+            return audio_utils.load(
+                path, sr=sr, mono=mono, dataset_name=self._dataset_name
+            )
+
+        window = audio_utils.get_window()
+        memo = self.__dict__.setdefault("_audio_memo", {})
+        entry = memo.get((key, sr))
+        if entry is None or entry[0] != window:
+            y, y_sr = audio_utils.load(
+                path, sr=sr, mono=False, dataset_name=self._dataset_name
+            )
+            y.setflags(write=False)
+            entry = (window, y, y_sr)
+            memo[(key, sr)] = entry
+        _, y, y_sr = entry
+        if mono:
+            y = audio_utils.downmix(y)
+        return y, y_sr
+
+    def get_audio_window(self, offset=0.0, duration=None, audio_property="audio"):
+        """Get a window of the track's audio, decoding only that part of the file
+
+        Args:
+            offset (float): start of the audio to load in seconds
+            duration (float or None): length of the audio to load in seconds.
+                If None, loads until the end of the file.
+            audio_property (str): name of the audio property to load,
+                e.g. ``"audio"`` or ``"audio_mono"``
+
+        Returns:
+            the audio property's value for the window, usually
+            * np.ndarray - audio signal
+            * float - sample rate
+
+        """
+        from mirdata import audio_utils
+
+        with audio_utils.window(offset, duration):
+            return getattr(self, audio_property)
+
+    def audio_blocks(
+        self, block_size, hop_size=None, sr=None, mono=True, path_attribute="audio_path"
+    ):
+        """Stream the track's audio file in fixed-size blocks, in constant memory
+
+        The file is decoded as is, without the processing of the dataset's
+        audio loaders (e.g. selecting channels). See mirdata.audio_utils.stream.
+
+        Args:
+            block_size (int): number of samples per block
+            hop_size (int or None): number of samples between the starts of
+                consecutive blocks. Default: block_size, i.e. no overlap.
+            sr (int or None): sample rate to resample to. If None, keeps the
+                file's sample rate.
+            mono (bool): if True, average the channels
+            path_attribute (str): name of the attribute holding the path of
+                the audio file, e.g. ``"audio_path"`` or ``"audio_path_stereo"``
+
+        Returns:
+            iterator: float32 blocks with shape (n_channels, block_size), or
+            (block_size,) if mono. The last block may be shorter.
+
+        Raises:
+            IOError: if the track does not have this audio file
+
+        """
+        from mirdata import audio_utils
+
+        path = getattr(self, path_attribute)
+        if path is None:
+            raise IOError("{} has no {}".format(self.track_id, path_attribute))
+        return audio_utils.stream(
+            path,
+            block_size,
+            hop_size=hop_size,
+            sr=sr,
+            mono=mono,
+            dataset_name=self._dataset_name,
+        )
+
 
 class MultiTrack(Track):
     """MultiTrack class.
@@ -502,7 +1312,9 @@ class MultiTrack(Track):
             metadata (function or None): a function returning a dictionary of metadata or None
 
         """
-        if mtrack_id not in index["multitracks"]:
+        try:
+            multitrack_paths = index_utils.index_row(index["multitracks"], mtrack_id)
+        except KeyError:
             raise ValueError(
                 "{} is not a valid mtrack_id in {}".format(mtrack_id, dataset_name)
             )
@@ -511,15 +1323,22 @@ class MultiTrack(Track):
         self._dataset_name = dataset_name
 
         self._data_home = data_home
-        self._multitrack_paths = index["multitracks"][self.mtrack_id]
+        self._multitrack_paths = multitrack_paths
         self._metadata = metadata
         self._track_class = track_class
 
         self._index = index
-        self.track_ids = self._index["multitracks"][self.mtrack_id]["tracks"]
+        self.track_ids = self._multitrack_paths["tracks"]
 
-    @property
+    def __reduce_ex__(self, protocol):
+        # multitracks of a dataset are pickled as the dataset and the mtrack id
+        if isinstance(self._metadata, _DatasetMetadata):
+            return (_load_multitrack, (self._metadata.dataset, self.mtrack_id))
+        return super().__reduce_ex__(protocol)
+
+    @cached_property
     def tracks(self):
+        # created once, so that cached properties of the tracks are kept
         return {
             t: self._track_class(
                 t, self._data_home, self._dataset_name, self._index, self._metadata
@@ -556,6 +1375,46 @@ class MultiTrack(Track):
         else:
             return os.path.join(self._data_home, self._multitrack_paths[key][0])
 
+    def get_audio_info(self, key="audio"):
+        """Get the sample rate, number of channels and length of an audio file
+        of the multitrack, without decoding it
+
+        Uses the information recorded in the dataset index if available, and
+        otherwise reads it from the file's header.
+
+        Args:
+            key (string): Index key of the audio file, e.g. ``"audio"``
+
+        Returns:
+            dict or None: with keys ``sample_rate`` (int), ``n_channels`` (int),
+            ``n_frames`` (int) and ``duration`` (float, in seconds).
+            None if the path in the index is None.
+
+        """
+        return _get_audio_info(self._multitrack_paths[key], self.get_path(key))
+
+    def get_annotation(self, key, loader):
+        """Load an annotation file of the multitrack
+
+        When an annotation store is set (see Dataset.set_annotation_store),
+        the annotation is parsed once and memory-mapped from the store on
+        later loads.
+
+        Args:
+            key (string): Index key of the annotation file
+            loader (function): function parsing the file, given its path
+
+        Returns:
+            the loader's output
+
+        """
+        return _get_annotation(
+            self._multitrack_paths[key],
+            self.get_path(key),
+            loader,
+            self._dataset_name,
+        )
+
     def get_target(self, track_keys, weights=None, average=True, enforce_length=True):
         """Get target which is a linear mixture of tracks
 
@@ -569,54 +1428,75 @@ class MultiTrack(Track):
                 of the longest track
 
         Returns:
-            np.ndarray: target audio with shape (n_channels, n_samples)
+            np.ndarray: float32 target audio with shape (n_channels, n_samples)
 
         Raises:
             ValueError:
                 if sample rates of the tracks are not equal
+                if the tracks do not have the same number of channels
                 if enforce_length=True and lengths are not equal
 
         """
-        signals = []
+        if len(track_keys) == 0:
+            raise ValueError("track_keys is empty, there are no tracks to mix")
+
+        if weights is None:
+            weights = np.ones((len(track_keys),))
+        weights = np.asarray(weights, dtype=float)
+        if len(weights) != len(track_keys):
+            raise ValueError(
+                "{} weights were given for {} tracks".format(
+                    len(weights), len(track_keys)
+                )
+            )
+        if average and np.sum(weights) == 0:
+            raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+
+        # stems are decoded one at a time and accumulated in place into a
+        # single float32 buffer, instead of stacking all of them
+        target = None
         lengths = []
         sample_rates = []
-        for k in track_keys:
+        for k, weight in zip(track_keys, weights):
             audio, sample_rate = getattr(self.tracks[k], self.track_audio_property)
             # ensure all signals are shape (n_channels, n_samples)
             if len(audio.shape) == 1:
                 audio = audio[np.newaxis, :]
-            signals.append(audio)
             lengths.append(audio.shape[1])
             sample_rates.append(sample_rate)
 
-        if len(set(sample_rates)) > 1:
-            raise ValueError(
-                "Sample rates for tracks {} are not equal: {}".format(
-                    track_keys, sample_rates
+            if len(set(sample_rates)) > 1:
+                raise ValueError(
+                    "Sample rates for tracks {} are not equal: {}".format(
+                        track_keys, sample_rates
+                    )
                 )
-            )
 
-        max_length = np.max(lengths)
-        if any([l != max_length for l in lengths]):
-            if enforce_length:
+            if target is None:
+                target = np.zeros(audio.shape, dtype=np.float32)
+            elif audio.shape[0] != target.shape[0]:
                 raise ValueError(
-                    "Track's {} audio are not the same length {}. Use enforce_length=False to pad with zeros.".format(
-                        track_keys, lengths
+                    "Tracks {} do not have the same number of channels".format(
+                        track_keys
                     )
                 )
-            else:
-                # pad signals to the max length
-                signals = [
-                    np.pad(signal, ((0, 0), (0, max_length - signal.shape[1])))
-                    for signal in signals
-                ]
+            elif audio.shape[1] != target.shape[1]:
+                if enforce_length:
+                    raise ValueError(
+                        "Track's {} audio are not the same length {}. Use enforce_length=False to pad with zeros.".format(
+                            track_keys, lengths
+                        )
+                    )
+                if audio.shape[1] > target.shape[1]:
+                    # pad the mix to the longest track
+                    target = np.pad(
+                        target, ((0, 0), (0, audio.shape[1] - target.shape[1]))
+                    )
 
-        if weights is None:
-            weights = np.ones((len(track_keys),))
+            target[:, : audio.shape[1]] += np.float32(weight) * audio
 
-        target = np.average(signals, axis=0, weights=weights)
-        if not average:
-            target *= np.sum(weights)
+        if average:
+            target /= np.sum(weights)
 
         return target
 
@@ -39,13 +39,19 @@
 
 """
 
+import collections.abc
+import itertools
 import json
+import re
+import types
 
 from mirdata import download_utils, core, io
 from mirdata import jams_utils
 
 
 NAME = "acousticbrainz_genre"
+SPLITS = ["train", "validation"]
+SHARD_SEARCH_KEY = re.compile(r"([^#]*)#({})#".format("|".join(SPLITS)))
 
 BIBTEX = """
 @inproceedings{bogdanov2019acousticbrainz,
@@ -173,6 +179,8 @@ class Track(core.Track):
 
     """
 
+    path = core.track_path("data")
+
     def __init__(
         self,
         track_id,
@@ -189,11 +197,11 @@ class Track(core.Track):
             metadata,
         )
 
-        self.path = self.get_path("data")
-        self.genre = [genre for genre in self.track_id.split("#")[4:] if genre != ""]
-        self.mbid = self.track_id.split("#")[2]
-        self.mbid_group = self.track_id.split("#")[3]
-        self.split = self.track_id.split("#")[1]
+        fields = self.track_id.split("#")
+        self.genre = [genre for genre in fields[4:] if genre != ""]
+        self.mbid = fields[2]
+        self.mbid_group = fields[3]
+        self.split = fields[1]
 
     # Metadata
     @property
@@ -382,6 +390,44 @@ def load_extractor(fhandle):
     return json.load(fhandle)
 
 
+def index_shard(track_id):
+    """Get the index shard of a track, i.e. its source and split
+
+    Args:
+        track_id (str): track id of the track
+
+    Returns:
+        str: the track's shard, e.g. `tagtraum#train`
+
+    """
+    return "#".join(track_id.split("#", 2)[:2])
+
+
+class _ShardsView(collections.abc.Mapping):
+    """Read-only view of several index shards
+
+    Shards have no track ids in common, so the view is not merged.
+    """
+
+    def __init__(self, shards):
+        self._shards = shards
+
+    def __getitem__(self, track_id):
+        for shard in self._shards:
+            if track_id in shard:
+                return shard[track_id]
+        raise KeyError(track_id)
+
+    def __contains__(self, track_id):
+        return any(track_id in shard for shard in self._shards)
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._shards)
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+
 @core.docstring_inherit(core.Dataset)
 class Dataset(core.Dataset):
     """
@@ -397,15 +443,111 @@ class Dataset(core.Dataset):
             remotes=REMOTES,
             license_info=LICENSE_INFO,
             custom_index_path="acousticbrainz_genre_index.json",
+            index_shard_key=index_shard,
         )
 
     @core.copy_docs(load_extractor)
     def load_extractor(self, *args, **kwargs):
         return load_extractor(*args, **kwargs)
 
+    @core.cached_property
+    def _inverted_index(self):
+        """Track ids indexed by each of the fields of the track id
+
+        Returns:
+            dict: {`field`: {`value`: set of track ids}}, for the fields
+            source, split, mbid, mbid_group and genre
+
+        """
+        inverted_index = {
+            "source": {},
+            "split": {},
+            "mbid": {},
+            "mbid_group": {},
+            "genre": {},
+        }
+        for track_id in self.track_ids:
+            fields = track_id.split("#")
+            inverted_index["source"].setdefault(fields[0], set()).add(track_id)
+            inverted_index["split"].setdefault(fields[1], set()).add(track_id)
+            inverted_index["mbid"].setdefault(fields[2], set()).add(track_id)
+            inverted_index["mbid_group"].setdefault(fields[3], set()).add(track_id)
+            for genre in fields[4:]:
+                if genre != "":
+                    inverted_index["genre"].setdefault(genre, set()).add(track_id)
+        return inverted_index
+
+    def query_track_ids(
+        self, source=None, split=None, genre=None, mbid=None, mbid_group=None
+    ):
+        """Get the ids of the tracks matching all of the given fields.
+
+        Example:
+            .. code-block:: python
+
+                # all rock tracks in the lastfm training set
+                dataset.query_track_ids(source="lastfm", split="train", genre="rock")
+
+        Args:
+            source (str or None): the genre annotation source, e.g. `lastfm`
+            split (str or None): `train` or `validation`
+            genre (str or None): a genre or subgenre, e.g. `rock` or `rock---folk rock`
+            mbid (str or None): musicbrainz id
+            mbid_group (str or None): musicbrainz id group
+
+        Returns:
+            list: sorted list of matching track ids
+
+        """
+        query = {
+            "source": source,
+            "split": split,
+            "genre": genre,
+            "mbid": mbid,
+            "mbid_group": mbid_group,
+        }
+        matches = [
+            self._inverted_index[field].get(value, set())
+            for field, value in query.items()
+            if value is not None
+        ]
+        if not matches:
+            return sorted(self.track_ids)
+
+        matches.sort(key=len)
+        return sorted(matches[0].intersection(*matches[1:]))
+
+    def _search_shards(self, search_key):
+        """Get the index shards matching a search key
+
+        Args:
+            search_key (str): the search key
+
+        Returns:
+            list or None: the matching shards, or None if search_key is not of
+            the form `source#split#` or `#split#` for a source in the index
+
+        """
+        match = SHARD_SEARCH_KEY.fullmatch(search_key)
+        if match is None:
+            return None
+        source, split = match.groups()
+        shards = self._index_shards
+        if source != "":
+            shard = "{}#{}".format(source, split)
+            return [shards[shard]] if shard in shards else None
+        return [
+            shard_data
+            for shard, shard_data in shards.items()
+            if shard.partition("#")[2] == split
+        ]
+
     def filter_index(self, search_key):
         """Load from AcousticBrainz genre dataset the indexes that match with search_key.
 
+        Search keys of the form `source#split#` or `#split#` (e.g. `tagtraum#train#`)
+        only copy the matching index shards, without scanning the index.
+
         Args:
             search_key (str): regex to match with folds, mbid or genres
 
@@ -413,12 +555,36 @@ class Dataset(core.Dataset):
              dict: {`track_id`: track data}
 
         """
+        shards = self._search_shards(search_key)
+        if shards is not None:
+            return {k: v for shard in shards for k, v in shard.items()}
 
         acousticbrainz_genre_data = {
             k: v for k, v in self._index["tracks"].items() if search_key in k
         }
         return acousticbrainz_genre_data
 
+    def filter_index_view(self, search_key):
+        """Get a read-only view of the indexes that match with search_key.
+
+        Like filter_index, but search keys of the form `source#split#` or
+        `#split#` return a view of the matching index shards, without copying
+        them. Other search keys scan the index.
+
+        Args:
+            search_key (str): regex to match with folds, mbid or genres
+
+        Returns:
+             Mapping: read-only {`track_id`: track data}
+
+        """
+        shards = self._search_shards(search_key)
+        if shards is None:
+            return types.MappingProxyType(self.filter_index(search_key))
+        if len(shards) == 1:
+            return types.MappingProxyType(shards[0])
+        return _ShardsView(shards)
+
     def load_all_train(self):
         """Load from AcousticBrainz genre dataset the tracks that are used for training across the four different datasets.
 
@@ -13,9 +13,9 @@ import csv
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
@@ -79,6 +79,13 @@ class Track(core.Track):
 
     """
 
+    beats_path = core.track_path("beat")
+    chords_path = core.track_path("chords")
+    keys_path = core.track_path("keys")
+    sections_path = core.track_path("sections")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -95,13 +102,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.beats_path = self.get_path("beat")
-        self.chords_path = self.get_path("chords")
-        self.keys_path = self.get_path("keys")
-        self.sections_path = self.get_path("sections")
-
-        self.audio_path = self.get_path("audio")
-
         self.title = os.path.basename(self._track_paths["sections"][0]).split(".")[0]
 
     @core.cached_property
@@ -140,6 +140,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             beat_data=[(self.beats, None)],
             section_data=[(self.sections, None)],
             chord_data=[(self.chords, None)],
@@ -149,18 +150,30 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Beatles audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="beatles",
+    )
 
 
 @io.coerce_to_string_io
@@ -27,12 +27,13 @@ import csv
 import os
 import fnmatch
 import json
-import librosa
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 
+
 BIBTEX = """@phdthesis {3897,
     title = {Tonality Estimation in Electronic Dance Music: A Computational and Musically Informed Examination},
     year = {2018},
@@ -91,6 +92,11 @@ class Track(core.Track):
 
     """
 
+    keys_path = core.track_path("key")
+    metadata_path = core.track_path("meta")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -107,11 +113,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.keys_path = self.get_path("key")
-        self.metadata_path = self.get_path("meta")
-
-        self.audio_path = self.get_path("audio")
-
         self.title = self.audio_path.replace(".mp3", "").split("/")[-1]
 
     @core.cached_property
@@ -150,6 +151,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             metadata={
                 "artists": self.artists,
                 "genres": self.genres,
@@ -160,11 +162,14 @@ class Track(core.Track):
         )
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a beatport_key audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -173,7 +178,14 @@ def load_audio(audio_path):
     """
     if not os.path.exists(audio_path):
         raise IOError("audio_path {} does not exist".format(audio_path))
-    return librosa.load(audio_path, sr=None, mono=True)
+    return audio_utils.load(
+        audio_path,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="beatport_key",
+    )
 
 
 def load_key(keys_path):
@@ -15,15 +15,16 @@ import shutil
 import re
 from typing import BinaryIO, TextIO, Optional, Tuple, Dict, List
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+
 BIBTEX = """
 @inproceedings{burgoyne_billboard,
 author = {Burgoyne, John Ashley and Wild, Jonathan and Fujinaga, Ichiro},
@@ -106,31 +107,15 @@ class Track(core.Track):
         salami_metadata (dict): Metadata of the Salami LAB file
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.audio_path = self.get_path("audio")
-        self.salami_path = self.get_path("salami")
-        self.lab_full_path = self.get_path("lab_full")
-        self.lab_majmin7_path = self.get_path("lab_majmin7")
-        self.lab_majmin7inv_path = self.get_path("lab_majmin7inv")
-        self.lab_majmin_path = self.get_path("lab_majmin")
-        self.lab_majmininv_path = self.get_path("lab_majmininv")
-        self.bothchroma_path = self.get_path("bothchroma")
-        self.tuning_path = self.get_path("tuning")
+    audio_path = core.track_path("audio")
+    salami_path = core.track_path("salami")
+    lab_full_path = core.track_path("lab_full")
+    lab_majmin7_path = core.track_path("lab_majmin7")
+    lab_majmin7inv_path = core.track_path("lab_majmin7inv")
+    lab_majmin_path = core.track_path("lab_majmin")
+    lab_majmininv_path = core.track_path("lab_majmininv")
+    bothchroma_path = core.track_path("bothchroma")
+    tuning_path = core.track_path("tuning")
 
     @property
     def chart_date(self):
@@ -162,23 +147,23 @@ class Track(core.Track):
 
     @core.cached_property
     def chords_full(self):
-        return load_chords(self.lab_full_path)
+        return self.get_annotation("lab_full", load_chords)
 
     @core.cached_property
     def chords_majmin7(self):
-        return load_chords(self.lab_majmin7_path)
+        return self.get_annotation("lab_majmin7", load_chords)
 
     @core.cached_property
     def chords_majmin7inv(self):
-        return load_chords(self.lab_majmin7inv_path)
+        return self.get_annotation("lab_majmin7inv", load_chords)
 
     @core.cached_property
     def chords_majmin(self):
-        return load_chords(self.lab_majmin_path)
+        return self.get_annotation("lab_majmin", load_chords)
 
     @core.cached_property
     def chords_majmininv(self):
-        return load_chords(self.lab_majmininv_path)
+        return self.get_annotation("lab_majmininv", load_chords)
 
     @core.cached_property
     def chroma(self):
@@ -203,15 +188,11 @@ class Track(core.Track):
 
     @core.cached_property
     def sections(self):
-        return load_sections(
-            os.path.join(self._data_home, self._track_paths["salami"][0])
-        )
+        return self.get_annotation("salami", load_sections)
 
     @core.cached_property
     def named_sections(self):
-        return load_named_sections(
-            os.path.join(self._data_home, self._track_paths["salami"][0])
-        )
+        return self.get_annotation("salami", load_named_sections)
 
     @core.cached_property
     def salami_metadata(self):
@@ -239,6 +220,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             chord_data=[
                 (self.chords_full, "Full chords"),
                 (self.chords_majmin, "Major/minor chords"),
@@ -255,18 +237,30 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Billboard audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="billboard",
+    )
 
 
 @io.coerce_to_string_io
@@ -45,14 +45,16 @@ cante100 Loader
 
 """
 import csv
+import itertools
 import os
 import logging
 import xml.etree.ElementTree as ET
-from typing import BinaryIO, cast, Optional, TextIO, Tuple
+from io import StringIO
+from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
@@ -165,27 +167,11 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.spectrogram_path = self.get_path("spectrum")
-        self.f0_path = self.get_path("f0")
-        self.notes_path = self.get_path("notes")
+    spectrogram_path = core.track_path("spectrum")
+    f0_path = core.track_path("f0")
+    notes_path = core.track_path("notes")
 
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def identifier(self):
@@ -222,10 +208,31 @@ class Track(core.Track):
     def spectrogram(self) -> Optional[np.ndarray]:
         """spectrogram of The track's audio
 
+        If the spectrogram was converted with Dataset.convert_spectrograms,
+        the converted array is memory-mapped instead of parsed. Its dtype is
+        then float32 rather than the float64 parsed from the text file.
+
         Returns:
-            np.ndarray: spectrogram
+            np.ndarray: spectrogram, float64, or float32 once converted
         """
-        return load_spectrogram(self.spectrogram_path)
+        return load_spectrogram_frames(self.spectrogram_path)
+
+    def get_spectrogram_frames(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> np.ndarray:
+        """Get a range of frames of the track's spectrogram
+
+        Args:
+            start (int): index of the first frame
+            stop (int or None): index after the last frame. If None, reads
+                until the last frame.
+
+        Returns:
+            np.ndarray: spectrogram frames, float64, or float32 once
+            converted (see spectrogram)
+
+        """
+        return load_spectrogram_frames(self.spectrogram_path, start, stop)
 
     @core.cached_property
     def melody(self) -> Optional[annotations.F0Data]:
@@ -244,6 +251,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             spectrogram_path=self.spectrogram_path,
             f0_data=[(self.melody, "pitch_contour")],
             note_data=[(self.notes, "note_hz")],
@@ -262,24 +270,123 @@ def load_spectrogram(fhandle: TextIO) -> np.ndarray:
         np.ndarray: spectrogram
 
     """
-    parsed_spectrogram = np.genfromtxt(fhandle, delimiter=" ")
-    spectrogram = parsed_spectrogram.astype(np.float64)
+    return io.load_numeric_table(fhandle, delimiter=" ")
+
+
+def spectrogram_npy_path(spectrogram_path: str) -> str:
+    """Get the path of the converted .npy file of a spectrogram file
+
+    Args:
+        spectrogram_path (str): path to a cante100 spectrogram file
+
+    Returns:
+        str: path to the .npy file, next to the spectrogram file
+
+    """
+    return os.path.splitext(spectrogram_path)[0] + ".npy"
+
+
+def is_spectrogram_converted(spectrogram_path: str) -> bool:
+    """Check if the converted .npy file of a spectrogram file exists and is
+    newer than the spectrogram file
+
+    Args:
+        spectrogram_path (str): path to a cante100 spectrogram file
+
+    Returns:
+        bool: True if load_spectrogram_frames can read the .npy file
+
+    """
+    if spectrogram_path is None:
+        return False
+    path = spectrogram_npy_path(spectrogram_path)
+    if not os.path.exists(path):
+        return False
+    return os.path.getmtime(path) >= os.path.getmtime(spectrogram_path)
+
+
+def convert_spectrogram(spectrogram_path: str) -> str:
+    """Write a spectrogram file to a float32 .npy file, so that later loads
+    memory-map it instead of parsing the text file
 
-    return spectrogram
+    Args:
+        spectrogram_path (str): path to a cante100 spectrogram file
+
+    Returns:
+        str: path to the .npy file
 
+    """
+    spectrogram = load_spectrogram(spectrogram_path).astype(np.float32)
+    path = spectrogram_npy_path(spectrogram_path)
+    tmp_path = "{}.tmp{}.npy".format(path, os.getpid())
+    np.save(tmp_path, spectrogram)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_spectrogram_frames(
+    spectrogram_path: str, start: int = 0, stop: Optional[int] = None
+) -> Optional[np.ndarray]:
+    """Load a range of frames of a cante100 spectrogram file
+
+    Memory-maps the float32 .npy file written by convert_spectrogram if it is
+    newer than the spectrogram file, so only the frames in the range are read
+    from disk. Otherwise, only the lines of the range are parsed from the
+    text file, as float64.
+
+    Args:
+        spectrogram_path (str): path to a cante100 spectrogram file
+        start (int): index of the first frame
+        stop (int or None): index after the last frame. If None, reads until
+            the last frame.
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+    Returns:
+        np.ndarray: spectrogram frames, with shape (n_frames, n_bins)
+
+    """
+    if spectrogram_path is None:
+        return None
+    if start < 0 or (stop is not None and stop < 0):
+        raise ValueError("start and stop must be non-negative")
+
+    if is_spectrogram_converted(spectrogram_path):
+        spectrogram = np.load(spectrogram_npy_path(spectrogram_path), mmap_mode="c")
+        return spectrogram[start:stop]
+
+    if start == 0 and stop is None:
+        return load_spectrogram(spectrogram_path)
+    with open(spectrogram_path, "r") as fhandle:
+        # the first line gives the number of bins, also for empty ranges
+        n_bins = len(fhandle.readline().split())
+        fhandle.seek(0)
+        lines = "".join(itertools.islice(fhandle, start, stop))
+    return io.load_numeric_table(StringIO(lines), delimiter=" ", n_columns=n_bins)
+
+
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a cante100 audio file.
 
     Args:
         fhandle (str): path to an audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=22050, mono=False)
+    return audio_utils.load(
+        fhandle,
+        sr=22050,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="cante100",
+    )
 
 
 @io.coerce_to_string_io
@@ -293,16 +400,10 @@ def load_melody(fhandle: TextIO) -> Optional[annotations.F0Data]:
         F0Data: predominant melody
 
     """
-    times = []
-    freqs = []
-    reader = csv.reader(fhandle, delimiter=",")
-    for line in reader:
-        times.append(float(line[0]))
-        freqs.append(float(line[1]))
-
-    times = np.array(times)  # type: ignore
-    freqs = np.array(freqs)  # type: ignore
-    confidence = (cast(np.ndarray, freqs) > 0).astype(float)
+    table = io.load_numeric_table(fhandle, delimiter=",", n_columns=2)
+    times = table[:, 0]
+    freqs = table[:, 1]
+    confidence = (freqs > 0).astype(float)
 
     return annotations.F0Data(times, freqs, confidence)
 
@@ -413,6 +514,21 @@ class Dataset(core.Dataset):
     def load_spectrogram(self, *args, **kwargs):
         return load_spectrogram(*args, **kwargs)
 
+    @core.copy_docs(load_spectrogram_frames)
+    def load_spectrogram_frames(self, *args, **kwargs):
+        return load_spectrogram_frames(*args, **kwargs)
+
+    def convert_spectrograms(self, track_ids=None):
+        """Write the spectrograms of tracks to float32 .npy files, see the
+        module's convert_spectrogram function
+
+        Args:
+            track_ids (list or None): tracks to convert. Default: all tracks.
+
+        """
+        for track_id in self.track_ids if track_ids is None else track_ids:
+            convert_spectrogram(self.track(track_id).spectrogram_path)
+
     @core.copy_docs(load_melody)
     def load_melody(self, *args, **kwargs):
         return load_melody(*args, **kwargs)
@@ -30,7 +30,6 @@
     It can be used and optimized for any modal music culture. Further details are explained in the publication above.
 """
 
-import csv
 import json
 import os
 from typing import TextIO
@@ -89,25 +88,9 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        # Annotation paths
-        self.pitch_path = self.get_path("pitch")
-        self.mb_tags_path = self.get_path("metadata")
+    # Annotation paths
+    pitch_path = core.track_path("pitch")
+    mb_tags_path = core.track_path("metadata")
 
     @property
     def tonic(self):
@@ -161,8 +144,7 @@ def load_pitch(fhandle: TextIO) -> annotations.F0Data:
     """
     time_step = 128 / 44100  # hop-size / fs
 
-    reader = csv.reader(fhandle, delimiter=",")
-    freqs = np.array([float(line[0]) for line in reader])
+    freqs = io.load_numeric_table(fhandle, delimiter=",", n_columns=1)[:, 0]
     times = np.array(np.arange(len(freqs)) * time_step)
     confidence = np.array((freqs > 0.0).astype(float))
 
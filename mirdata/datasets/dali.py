@@ -16,31 +16,28 @@
 
 import json
 import gzip
-import logging
 import os
 import pickle
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+
 # this is the package, needed to load the annotations.
 # DALI-dataset is only installed if the user explicitly declares
 # they want dali when pip installing.
-try:
-    import DALI
-except ImportError as E:
-    logging.error(
-        "In order to use dali you must have dali-dataset installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[dali]'"
-    )
-    raise
+DALI = core.lazy_import(
+    "DALI",
+    install_message="In order to use dali you must have dali-dataset installed. "
+    "Please reinstall mirdata using `pip install 'mirdata[dali]'",
+)
 
 BIBTEX = """@inproceedings{Meseguer-Brocal_2018,
     Title = {DALI: a large Dataset of synchronized Audio, LyrIcs and notes, automatically created using teacher-student
@@ -51,6 +48,8 @@ BIBTEX = """@inproceedings{Meseguer-Brocal_2018,
     Year = {2018}
 }"""
 
+GRANULARITIES = ["notes", "words", "lines", "paragraphs"]
+
 REMOTES = {
     "metadata": download_utils.RemoteFileMetadata(
         filename="dali_metadata.json",
@@ -110,25 +109,9 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
+    annotation_path = core.track_path("annot")
 
-        self.annotation_path = self.get_path("annot")
-
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def audio_url(self):
@@ -178,24 +161,31 @@ class Track(core.Track):
     def language(self):
         return self._track_metadata.get("metadata", {}).get("language")
 
+    @core.cached_property
+    def _annotations(self):
+        # all granularities from one unpickle, or from the numpy sidecar
+        if is_sidecar_current(self.annotation_path):
+            return load_annotations(self.annotation_path)
+        return annotations_from_object(self.annotation_object)
+
     @core.cached_property
     def notes(self) -> annotations.NoteData:
-        return load_annotations_granularity(self.annotation_path, "notes")
+        return self._annotations["notes"]
 
     @core.cached_property
     def words(self) -> annotations.NoteData:
-        return load_annotations_granularity(self.annotation_path, "words")
+        return self._annotations["words"]
 
     @core.cached_property
     def lines(self) -> annotations.NoteData:
-        return load_annotations_granularity(self.annotation_path, "lines")
+        return self._annotations["lines"]
 
     @core.cached_property
     def paragraphs(self) -> annotations.NoteData:
-        return load_annotations_granularity(self.annotation_path, "paragraphs")
+        return self._annotations["paragraphs"]
 
     @core.cached_property
-    def annotation_object(self) -> DALI.Annotations:
+    def annotation_object(self) -> "DALI.Annotations":
         return load_annotations_class(self.annotation_path)
 
     @property
@@ -218,6 +208,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             lyrics_data=[
                 (self.words, "word-aligned lyrics"),
                 (self.lines, "line-aligned lyrics"),
@@ -229,18 +220,30 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Optional[Tuple[np.ndarray, float]]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Optional[Tuple[np.ndarray, float]]:
     """Load a DALI audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="dali",
+    )
 
 
 def load_annotations_granularity(annotations_path, granularity):
@@ -254,29 +257,79 @@ def load_annotations_granularity(annotations_path, granularity):
         NoteData for granularity='notes' or LyricData otherwise
 
     """
-    try:
-        with gzip.open(annotations_path, "rb") as f:
-            output = pickle.load(f)
-    except Exception as e:
-        with gzip.open(annotations_path, "r") as f:
-            output = pickle.load(f)
-    text = []
-    notes = []
-    begs = []
-    ends = []
-    for annot in output.annotations["annot"][granularity]:
-        notes.append(round(annot["freq"][0], 3))
-        begs.append(round(annot["time"][0], 3))
-        ends.append(round(annot["time"][1], 3))
-        text.append(annot["text"])
-    if granularity == "notes":
-
-        annotation = annotations.NoteData(
-            np.array([begs, ends]).T, np.array(notes), None
+    return load_annotations(annotations_path)[granularity]
+
+
+def load_annotations(annotations_path):
+    """Load annotations at all levels of granularity, decompressing and
+    unpickling the annotation file once
+
+    Reads the numpy sidecar written by convert_annotations instead, if it is
+    newer than the annotation file.
+
+    Args:
+        annotations_path (str): path to a DALI annotation file
+
+    Returns:
+        dict: 'notes' to NoteData, and 'words', 'lines' and 'paragraphs' to
+        LyricData, or None if there are no annotations of a granularity
+
+    """
+    if not os.path.exists(annotations_path):
+        raise IOError("annotations_path {} does not exist".format(annotations_path))
+
+    if is_sidecar_current(annotations_path):
+        with np.load(sidecar_path(annotations_path), allow_pickle=False) as sidecar:
+            arrays = {name: sidecar[name] for name in sidecar.files}
+        return _annotations_from_arrays(arrays)
+    return annotations_from_object(load_annotations_class(annotations_path))
+
+
+def annotations_from_object(annotation_object):
+    """Convert a DALI annotation object to mirdata annotations
+
+    Args:
+        annotation_object (DALI.Annotations): DALI annotation object
+
+    Returns:
+        dict: 'notes' to NoteData, and 'words', 'lines' and 'paragraphs' to
+        LyricData, or None if there are no annotations of a granularity
+
+    """
+    return _annotations_from_arrays(_arrays_from_object(annotation_object))
+
+
+def _arrays_from_object(annotation_object):
+    """Get the times, texts and note frequencies of each granularity as arrays"""
+    arrays = {}
+    for granularity in GRANULARITIES:
+        annots = annotation_object.annotations["annot"][granularity]
+        times = np.array([annot["time"][:2] for annot in annots], dtype=float)
+        arrays["{}_intervals".format(granularity)] = np.round(times.reshape(-1, 2), 3)
+        arrays["{}_text".format(granularity)] = np.array(
+            [annot["text"] for annot in annots], dtype=str
         )
-    else:
-        annotation = annotations.LyricData(np.array([begs, ends]).T, text, None)
-    return annotation
+        if granularity == "notes":
+            freqs = np.array([annot["freq"][0] for annot in annots], dtype=float)
+            arrays["notes_freqs"] = np.round(freqs, 3)
+    return arrays
+
+
+def _annotations_from_arrays(arrays):
+    output = {}
+    for granularity in GRANULARITIES:
+        intervals = arrays["{}_intervals".format(granularity)]
+        if len(intervals) == 0:
+            output[granularity] = None
+        elif granularity == "notes":
+            output[granularity] = annotations.NoteData(
+                intervals, arrays["notes_freqs"], None
+            )
+        else:
+            output[granularity] = annotations.LyricData(
+                intervals, arrays["{}_text".format(granularity)].tolist(), None
+            )
+    return output
 
 
 def load_annotations_class(annotations_path):
@@ -292,13 +345,60 @@ def load_annotations_class(annotations_path):
     if not os.path.exists(annotations_path):
         raise IOError("annotations_path {} does not exist".format(annotations_path))
 
-    try:
-        with gzip.open(annotations_path, "rb") as f:
-            output = pickle.load(f)
-    except Exception as e:
-        with gzip.open(annotations_path, "r") as f:
-            output = pickle.load(f)
-    return output
+    DALI.Annotations  # raises an ImportError if dali-dataset is not installed
+    with gzip.open(annotations_path, "rb") as f:
+        return pickle.load(f)
+
+
+def sidecar_path(annotations_path):
+    """Get the path of the numpy sidecar of a DALI annotation file
+
+    Args:
+        annotations_path (str): path to a DALI annotation file
+
+    Returns:
+        str: path to the sidecar, next to the annotation file
+
+    """
+    return os.path.splitext(annotations_path)[0] + ".npz"
+
+
+def is_sidecar_current(annotations_path):
+    """Check if the numpy sidecar of a DALI annotation file exists and is
+    newer than the annotation file
+
+    Args:
+        annotations_path (str): path to a DALI annotation file
+
+    Returns:
+        bool: True if load_annotations can read the sidecar
+
+    """
+    if annotations_path is None:
+        return False
+    path = sidecar_path(annotations_path)
+    if not os.path.exists(path):
+        return False
+    return os.path.getmtime(path) >= os.path.getmtime(annotations_path)
+
+
+def convert_annotations(annotations_path):
+    """Write the notes and lyrics of a DALI annotation file to a numpy sidecar,
+    so that later loads do not need to decompress and unpickle it
+
+    Args:
+        annotations_path (str): path to a DALI annotation file
+
+    Returns:
+        str: path to the sidecar
+
+    """
+    arrays = _arrays_from_object(load_annotations_class(annotations_path))
+    path = sidecar_path(annotations_path)
+    tmp_path = "{}.tmp{}.npz".format(path, os.getpid())
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    return path
 
 
 @core.docstring_inherit(core.Dataset)
@@ -340,3 +440,18 @@ class Dataset(core.Dataset):
     @core.copy_docs(load_annotations_class)
     def load_annotations_class(self, *args, **kwargs):
         return load_annotations_class(*args, **kwargs)
+
+    @core.copy_docs(load_annotations)
+    def load_annotations(self, *args, **kwargs):
+        return load_annotations(*args, **kwargs)
+
+    def convert_annotations(self, track_ids=None):
+        """Write the annotations of tracks to numpy sidecars, see the module's
+        convert_annotations function
+
+        Args:
+            track_ids (list or None): tracks to convert. Default: all tracks.
+
+        """
+        for track_id in self.track_ids if track_ids is None else track_ids:
+            convert_annotations(self.track(track_id).annotation_path)
@@ -36,14 +36,15 @@ import json
 import os
 from typing import BinaryIO, Dict, List, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import io
 
+
 BIBTEX = """@inproceedings{knees2015two,
   title={Two data sets for tempo estimation and key detection in electronic dance music annotated from user corrections},
   author={Knees, Peter and Faraldo P{\'e}rez, {\'A}ngel and Boyer, Herrera and Vogl, Richard and B{\"o}ck, Sebastian and H{\"o}rschl{\"a}ger, Florian and Le Goff, Mickael and others},
@@ -96,6 +97,11 @@ class Track(core.Track):
 
     """
 
+    keys_path = core.track_path("key")
+    metadata_path = core.track_path("meta")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -112,11 +118,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.keys_path = self.get_path("key")
-        self.metadata_path = self.get_path("meta")
-
-        self.audio_path = self.get_path("audio")
-
         self.title = self.audio_path.replace(".mp3", "").split("/")[-1]
 
     @core.cached_property
@@ -155,6 +156,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             metadata={
                 "artists": self.artists,
                 "genres": self.genres,
@@ -165,18 +167,30 @@ class Track(core.Track):
         )
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a giantsteps_key audio file.
 
     Args:
         fhandle (str or file-like): path pointing to an audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="giantsteps_key",
+    )
 
 
 @io.coerce_to_string_io
@@ -68,15 +68,16 @@
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import jams
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+jams = core.lazy_import("jams")
+
 
 BIBTEX = """@inproceedings{knees2015two,
   title={Two data sets for tempo estimation and key detection in electronic dance music annotated from user corrections},
@@ -134,6 +135,11 @@ class Track(core.Track):
 
     """
 
+    annotation_v1_path = core.track_path("annotation_v1")
+    annotation_v2_path = core.track_path("annotation_v2")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -150,11 +156,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.annotation_v1_path = self.get_path("annotation_v1")
-        self.annotation_v2_path = self.get_path("annotation_v2")
-
-        self.audio_path = self.get_path("audio")
-
         self.title = self.audio_path.replace(".mp3", "").split("/")[-1].split(".")[0]
 
     @core.cached_property
@@ -199,18 +200,30 @@ class Track(core.Track):
         return jams.load(self.annotation_v2_path)
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a giantsteps_tempo audio file.
 
     Args:
         fhandle (str or file-like): path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="giantsteps_tempo",
+    )
 
 
 @io.coerce_to_string_io
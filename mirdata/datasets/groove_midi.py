@@ -52,16 +52,17 @@ import os
 import shutil
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
-import pretty_midi
 
+from mirdata import audio_utils
 from mirdata import annotations
 from mirdata import core
 from mirdata import download_utils
 from mirdata import io
 from mirdata import jams_utils
 
+pretty_midi = core.lazy_import("pretty_midi")
+
 
 BIBTEX = """@inproceedings{groove2019,
     Author = {Jon Gillick and Adam Roberts and Jesse Engel and Douglas Eck
@@ -218,25 +219,9 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.midi_path = self.get_path("midi")
+    midi_path = core.track_path("midi")
 
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def drummer(self):
@@ -316,11 +301,16 @@ class Track(core.Track):
         )
 
 
-def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
+def load_audio(
+    path: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """Load a Groove MIDI audio file.
 
     Args:
         path: path to an audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -329,11 +319,18 @@ def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """
     if not path:
         return None, None
-    return librosa.load(path, sr=22050, mono=True)
+    return audio_utils.load(
+        path,
+        sr=22050,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="groove_midi",
+    )
 
 
 @io.coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> Optional[pretty_midi.PrettyMIDI]:
+def load_midi(fhandle: BinaryIO) -> Optional["pretty_midi.PrettyMIDI"]:
     """Load a Groove MIDI midi file.
 
     Args:
@@ -19,9 +19,9 @@
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
@@ -59,6 +59,8 @@ class Track(core.Track):
 
     """
 
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -79,8 +81,6 @@ class Track(core.Track):
         if self.genre == "hiphop":
             self.genre = "hip-hop"
 
-        self.audio_path = self.get_path("audio")
-
     @property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
@@ -112,18 +112,30 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a GTZAN audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    audio, sr = librosa.load(fhandle, sr=22050, mono=True)
+    audio, sr = audio_utils.load(
+        fhandle,
+        sr=22050,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="gtzan_genre",
+    )
     return audio, sr
 
 
@@ -53,16 +53,20 @@
 """
 import logging
 import os
-import jams
-import librosa
+import threading
+from collections import OrderedDict
+
 import numpy as np
-from typing import BinaryIO, Optional, TextIO, Tuple
+from typing import BinaryIO, List, Optional, TextIO, Tuple, Union
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+jams = core.lazy_import("jams")
+
 
 BIBTEX = """@inproceedings{xi2018guitarset,
 title={GuitarSet: A Dataset for Guitar Transcription},
@@ -112,6 +116,11 @@ _STYLE_DICT = {
 }
 _GUITAR_STRINGS = ["E", "A", "D", "G", "B", "e"]
 
+# process-wide cache of parsed jams files, see set_jams_cache_size
+_JAMS_CACHE = OrderedDict()
+_JAMS_CACHE_LOCK = threading.Lock()
+_JAMS_CACHE_SIZE = 0
+
 LICENSE_INFO = "MIT License."
 
 
@@ -160,6 +169,12 @@ class Track(core.Track):
 
     """
 
+    audio_hex_cln_path = core.track_path("audio_hex_cln")
+    audio_hex_path = core.track_path("audio_hex")
+    audio_mic_path = core.track_path("audio_mic")
+    audio_mix_path = core.track_path("audio_mix")
+    jams_path = core.track_path("jams")
+
     def __init__(
         self,
         track_id,
@@ -176,12 +191,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.audio_hex_cln_path = self.get_path("audio_hex_cln")
-        self.audio_hex_path = self.get_path("audio_hex")
-        self.audio_mic_path = self.get_path("audio_mic")
-        self.audio_mix_path = self.get_path("audio_mix")
-        self.jams_path = self.get_path("jams")
-
         title_list = track_id.split("_")  # [PID, S-T-K, mode, rec_mode]
         style, tempo, _ = title_list[1].split("-")  # [style, tempo, key]
         self.player_id = title_list[0]
@@ -189,9 +198,14 @@ class Track(core.Track):
         self.tempo = float(tempo)
         self.style = _STYLE_DICT[style[:-1]]
 
+    @core.cached_property
+    def _jam(self):
+        # parsed once per track and shared by the annotation properties
+        return load_jams(self.jams_path)
+
     @core.cached_property
     def beats(self) -> Optional[annotations.BeatData]:
-        return load_beats(self.jams_path)
+        return _beats_from_jam(self._jam)
 
     @core.cached_property
     def leadsheet_chords(self):
@@ -199,7 +213,7 @@ class Track(core.Track):
             logging.info(
                 "Chord annotations for solo excerpts are the same with the comp excerpt."
             )
-        return load_chords(self.jams_path, leadsheet_version=True)
+        return _chords_from_jam(self._jam, leadsheet_version=True)
 
     @core.cached_property
     def inferred_chords(self):
@@ -207,27 +221,19 @@ class Track(core.Track):
             logging.info(
                 "Chord annotations for solo excerpts are the same as the comp excerpt."
             )
-        return load_chords(self.jams_path, leadsheet_version=False)
+        return _chords_from_jam(self._jam, leadsheet_version=False)
 
     @core.cached_property
     def key_mode(self) -> Optional[annotations.KeyData]:
-        return load_key_mode(self.jams_path)
+        return _key_mode_from_jam(self._jam)
 
     @core.cached_property
     def pitch_contours(self):
-        contours = {}
-        # iterate over 6 strings
-        for i in range(6):
-            contours[_GUITAR_STRINGS[i]] = load_pitch_contour(self.jams_path, i)
-        return contours
+        return _pitch_contours_from_jam(self._jam)
 
     @core.cached_property
     def notes(self):
-        notes = {}
-        # iterate over 6 strings
-        for i in range(6):
-            notes[_GUITAR_STRINGS[i]] = load_notes(self.jams_path, i)
-        return notes
+        return _notes_from_jam(self._jam)
 
     @property
     def audio_mic(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -274,6 +280,31 @@ class Track(core.Track):
         """
         return load_multitrack_audio(self.audio_hex_cln_path)
 
+    def get_string_audio(
+        self, strings, offset=0.0, duration=None, debleeded=False
+    ) -> Optional[Tuple[np.ndarray, float]]:
+        """Hexaphonic audio of some of the strings, reading only their channels
+
+        Args:
+            strings (int or list): string, or list of strings, to load.
+                0 is the Low E string, 5 is the high e string.
+            offset (float): start of the audio to load in seconds
+            duration (float or None): length of the audio to load in seconds.
+                If None, loads until the end of the file.
+            debleeded (bool): if True, loads the audio after bleed removal
+                (audio_hex_cln), otherwise the original audio (audio_hex)
+
+        Returns:
+            * np.ndarray - audio signal, with shape (n_samples,) if strings
+              is an int, and (n_strings, n_samples) otherwise
+            * float - sample rate
+
+        """
+        path = self.audio_hex_cln_path if debleeded else self.audio_hex_path
+        return load_multitrack_audio(
+            path, offset=offset, duration=duration, strings=strings
+        )
+
     def to_jams(self):
         """Get the track's data in jams format
 
@@ -285,33 +316,200 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Guitarset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="guitarset",
+    )
 
 
 @io.coerce_to_bytes_io
-def load_multitrack_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_multitrack_audio(
+    fhandle: BinaryIO,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+    strings: Optional[Union[int, List[int]]] = None,
+) -> Tuple[np.ndarray, float]:
     """Load a Guitarset multitrack audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
+        strings (int, list or None): string, or list of strings, whose
+            channels to load. 0 is the Low E string, 5 is the high e string.
+            Only these channels are read from the file. If None, loads all
+            six channels.
 
     Returns:
-        * np.ndarray - the mono audio signal
+        * np.ndarray - the audio signal, with shape (n_samples,) if strings
+          is an int, and (n_strings, n_samples) otherwise
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    if strings is not None:
+        return audio_utils.load_channels(
+            fhandle,
+            strings,
+            offset=offset,
+            duration=duration,
+            dataset_name="guitarset",
+        )
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="guitarset",
+    )
+
+
+def set_jams_cache_size(size):
+    """Keep the most recently parsed jams files in memory, for all tracks
+
+    Used by load_jams, and so by the Track annotation properties. The cached
+    jams objects are shared and should not be modified.
+
+    Args:
+        size (int): maximum number of parsed jams files to keep.
+            0 disables the cache.
+
+    """
+    global _JAMS_CACHE_SIZE
+    with _JAMS_CACHE_LOCK:
+        _JAMS_CACHE_SIZE = size
+        while len(_JAMS_CACHE) > size:
+            _JAMS_CACHE.popitem(last=False)
+
+
+def load_jams(jams_path):
+    """Parse a guitarset jams annotation file, through the cache set with
+    set_jams_cache_size
+
+    Args:
+        jams_path (str or None): Path of the jams annotation file
+
+    Raises:
+        IOError: if jams_path does not exist
+
+    Returns:
+        jams.JAMS or None: the parsed annotation file, or None if jams_path
+        is None
+
+    """
+    if jams_path is None:
+        return None
+    if not os.path.exists(jams_path):
+        raise IOError("jams_path {} does not exist".format(jams_path))
+    if not _JAMS_CACHE_SIZE:
+        return jams.load(jams_path)
+
+    stat = os.stat(jams_path)
+    key = (os.path.abspath(jams_path), stat.st_mtime_ns, stat.st_size)
+    with _JAMS_CACHE_LOCK:
+        if key in _JAMS_CACHE:
+            _JAMS_CACHE.move_to_end(key)
+            return _JAMS_CACHE[key]
+    jam = jams.load(jams_path)
+    with _JAMS_CACHE_LOCK:
+        _JAMS_CACHE[key] = jam
+        while len(_JAMS_CACHE) > _JAMS_CACHE_SIZE:
+            _JAMS_CACHE.popitem(last=False)
+    return jam
+
+
+def _beats_from_jam(jam):
+    if jam is None:
+        return None
+    anno = jam.search(namespace="beat_position")[0]
+    times, values = anno.to_event_values()
+    positions = [int(v["position"]) for v in values]
+    return annotations.BeatData(times, np.array(positions))
+
+
+def _chords_from_jam(jam, leadsheet_version):
+    if jam is None:
+        return None
+    if leadsheet_version:
+        anno = jam.search(namespace="chord")[0]
+    else:
+        anno = jam.search(namespace="chord")[1]
+    intervals, values = anno.to_interval_values()
+    return annotations.ChordData(intervals, values)
+
+
+def _key_mode_from_jam(jam):
+    if jam is None:
+        return None
+    anno = jam.search(namespace="key_mode")[0]
+    intervals, values = anno.to_interval_values()
+    return annotations.KeyData(intervals, values)
+
+
+def _pitch_contour_from_anno(anno):
+    times, values = anno.to_event_values()
+    if len(times) == 0:
+        return None
+    frequencies = [v["frequency"] for v in values]
+    return annotations.F0Data(times, np.array(frequencies))
+
+
+def _note_from_anno(anno):
+    intervals, values = anno.to_interval_values()
+    if len(values) == 0:
+        return None
+    return annotations.NoteData(intervals, np.array(values))
+
+
+def _annotations_by_string(jam, namespace):
+    """Get the first annotation of each string in one pass over the jams"""
+    by_source = {}
+    for anno in jam.annotations:
+        if anno.namespace == namespace:
+            by_source.setdefault(anno.annotation_metadata.data_source, anno)
+    return {
+        string_name: by_source.get(str(string_num))
+        for string_num, string_name in enumerate(_GUITAR_STRINGS)
+    }
+
+
+def _pitch_contours_from_jam(jam):
+    if jam is None:
+        return None
+    return {
+        string_name: None if anno is None else _pitch_contour_from_anno(anno)
+        for string_name, anno in _annotations_by_string(jam, "pitch_contour").items()
+    }
+
+
+def _notes_from_jam(jam):
+    if jam is None:
+        return None
+    return {
+        string_name: None if anno is None else _note_from_anno(anno)
+        for string_name, anno in _annotations_by_string(jam, "note_midi").items()
+    }
 
 
 @io.coerce_to_string_io
@@ -324,11 +522,7 @@ def load_beats(fhandle: TextIO) -> annotations.BeatData:
     Returns:
         BeatData: Beat data
     """
-    jam = jams.load(fhandle)
-    anno = jam.search(namespace="beat_position")[0]
-    times, values = anno.to_event_values()
-    positions = [int(v["position"]) for v in values]
-    return annotations.BeatData(times, np.array(positions))
+    return _beats_from_jam(jams.load(fhandle))
 
 
 def load_chords(jams_path, leadsheet_version=True):
@@ -344,15 +538,7 @@ def load_chords(jams_path, leadsheet_version=True):
         ChordData: Chord data
 
     """
-    if not os.path.exists(jams_path):
-        raise IOError("jams_path {} does not exist".format(jams_path))
-    jam = jams.load(jams_path)
-    if leadsheet_version:
-        anno = jam.search(namespace="chord")[0]
-    else:
-        anno = jam.search(namespace="chord")[1]
-    intervals, values = anno.to_interval_values()
-    return annotations.ChordData(intervals, values)
+    return _chords_from_jam(load_jams(jams_path), leadsheet_version)
 
 
 @io.coerce_to_string_io
@@ -366,10 +552,7 @@ def load_key_mode(fhandle: TextIO) -> annotations.KeyData:
         KeyData: Key data
 
     """
-    jam = jams.load(fhandle)
-    anno = jam.search(namespace="key_mode")[0]
-    intervals, values = anno.to_interval_values()
-    return annotations.KeyData(intervals, values)
+    return _key_mode_from_jam(jams.load(fhandle))
 
 
 def load_pitch_contour(jams_path, string_num):
@@ -384,16 +567,27 @@ def load_pitch_contour(jams_path, string_num):
         F0Data: Pitch contour data for the given string
 
     """
-    if not os.path.exists(jams_path):
-        raise IOError("jams_path {} does not exist".format(jams_path))
-    jam = jams.load(jams_path)
+    jam = load_jams(jams_path)
+    if jam is None:
+        return None
     anno_arr = jam.search(namespace="pitch_contour")
     anno = anno_arr.search(data_source=str(string_num))[0]
-    times, values = anno.to_event_values()
-    if len(times) == 0:
-        return None
-    frequencies = [v["frequency"] for v in values]
-    return annotations.F0Data(times, np.array(frequencies))
+    return _pitch_contour_from_anno(anno)
+
+
+def load_all_pitch_contours(jams_path):
+    """Load the guitarset pitch contour annotations of all strings, parsing
+    the jams file once
+
+    Args:
+        jams_path (str): Path of the jams annotation file
+
+    Returns:
+        dict: string name ('E', 'A', 'D', 'G', 'B', 'e') to F0Data, or None
+        if the string has no pitch contour
+
+    """
+    return _pitch_contours_from_jam(load_jams(jams_path))
 
 
 def load_notes(jams_path, string_num):
@@ -408,15 +602,27 @@ def load_notes(jams_path, string_num):
         NoteData: Note data for the given string
 
     """
-    if not os.path.exists(jams_path):
-        raise IOError("jams_path {} does not exist".format(jams_path))
-    jam = jams.load(jams_path)
+    jam = load_jams(jams_path)
+    if jam is None:
+        return None
     anno_arr = jam.search(namespace="note_midi")
     anno = anno_arr.search(data_source=str(string_num))[0]
-    intervals, values = anno.to_interval_values()
-    if len(values) == 0:
-        return None
-    return annotations.NoteData(intervals, np.array(values))
+    return _note_from_anno(anno)
+
+
+def load_all_notes(jams_path):
+    """Load the guitarset note annotations of all strings, parsing the jams
+    file once
+
+    Args:
+        jams_path (str): Path of the jams annotation file
+
+    Returns:
+        dict: string name ('E', 'A', 'D', 'G', 'B', 'e') to NoteData, or None
+        if the string has no notes
+
+    """
+    return _notes_from_jam(load_jams(jams_path))
 
 
 @core.docstring_inherit(core.Dataset)
@@ -459,6 +665,14 @@ class Dataset(core.Dataset):
     def load_pitch_contour(self, *args, **kwargs):
         return load_pitch_contour(*args, **kwargs)
 
+    @core.copy_docs(load_all_pitch_contours)
+    def load_all_pitch_contours(self, *args, **kwargs):
+        return load_all_pitch_contours(*args, **kwargs)
+
     @core.copy_docs(load_notes)
     def load_notes(self, *args, **kwargs):
         return load_notes(*args, **kwargs)
+
+    @core.copy_docs(load_all_notes)
+    def load_all_notes(self, *args, **kwargs):
+        return load_all_notes(*args, **kwargs)
@@ -16,17 +16,19 @@
 
 import csv
 import os
-import librosa
 import logging
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+librosa = core.lazy_import("librosa")
+
 
 BIBTEX = """@inproceedings{chan2015vocal,
     title={Vocal activity informed singing voice separation with the iKala dataset},
@@ -83,6 +85,11 @@ class Track(core.Track):
 
     """
 
+    f0_path = core.track_path("pitch")
+    lyrics_path = core.track_path("lyrics")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -99,11 +106,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.f0_path = self.get_path("pitch")
-        self.lyrics_path = self.get_path("lyrics")
-
-        self.audio_path = self.get_path("audio")
-
         self.song_id = track_id.split("_")[0]
         self.section = track_id.split("_")[1]
 
@@ -128,7 +130,8 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_vocal_audio(self.audio_path)
+        sources = self.audio_sources
+        return None if sources is None else (sources[0], sources[3])
 
     @property
     def instrumental_audio(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -139,7 +142,8 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_instrumental_audio(self.audio_path)
+        sources = self.audio_sources
+        return None if sources is None else (sources[1], sources[3])
 
     @property
     def mix_audio(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -150,7 +154,44 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_mix_audio(self.audio_path)
+        sources = self.audio_sources
+        return None if sources is None else (sources[2], sources[3])
+
+    @property
+    def audio_sources(
+        self,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, float]]:
+        """vocal, instrumental and mixture audio (mono), from a single decode
+
+        The stereo file is decoded once per track and audio window, and is
+        shared by ``vocal_audio``, ``instrumental_audio`` and ``mix_audio``.
+        The decoded audio is kept on the track, and released with it. The
+        returned signals are writable copies, unless the decoded-audio memo
+        is on (see Dataset.set_audio_memo): the vocal and instrumental
+        signals are then read-only views of the memoized decode.
+
+        Returns:
+            * np.ndarray - vocal audio signal
+            * np.ndarray - instrumental audio signal
+            * np.ndarray - mixture audio signal
+            * float - sample rate
+
+        """
+        if self._audio_memo_enabled():
+            stereo = self.get_decoded_audio("audio", mono=False)
+            return None if stereo is None else split_sources(*stereo)
+
+        window = audio_utils.get_window()
+        decoded = self.__dict__.get("_stereo_audio")
+        if decoded is None or decoded[0] != window:
+            stereo = self.get_decoded_audio("audio", mono=False)
+            if stereo is None:
+                return None
+            stereo[0].setflags(write=False)
+            decoded = (window, stereo)
+            self.__dict__["_stereo_audio"] = decoded
+        vocal, instrumental, mix, sr = split_sources(*decoded[1])
+        return vocal.copy(), instrumental.copy(), mix, sr
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -161,6 +202,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             f0_data=[(self.f0, None)],
             lyrics_data=[(self.lyrics, None)],
             metadata={
@@ -173,52 +215,138 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_vocal_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_stereo_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
+    """Load ikala stereo audio, with the instrumental on the first channel
+    and the vocal on the second
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
+
+    Returns:
+        * np.ndarray - audio signal, with shape (2, n_samples)
+        * float - sample rate
+
+    """
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="ikala",
+    )
+
+
+def split_sources(
+    audio: np.ndarray, sr: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Split ikala stereo audio into its vocal, instrumental and mixture signals
+
+    The vocal and instrumental signals are views of the stereo audio.
+
+    Args:
+        audio (np.ndarray): stereo audio, as returned by load_stereo_audio
+        sr (float): sample rate
+
+    Returns:
+        * np.ndarray - vocal audio signal
+        * np.ndarray - instrumental audio signal
+        * np.ndarray - mixture audio signal
+        * float - sample rate
+
+    """
+    instrumental, vocal = audio[0], audio[1]
+    return vocal, instrumental, instrumental + vocal, sr
+
+
+@io.coerce_to_bytes_io
+def load_vocal_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load ikala vocal audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="ikala",
+    )
     vocal_channel = audio[1, :]
     return vocal_channel, sr
 
 
 @io.coerce_to_bytes_io
-def load_instrumental_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_instrumental_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load ikala instrumental audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="ikala",
+    )
     instrumental_channel = audio[0, :]
     return instrumental_channel, sr
 
 
 @io.coerce_to_bytes_io
-def load_mix_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_mix_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an ikala mix.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    mixed_audio, sr = librosa.load(fhandle, sr=None, mono=True)
+    mixed_audio, sr = audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="ikala",
+    )
     # multipy by 2 because librosa averages the left and right channel.
     return 2.0 * mixed_audio, sr
 
@@ -237,8 +365,7 @@ def load_f0(fhandle: TextIO) -> annotations.F0Data:
         F0Data: the f0 annotation data
 
     """
-    lines = fhandle.readlines()
-    f0_midi = np.array([float(line) for line in lines])
+    f0_midi = io.load_numeric_table(fhandle, n_columns=1)[:, 0]
     f0_hz = librosa.midi_to_hz(f0_midi) * (f0_midi > 0)
     confidence = (f0_hz > 0).astype(float)
     times = (np.arange(len(f0_midi)) * TIME_STEP) + (TIME_STEP / 2.0)
@@ -93,14 +93,15 @@ import csv
 import os
 from typing import BinaryIO, List, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import io
 
+
 BIBTEX = """
 @dataset{juan_j_bosch_2014_1290750,
   author       = {Juan J. Bosch and Ferdinand Fuhrmann and Perfecto Herrera},
@@ -178,6 +179,10 @@ class Track(core.Track):
 
     """
 
+    annotation_path = core.track_path("annotation")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -194,10 +199,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.annotation_path = self.get_path("annotation")
-
-        self.audio_path = self.get_path("audio")
-
         # Dataset attributes
         self.predominant_instrument = None
         self.genre = None
@@ -268,6 +269,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             metadata={
                 "instrument": self.instrument,
                 "genre": self.genre,
@@ -278,18 +280,30 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a IRMAS dataset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=False)
+    return audio_utils.load(
+        fhandle,
+        sr=44100,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="irmas",
+    )
 
 
 @io.coerce_to_string_io
@@ -37,16 +37,18 @@ import os
 import shutil
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
-import pretty_midi
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+librosa = core.lazy_import("librosa")
+pretty_midi = core.lazy_import("pretty_midi")
+
 
 BIBTEX = """@inproceedings{
   hawthorne2018enabling,
@@ -107,25 +109,9 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.midi_path = self.get_path("midi")
+    midi_path = core.track_path("midi")
 
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def canonical_composer(self):
@@ -148,7 +134,7 @@ class Track(core.Track):
         return self._track_metadata.get("duration")
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> Optional["pretty_midi.PrettyMIDI"]:
         return load_midi(self.midi_path)
 
     @core.cached_property
@@ -175,13 +161,14 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             note_data=[(self.notes, None)],
             metadata=self._track_metadata,
         )
 
 
 @io.coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
+def load_midi(fhandle: BinaryIO) -> "pretty_midi.PrettyMIDI":
     """Load a MAESTRO midi file.
 
     Args:
@@ -222,18 +209,30 @@ def load_notes(midi_path, midi=None):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a MAESTRO audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="maestro",
+    )
 
 
 @core.docstring_inherit(core.Dataset)
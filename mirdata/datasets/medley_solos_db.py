@@ -31,14 +31,15 @@ import logging
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import io
 
+
 BIBTEX = """@inproceedings{lostanlen2019ismir,
     title={Deep Convolutional Networks in the Pitch Spiral for Musical Instrument Recognition},
     author={Lostanlen, Vincent and Cella, Carmine Emanuele},
@@ -79,23 +80,7 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def instrument(self):
@@ -132,23 +117,37 @@ class Track(core.Track):
 
         """
         return jams_utils.jams_converter(
-            audio_path=self.audio_path, metadata=self._track_metadata
+            audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
+            metadata=self._track_metadata,
         )
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Medley Solos DB audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=22050, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=22050,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="medley_solos_db",
+    )
 
 
 @core.docstring_inherit(core.Dataset)
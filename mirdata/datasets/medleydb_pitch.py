@@ -16,15 +16,14 @@
 
 """
 
-import csv
 import json
 import logging
 import os
-from typing import BinaryIO, cast, Optional, TextIO, Tuple
+from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
@@ -74,25 +73,9 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
+    pitch_path = core.track_path("pitch")
 
-        self.pitch_path = self.get_path("pitch")
-
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def instrument(self):
@@ -134,24 +117,37 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             f0_data=[(self.pitch, "annotated pitch")],
             metadata=self._track_metadata,
         )
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a MedleyDB audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="medleydb_pitch",
+    )
 
 
 @io.coerce_to_string_io
@@ -169,16 +165,10 @@ def load_pitch(fhandle: TextIO) -> annotations.F0Data:
 
     """
 
-    times = []
-    freqs = []
-    reader = csv.reader(fhandle, delimiter=",")
-    for line in reader:
-        times.append(float(line[0]))
-        freqs.append(float(line[1]))
-
-    times = np.array(times)  # type: ignore
-    freqs = np.array(freqs)  # type: ignore
-    confidence = (cast(np.ndarray, freqs) > 0).astype(float)
+    table = io.load_numeric_table(fhandle, delimiter=",", n_columns=2)
+    times = table[:, 0]
+    freqs = table[:, 1]
+    confidence = (freqs > 0).astype(float)
     pitch_data = annotations.F0Data(times, freqs, confidence)
     return pitch_data
 
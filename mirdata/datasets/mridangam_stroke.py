@@ -43,15 +43,16 @@
 
 import os
 
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import io
 
+
 BIBTEX = """@article{Anantapadmanabhan2013,
     author = {Anantapadmanabhan, Akshay and Bellur, Ashwin and Murthy, Hema A.},
     doi = {10.1109/ICASSP.2013.6637633},
@@ -108,6 +109,8 @@ class Track(core.Track):
 
     """
 
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -124,8 +127,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.audio_path = self.get_path("audio")
-
         # Parse stroke name annotation from audio file name
         self.stroke_name = self.audio_path.split("__")[2].split("-")[0]
         assert (
@@ -158,23 +159,36 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             tags_open_data=[(self.stroke_name, "stroke_name")],
             metadata={"tonic": self.tonic},
         )
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Mridangam Stroke Dataset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=44100,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="mridangam_stroke",
+    )
 
 
 @core.docstring_inherit(core.Dataset)
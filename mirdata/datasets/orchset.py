@@ -19,15 +19,16 @@ import os
 import shutil
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+
 BIBTEX = """@article{bosch2016evaluation,
     title={Evaluation and combination of pitch estimation methods for melody extraction in symphonic classical music},
     author={Bosch, Juan J and Marxer, Ricard and G{\'o}mez, Emilia},
@@ -80,26 +81,10 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.melody_path = self.get_path("melody")
+    melody_path = core.track_path("melody")
 
-        self.audio_path_mono = self.get_path("audio_mono")
-        self.audio_path_stereo = self.get_path("audio_stereo")
+    audio_path_mono = core.track_path("audio_mono")
+    audio_path_stereo = core.track_path("audio_stereo")
 
     @property
     def composer(self):
@@ -153,11 +138,17 @@ class Track(core.Track):
     def audio_mono(self) -> Optional[Tuple[np.ndarray, float]]:
         """the track's audio (mono)
 
+        When the dataset's audio memo is on (see Dataset.set_audio_memo),
+        this is the downmix of the stereo audio, which is decoded once for
+        both audio_mono and audio_stereo.
+
         Returns:
             * np.ndarray - the mono audio signal
             * float - The sample rate of the audio file
 
         """
+        if self._audio_memo_enabled():
+            return self.get_decoded_audio("audio_stereo", mono=True)
         return load_audio_mono(self.audio_path_mono)
 
     @property
@@ -169,6 +160,8 @@ class Track(core.Track):
             * float - The sample rate of the audio file
 
         """
+        if self._audio_memo_enabled():
+            return self.get_decoded_audio("audio_stereo", mono=False)
         return load_audio_stereo(self.audio_path_stereo)
 
     def to_jams(self):
@@ -180,39 +173,64 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path_mono,
+            audio_info=self.get_audio_info("audio_mono"),
             f0_data=[(self.melody, "annotated melody")],
             metadata=self._track_metadata,
         )
 
 
 @io.coerce_to_bytes_io
-def load_audio_mono(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio_mono(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an Orchset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="orchset",
+    )
 
 
 @io.coerce_to_bytes_io
-def load_audio_stereo(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio_stereo(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an Orchset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the stereo audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="orchset",
+    )
 
 
 @io.coerce_to_string_io
@@ -229,18 +247,12 @@ def load_melody(fhandle: TextIO) -> annotations.F0Data:
         F0Data: melody annotation data
     """
 
-    times = []
-    freqs = []
-    confidence = []
-    reader = csv.reader(fhandle, delimiter="\t")
-    for line in reader:
-        times.append(float(line[0]))
-        freqs.append(float(line[1]))
-        confidence.append(0.0 if line[1] == "0" else 1.0)
-
-    melody_data = annotations.F0Data(
-        np.array(times), np.array(freqs), np.array(confidence)
-    )
+    table = io.load_numeric_table(fhandle, delimiter="\t", n_columns=2)
+    times = table[:, 0]
+    freqs = table[:, 1]
+    confidence = (freqs != 0).astype(float)
+
+    melody_data = annotations.F0Data(times, freqs, confidence)
     return melody_data
 
 
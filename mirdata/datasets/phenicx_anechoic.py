@@ -46,17 +46,19 @@
 """
 import logging
 import os, glob, re
-import jams
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple, cast
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+librosa = core.lazy_import("librosa")
+jams = core.lazy_import("jams")
+
 
 BIBTEX = """
 @article{miron2016score,
@@ -126,6 +128,9 @@ class Track(core.Track):
 
     """
 
+    notes_path = core.track_path("notes")
+    notes_original_path = core.track_path("notes_original")
+
     def __init__(
         self,
         track_id,
@@ -151,9 +156,6 @@ class Track(core.Track):
 
         self.n_voices = len(self.audio_paths)
 
-        self.notes_path = self.get_path("notes")
-        self.notes_original_path = self.get_path("notes_original")
-
     @property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """the track's audio
@@ -370,18 +372,30 @@ class MultiTrack(core.MultiTrack):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Phenicx-Anechoic audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="phenicx_anechoic",
+    )
 
 
 @io.coerce_to_string_io
@@ -17,7 +17,6 @@ import logging
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -35,6 +34,8 @@ from mirdata.datasets.rwc_classical import (
     LICENSE_INFO,
 )
 
+librosa = core.lazy_import("librosa")
+
 BIBTEX = """@inproceedings{goto2002rwc,
   title={RWC Music Database: Popular, Classical and Jazz Music Databases.},
   author={Goto, Masataka and Hashiguchi, Hiroki and Nishimura, Takuichi and Oka, Ryuichi},
@@ -135,28 +136,12 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.sections_path = self.get_path("sections")
-        self.beats_path = self.get_path("beats")
-        self.chords_path = self.get_path("chords")
-        self.voca_inst_path = self.get_path("voca_inst")
+    sections_path = core.track_path("sections")
+    beats_path = core.track_path("beats")
+    chords_path = core.track_path("chords")
+    voca_inst_path = core.track_path("voca_inst")
 
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def piece_number(self):
@@ -234,6 +219,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             beat_data=[(self.beats, None)],
             section_data=[(self.sections, None)],
             chord_data=[(self.chords, None)],
@@ -19,15 +19,16 @@ import logging
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
 
+
 BIBTEX = """@inproceedings{smith2011salami,
     title={Design and creation of a large-scale database of structural annotations.},
     author={Smith, Jordan Bennett Louis and Burgoyne, John Ashley and
@@ -91,28 +92,12 @@ class Track(core.Track):
         sections_annotator_2_lowercase (SectionData): annotations in hierarchy level 1 from annotator 2
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        self.sections_annotator1_uppercase_path = self.get_path("annotator_1_uppercase")
-        self.sections_annotator1_lowercase_path = self.get_path("annotator_1_lowercase")
-        self.sections_annotator2_uppercase_path = self.get_path("annotator_2_uppercase")
-        self.sections_annotator2_lowercase_path = self.get_path("annotator_2_lowercase")
+    sections_annotator1_uppercase_path = core.track_path("annotator_1_uppercase")
+    sections_annotator1_lowercase_path = core.track_path("annotator_1_lowercase")
+    sections_annotator2_uppercase_path = core.track_path("annotator_2_uppercase")
+    sections_annotator2_lowercase_path = core.track_path("annotator_2_lowercase")
 
-        self.audio_path = self.get_path("audio")
+    audio_path = core.track_path("audio")
 
     @property
     def source(self):
@@ -156,19 +141,19 @@ class Track(core.Track):
 
     @core.cached_property
     def sections_annotator_1_uppercase(self) -> Optional[annotations.SectionData]:
-        return load_sections(self.sections_annotator1_uppercase_path)
+        return self.get_annotation("annotator_1_uppercase", load_sections)
 
     @core.cached_property
     def sections_annotator_1_lowercase(self) -> Optional[annotations.SectionData]:
-        return load_sections(self.sections_annotator1_lowercase_path)
+        return self.get_annotation("annotator_1_lowercase", load_sections)
 
     @core.cached_property
     def sections_annotator_2_uppercase(self) -> Optional[annotations.SectionData]:
-        return load_sections(self.sections_annotator2_uppercase_path)
+        return self.get_annotation("annotator_2_uppercase", load_sections)
 
     @core.cached_property
     def sections_annotator_2_lowercase(self) -> Optional[annotations.SectionData]:
-        return load_sections(self.sections_annotator2_lowercase_path)
+        return self.get_annotation("annotator_2_lowercase", load_sections)
 
     @property
     def audio(self) -> Tuple[np.ndarray, float]:
@@ -190,6 +175,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             multi_section_data=[
                 (
                     [
@@ -210,18 +196,30 @@ class Track(core.Track):
         )
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Salami audio file.
 
     Args:
         fhandle (str or file-like): path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="salami",
+    )
 
 
 @io.coerce_to_string_io
@@ -30,16 +30,19 @@
 
 """
 
+import concurrent.futures
 import csv
 import json
 import os
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
+from mirdata import io
+
 
 BIBTEX = """
 @dataset{bozkurt_b_2018_4301737,
@@ -69,6 +72,16 @@ LICENSE_INFO = (
     "Creative Commons Attribution Non Commercial Share Alike 4.0 International."
 )
 
+# the multitrack audio, in the order of the stems loaded by load_stems
+STEMS = [
+    "ghatam",
+    "mridangam-left",
+    "mridangam-right",
+    "violin",
+    "vocal-s",
+    "vocal",
+]
+
 
 class Track(core.Track):
     """Saraga Track Carnatic class
@@ -117,42 +130,26 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        # Audio path
-        self.audio_path = self.get_path("audio-mix")
-
-        # Multitrack audio paths
-        self.audio_ghatam_path = self.get_path("audio-ghatam")
-        self.audio_mridangam_left_path = self.get_path("audio-mridangam-left")
-        self.audio_mridangam_right_path = self.get_path("audio-mridangam-right")
-        self.audio_violin_path = self.get_path("audio-violin")
-        self.audio_vocal_s_path = self.get_path("audio-vocal-s")
-        self.audio_vocal_path = self.get_path("audio-vocal")
-
-        # Annotation paths
-        self.ctonic_path = self.get_path("ctonic")
-        self.pitch_path = self.get_path("pitch")
-        self.pitch_vocal_path = self.get_path("pitch-vocal")
-        self.tempo_path = self.get_path("tempo")
-        self.sama_path = self.get_path("sama")
-        self.sections_path = self.get_path("sections")
-        self.phrases_path = self.get_path("phrases")
-        self.metadata_path = self.get_path("metadata")
+    # Audio path
+    audio_path = core.track_path("audio-mix")
+
+    # Multitrack audio paths
+    audio_ghatam_path = core.track_path("audio-ghatam")
+    audio_mridangam_left_path = core.track_path("audio-mridangam-left")
+    audio_mridangam_right_path = core.track_path("audio-mridangam-right")
+    audio_violin_path = core.track_path("audio-violin")
+    audio_vocal_s_path = core.track_path("audio-vocal-s")
+    audio_vocal_path = core.track_path("audio-vocal")
+
+    # Annotation paths
+    ctonic_path = core.track_path("ctonic")
+    pitch_path = core.track_path("pitch")
+    pitch_vocal_path = core.track_path("pitch-vocal")
+    tempo_path = core.track_path("tempo")
+    sama_path = core.track_path("sama")
+    sections_path = core.track_path("sections")
+    phrases_path = core.track_path("phrases")
+    metadata_path = core.track_path("metadata")
 
     @core.cached_property
     def metadata(self):
@@ -197,6 +194,29 @@ class Track(core.Track):
         """
         return load_audio(self.audio_path)
 
+    def get_audio_stems(self, offset=0.0, duration=None, n_workers=None):
+        """Get the track's multitrack audio as one array, see load_stems
+
+        Args:
+            offset (float): start of the audio to load in seconds
+            duration (float or None): length of the audio to load in seconds.
+                If None, loads until the end of the files.
+            n_workers (int or None): number of stems decoded concurrently.
+                Default: all of them.
+
+        Returns:
+            * np.ndarray - float32 stems with shape (n_stems, n_channels,
+              n_samples), in the order of STEMS. Missing stems are silent.
+            * float - sample rate
+
+            or None if the track does not have multitrack audio
+
+        """
+        audio_paths = [self.get_path("audio-{}".format(stem)) for stem in STEMS]
+        if all(audio_path is None for audio_path in audio_paths):
+            return None
+        return load_stems(audio_paths, offset, duration, n_workers)
+
     def to_jams(self):
         """Get the track's data in jams format
 
@@ -206,6 +226,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio-mix"),
             beat_data=[(self.sama, "sama")],
             f0_data=[(self.pitch, "pitch"), (self.pitch_vocal, "pitch_vocal")],
             section_data=[(self.sections, "sections")],
@@ -244,11 +265,14 @@ def load_metadata(metadata_path):
         return metadata
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a Saraga Carnatic audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -260,7 +284,82 @@ def load_audio(audio_path):
 
     if not os.path.exists(audio_path):
         raise IOError("audio_path {} does not exist".format(audio_path))
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return audio_utils.load(
+        audio_path,
+        sr=44100,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="saraga_carnatic",
+    )
+
+
+def _n_samples(audio_info, sr, offset, duration):
+    # number of samples of a window of the audio, after resampling
+    n_frames = max(audio_info["n_frames"] - int(offset * audio_info["sample_rate"]), 0)
+    if duration is not None:
+        n_frames = min(n_frames, int(duration * audio_info["sample_rate"]))
+    return int(np.ceil(n_frames * float(sr) / audio_info["sample_rate"]))
+
+
+def load_stems(audio_paths, offset=0.0, duration=None, n_workers=None):
+    """Load Saraga Carnatic stems concurrently into one array
+
+    The stems are decoded by a pool of threads, each writing its stem into a
+    preallocated array sized from the files' headers. Stems are aligned at
+    their start and padded with zeros to the length of the longest one.
+    Mono stems are copied to all channels.
+
+    Args:
+        audio_paths (str or list): paths to the stems' audio files. None
+            for missing stems, which are silent.
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the files.
+        n_workers (int or None): number of stems decoded concurrently.
+            Default: all of them.
+
+    Returns:
+        * np.ndarray - float32 stems with shape (n_stems, n_channels, n_samples)
+        * float - sample rate
+
+    """
+    if isinstance(audio_paths, str):
+        audio_paths = [audio_paths]
+    for audio_path in audio_paths:
+        if audio_path is not None and not os.path.exists(audio_path):
+            raise IOError("audio_path {} does not exist".format(audio_path))
+
+    sr = 44100
+    infos = [
+        None if audio_path is None else audio_utils.info(audio_path)
+        for audio_path in audio_paths
+    ]
+    n_channels = max(
+        [1] + [audio_info["n_channels"] for audio_info in infos if audio_info]
+    )
+    n_samples = max(
+        [0]
+        + [
+            _n_samples(audio_info, sr, offset, duration)
+            for audio_info in infos
+            if audio_info
+        ]
+    )
+    stems = np.zeros((len(audio_paths), n_channels, n_samples), dtype=np.float32)
+
+    def load_stem(i):
+        audio, _ = load_audio(audio_paths[i], offset, duration)
+        length = min(audio.shape[-1], n_samples)
+        stems[i, :, :length] = audio[..., :length]
+
+    to_load = [i for i, audio_path in enumerate(audio_paths) if audio_path is not None]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=n_workers or max(len(to_load), 1)
+    ) as executor:
+        # raise the first error, if any
+        list(executor.map(load_stem, to_load))
+    return stems, sr
 
 
 def load_tonic(tonic_path):
@@ -305,19 +404,14 @@ def load_pitch(pitch_path):
     if not os.path.exists(pitch_path):
         raise IOError("melody_path {} does not exist".format(pitch_path))
 
-    times = []
-    freqs = []
     with open(pitch_path, "r") as fhandle:
-        reader = csv.reader(fhandle, delimiter="\t")
-        for line in reader:
-            times.append(float(line[0]))
-            freqs.append(float(line[1]))
+        table = io.load_numeric_table(fhandle, delimiter="\t", n_columns=2)
 
-    if not times:
+    if not table.size:
         return None
 
-    times = np.array(times)
-    freqs = np.array(freqs)
+    times = table[:, 0]
+    freqs = table[:, 1]
     confidence = (freqs > 0).astype(float)
     return annotations.F0Data(times, freqs, confidence)
 
@@ -502,6 +596,10 @@ class Dataset(core.Dataset):
     def load_audio(self, *args, **kwargs):
         return load_audio(*args, **kwargs)
 
+    @core.copy_docs(load_stems)
+    def load_stems(self, *args, **kwargs):
+        return load_stems(*args, **kwargs)
+
     @core.copy_docs(load_tonic)
     def load_tonic(self, *args, **kwargs):
         return load_tonic(*args, **kwargs)
@@ -33,13 +33,15 @@
 import numpy as np
 import os
 import json
-import librosa
 import csv
 
+from mirdata import audio_utils
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
+from mirdata import io
+
 
 BIBTEX = """
 @dataset{bozkurt_b_2018_4301737,
@@ -110,33 +112,17 @@ class Track(core.Track):
 
     """
 
-    def __init__(
-        self,
-        track_id,
-        data_home,
-        dataset_name,
-        index,
-        metadata,
-    ):
-        super().__init__(
-            track_id,
-            data_home,
-            dataset_name,
-            index,
-            metadata,
-        )
-
-        # Audio path
-        self.audio_path = self.get_path("audio")
+    # Audio path
+    audio_path = core.track_path("audio")
 
-        # Annotation paths
-        self.ctonic_path = self.get_path("ctonic")
-        self.pitch_path = self.get_path("pitch")
-        self.tempo_path = self.get_path("tempo")
-        self.sama_path = self.get_path("sama")
-        self.sections_path = self.get_path("sections")
-        self.phrases_path = self.get_path("phrases")
-        self.metadata_path = self.get_path("metadata")
+    # Annotation paths
+    ctonic_path = core.track_path("ctonic")
+    pitch_path = core.track_path("pitch")
+    tempo_path = core.track_path("tempo")
+    sama_path = core.track_path("sama")
+    sections_path = core.track_path("sections")
+    phrases_path = core.track_path("phrases")
+    metadata_path = core.track_path("metadata")
 
     @core.cached_property
     def tonic(self):
@@ -186,6 +172,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             beat_data=[(self.sama, "sama")],
             event_data=[(self.phrases, "phrases")],
             f0_data=[(self.pitch, "pitch")],
@@ -198,11 +185,14 @@ class Track(core.Track):
         )
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a Saraga Hindustani audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -214,7 +204,14 @@ def load_audio(audio_path):
 
     if not os.path.exists(audio_path):
         raise IOError("audio_path {} does not exist".format(audio_path))
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return audio_utils.load(
+        audio_path,
+        sr=44100,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        dataset_name="saraga_hindustani",
+    )
 
 
 def load_tonic(tonic_path):
@@ -259,19 +256,14 @@ def load_pitch(pitch_path):
     if not os.path.exists(pitch_path):
         raise IOError("pitch_path {} does not exist".format(pitch_path))
 
-    times = []
-    freqs = []
     with open(pitch_path, "r") as fhandle:
-        reader = csv.reader(fhandle, delimiter="\t")
-        for line in reader:
-            times.append(float(line[0]))
-            freqs.append(float(line[1]))
+        table = io.load_numeric_table(fhandle, delimiter="\t", n_columns=2)
 
-    if not times:
+    if not table.size:
         return None
 
-    times = np.array(times)
-    freqs = np.array(freqs)
+    times = table[:, 0]
+    freqs = table[:, 1]
     confidence = (freqs > 0).astype(float)
     return annotations.F0Data(times, freqs, confidence)
 
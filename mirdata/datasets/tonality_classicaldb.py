@@ -38,9 +38,9 @@ import json
 import os
 from typing import Any, BinaryIO, Dict, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
+from mirdata import audio_utils
 from mirdata import core
 from mirdata import download_utils
 from mirdata import io
@@ -117,6 +117,13 @@ class Track(core.Track):
 
     """
 
+    key_path = core.track_path("key")
+    spectrum_path = core.track_path("spectrum")
+    musicbrainz_path = core.track_path("mb")
+    hpcp_path = core.track_path("HPCP")
+
+    audio_path = core.track_path("audio")
+
     def __init__(
         self,
         track_id,
@@ -133,13 +140,6 @@ class Track(core.Track):
             metadata,
         )
 
-        self.key_path = self.get_path("key")
-        self.spectrum_path = self.get_path("spectrum")
-        self.musicbrainz_path = self.get_path("mb")
-        self.hpcp_path = self.get_path("HPCP")
-
-        self.audio_path = self.get_path("audio")
-
         self.title = self.audio_path.replace(".wav", "").split("/")[-1]
 
     @core.cached_property
@@ -178,6 +178,7 @@ class Track(core.Track):
         """
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
+            audio_info=self.get_audio_info("audio"),
             metadata={
                 "title": self.title,
                 "key": self.key,
@@ -189,18 +190,30 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Tonality classicalDB audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the audio to load in seconds
+        duration (float or None): length of the audio to load in seconds.
+            If None, loads until the end of the file.
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return audio_utils.load(
+        fhandle,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        dataset_name="tonality_classicaldb",
+    )
 
 
 @io.coerce_to_string_io
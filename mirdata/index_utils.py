@@ -0,0 +1,705 @@
+"""Utilities for compiling and loading dataset indexes.
+
+A compiled index is a binary, memory-mappable version of a dataset's
+``{name}_index.json`` file. It contains:
+
+- an interned string table holding every track id, path and list item
+- a fixed-width table of md5 digests (16 bytes per file)
+- optionally, the sample rate, number of channels and number of frames of
+  each audio file, when the json index records them
+- an open-addressing hash table mapping track ids to rows
+- optionally, the rows of each index shard (e.g. a dataset split), so that
+  a shard can be read without touching the rest of the index
+
+Opening a compiled index only reads a small json header, so it takes the same
+time regardless of the index size. Rows are decoded on access.
+
+Compiled indexes are also used as a persistent cache of parsed json indexes,
+stored under ``data_home/.mirdata_cache``. A compiled index records the size,
+modification time and md5 checksum of the json index it was built from, and is
+only used while they match.
+
+"""
+
+import json
+import logging
+import os
+import zlib
+from collections.abc import Mapping
+
+import numpy as np
+
+from mirdata import validate
+
+MAGIC = b"MIRDIDX1"
+FORMAT_VERSION = 4
+COMPILED_INDEX_EXT = ".mirdx"
+INDEX_CACHE_DIR = ".mirdata_cache"
+SECTIONS = ("tracks", "multitracks")
+
+ABSENT = -2
+NULL = -1
+
+AUDIO_INFO_FIELDS = ("sample_rate", "n_channels", "n_frames")
+AUDIO_EXTENSIONS = (".aif", ".aiff", ".flac", ".mp3", ".ogg", ".wav")
+
+
+def compiled_index_path(index_path):
+    """Get the path of the compiled version of a json index
+
+    Args:
+        index_path (str): path to a json index
+
+    Returns:
+        str: path to the compiled index
+
+    """
+    return os.path.splitext(index_path)[0] + COMPILED_INDEX_EXT
+
+
+def index_cache_path(data_home, index_path):
+    """Get the path of the cached parsed version of a json index
+
+    Args:
+        data_home (str): path where the dataset is stored
+        index_path (str): path to a json index
+
+    Returns:
+        str: path to the cached index
+
+    """
+    return os.path.join(
+        data_home,
+        INDEX_CACHE_DIR,
+        os.path.splitext(os.path.basename(index_path))[0] + COMPILED_INDEX_EXT,
+    )
+
+
+def source_stat(index_path):
+    """Get the size, modification time and md5 checksum of a json index
+
+    Args:
+        index_path (str): path to a json index
+
+    Returns:
+        dict: the json index's size, mtime_ns and md5
+
+    """
+    stat = os.stat(index_path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "md5": validate.md5(index_path),
+    }
+
+
+def add_audio_info(index, data_home):
+    """Record the sample rate, number of channels and length of every audio
+    file of an index, read from the files' headers.
+
+    Audio entries become ``[path, checksum, audio_info]``, where audio_info is
+    the dictionary returned by ``mirdata.audio_utils.info``. Entries whose file
+    is missing or not an audio file are left unchanged.
+
+    Args:
+        index (dict): a dataset index, modified in place
+        data_home (str): path where the dataset is stored
+
+    Returns:
+        dict: the index
+
+    """
+    from mirdata import audio_utils
+
+    for section in SECTIONS:
+        for row in index.get(section, {}).values():
+            for key, entry in row.items():
+                if key == "tracks" or entry[0] is None:
+                    continue
+                if os.path.splitext(entry[0])[1].lower() not in AUDIO_EXTENSIONS:
+                    continue
+                audio_path = os.path.join(data_home, entry[0])
+                if not os.path.exists(audio_path):
+                    continue
+                row[key] = [entry[0], entry[1], audio_utils.info(audio_path)]
+    return index
+
+
+def _align(offset, alignment=8):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _hash(key_bytes):
+    return zlib.crc32(key_bytes)
+
+
+class _StringTable(object):
+    """Interned string table used while compiling an index"""
+
+    def __init__(self):
+        self.lookup = {}
+        self.strings = []
+
+    def add(self, string):
+        idx = self.lookup.get(string)
+        if idx is None:
+            idx = len(self.strings)
+            self.lookup[string] = idx
+            self.strings.append(string.encode("utf-8"))
+        return idx
+
+    def to_arrays(self):
+        offsets = np.zeros((len(self.strings) + 1,), dtype=np.uint64)
+        offsets[1:] = np.cumsum([len(s) for s in self.strings], dtype=np.uint64)
+        blob = np.frombuffer(b"".join(self.strings), dtype=np.uint8)
+        return offsets, blob
+
+
+def _compile_section(section, strings, shard_key=None):
+    """Build the arrays of a tracks or multitracks section"""
+    row_ids = list(section.keys())
+    n_rows = len(row_ids)
+
+    file_keys = []
+    list_keys = []
+    # each distinct key order is stored once, so rows keep their json order
+    orders = {}
+    row_orders = np.zeros((n_rows,), dtype=np.int32)
+    for row_num, row in enumerate(section.values()):
+        for key, value in row.items():
+            if key in file_keys or key in list_keys:
+                continue
+            if key == "tracks":
+                list_keys.append(key)
+            else:
+                file_keys.append(key)
+        row_orders[row_num] = orders.setdefault(tuple(row.keys()), len(orders))
+
+    arrays = {}
+    arrays["ids"] = np.array([strings.add(t) for t in row_ids], dtype=np.int32)
+
+    n_slots = 1
+    while n_slots < 2 * max(n_rows, 1):
+        n_slots *= 2
+    table = np.full((n_slots,), -1, dtype=np.int32)
+    for row_num, row_id in enumerate(row_ids):
+        slot = _hash(row_id.encode("utf-8")) & (n_slots - 1)
+        while table[slot] != -1:
+            slot = (slot + 1) & (n_slots - 1)
+        table[slot] = row_num
+    arrays["hash"] = table
+
+    paths = np.full((n_rows, len(file_keys)), ABSENT, dtype=np.int32)
+    md5s = np.zeros((n_rows, len(file_keys), 16), dtype=np.uint8)
+    has_md5 = np.zeros((n_rows, len(file_keys)), dtype=np.uint8)
+    audio_info = None
+    list_items = {key: [] for key in list_keys}
+    list_offsets = {key: [0] for key in list_keys}
+    for row_num, row in enumerate(section.values()):
+        for col, key in enumerate(file_keys):
+            if key not in row:
+                continue
+            path, checksum = row[key][:2]
+            if len(row[key]) > 2 and row[key][2] is not None:
+                if audio_info is None:
+                    audio_info = np.full(
+                        (n_rows, len(file_keys), len(AUDIO_INFO_FIELDS)),
+                        NULL,
+                        dtype=np.int64,
+                    )
+                audio_info[row_num, col] = [
+                    row[key][2][field] for field in AUDIO_INFO_FIELDS
+                ]
+            paths[row_num, col] = NULL if path is None else strings.add(path)
+            if checksum is not None:
+                try:
+                    digest = bytes.fromhex(checksum)
+                except ValueError:
+                    digest = b""
+                if len(digest) != 16:
+                    raise ValueError(
+                        "Invalid md5 checksum {} for {}".format(checksum, path)
+                    )
+                md5s[row_num, col] = np.frombuffer(digest, dtype=np.uint8)
+                has_md5[row_num, col] = 1
+        for key in list_keys:
+            items = row.get(key, [])
+            list_items[key].extend(strings.add(item) for item in items)
+            list_offsets[key].append(len(list_items[key]))
+
+    arrays["orders"] = row_orders
+    arrays["paths"] = paths
+    arrays["md5"] = md5s
+    arrays["has_md5"] = has_md5
+    if audio_info is not None:
+        arrays["audio_info"] = audio_info
+    for key in list_keys:
+        arrays["{}:offsets".format(key)] = np.array(list_offsets[key], dtype=np.int64)
+        arrays["{}:items".format(key)] = np.array(list_items[key], dtype=np.int32)
+
+    shards = {}
+    if shard_key is not None:
+        shard_rows = {}
+        for row_num, row_id in enumerate(row_ids):
+            shard_rows.setdefault(shard_key(row_id), []).append(row_num)
+        offset = 0
+        for name, rows in shard_rows.items():
+            shards[name] = [offset, len(rows)]
+            offset += len(rows)
+        arrays["shard_rows"] = np.array(
+            [row for rows in shard_rows.values() for row in rows], dtype=np.int32
+        )
+
+    header = {
+        "n_rows": n_rows,
+        "file_keys": file_keys,
+        "list_keys": list_keys,
+        "orders": [list(order) for order in orders],
+        "has_audio_info": audio_info is not None,
+        "shards": shards,
+    }
+    return header, arrays
+
+
+def write_compiled_index(index, output_path, source=None, shard_key=None):
+    """Write an index dictionary to a compiled index file
+
+    Args:
+        index (dict): a dataset index, as loaded from its json file
+        output_path (str): path to write the compiled index to
+        source (dict or None): information about the json file the index
+            was loaded from, used to check if the compiled index is up to date
+        shard_key (function or None): a function mapping a track id to the name
+            of its shard. If None, the index is not sharded.
+
+    """
+    strings = _StringTable()
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source": source,
+        "keys": list(index.keys()),
+        "values": {},
+        "sections": {},
+        "arrays": {},
+    }
+    arrays = {}
+    for key, value in index.items():
+        if key in SECTIONS and isinstance(value, dict):
+            section_header, section_arrays = _compile_section(
+                value, strings, shard_key=shard_key if key == "tracks" else None
+            )
+            header["sections"][key] = section_header
+            for name, array in section_arrays.items():
+                arrays["{}/{}".format(key, name)] = array
+        else:
+            header["values"][key] = value
+
+    arrays["strings/offsets"], arrays["strings/blob"] = strings.to_arrays()
+
+    # layout the arrays after the header, aligned to 8 bytes. The header
+    # stores the array offsets, so grow the data start until the header fits
+    data_start = 0
+    while True:
+        offset = data_start
+        for name, array in arrays.items():
+            header["arrays"][name] = [offset, array.dtype.str, list(array.shape)]
+            offset = _align(offset + array.nbytes)
+        header_bytes = json.dumps(header).encode("utf-8")
+        header_end = len(MAGIC) + 8 + len(header_bytes)
+        if header_end <= data_start:
+            break
+        data_start = _align(header_end + 64)
+    header_bytes += b" " * (data_start - header_end)
+
+    tmp_path = "{}.tmp{}".format(output_path, os.getpid())
+    with open(tmp_path, "wb") as fhandle:
+        fhandle.write(MAGIC)
+        fhandle.write(np.uint64(len(header_bytes)).tobytes())
+        fhandle.write(header_bytes)
+        for name, array in arrays.items():
+            fhandle.seek(header["arrays"][name][0])
+            fhandle.write(np.ascontiguousarray(array).tobytes())
+    os.replace(tmp_path, output_path)
+
+
+def compile_index(index_path, output_path=None, shard_key=None):
+    """Compile a json index into a memory-mappable binary index
+
+    Args:
+        index_path (str): path to the json index
+        output_path (str or None): path to write the compiled index to.
+            If None, writes it next to the json index.
+        shard_key (function or None): a function mapping a track id to the name
+            of its shard. If None, the index is not sharded.
+
+    Returns:
+        str: path to the compiled index
+
+    """
+    if output_path is None:
+        output_path = compiled_index_path(index_path)
+    with open(index_path) as fhandle:
+        index = json.load(fhandle)
+    write_compiled_index(
+        index, output_path, source=source_stat(index_path), shard_key=shard_key
+    )
+    return output_path
+
+
+def _read_header(fhandle):
+    magic = fhandle.read(len(MAGIC))
+    if magic != MAGIC:
+        raise ValueError("Not a compiled mirdata index")
+    header_len = int(np.frombuffer(fhandle.read(8), dtype=np.uint64)[0])
+    header = json.loads(fhandle.read(header_len).decode("utf-8"))
+    if header["format_version"] != FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported compiled index version {}".format(header["format_version"])
+        )
+    return header
+
+
+def is_compiled_index_current(compiled_path, index_path):
+    """Check if a compiled index exists and matches its json index
+
+    Args:
+        compiled_path (str): path to the compiled index
+        index_path (str): path to the json index
+
+    Returns:
+        bool: True if the compiled index can be used in place of the json index
+
+    """
+    if not os.path.exists(compiled_path):
+        return False
+    if not os.path.exists(index_path):
+        return True
+    try:
+        with open(compiled_path, "rb") as fhandle:
+            header = _read_header(fhandle)
+    except (ValueError, KeyError):
+        logging.warning("Ignoring invalid compiled index {}".format(compiled_path))
+        return False
+
+    source = header["source"]
+    if source is None:
+        return False
+    stat = os.stat(index_path)
+    if source["size"] != stat.st_size:
+        return False
+    if source["mtime_ns"] == stat.st_mtime_ns:
+        return True
+    # the file was touched: only compute the checksum in this case
+    return source["md5"] == validate.md5(index_path)
+
+
+def write_index_cache(index, cache_path, index_path, shard_key=None):
+    """Cache a parsed json index as a compiled index.
+
+    Failures are logged and otherwise ignored, for example if ``data_home``
+    is read-only.
+
+    Args:
+        index (dict): the parsed json index
+        cache_path (str): path to write the cached index to
+        index_path (str): path to the json index that was parsed
+        shard_key (function or None): a function mapping a track id to the name
+            of its shard. If None, the index is not sharded.
+
+    Returns:
+        bool: True if the cache was written
+
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        write_compiled_index(
+            index, cache_path, source=source_stat(index_path), shard_key=shard_key
+        )
+    except OSError as err:
+        logging.warning("Could not write index cache {}: {}".format(cache_path, err))
+        return False
+    return True
+
+
+def load_compiled_index(compiled_path):
+    """Open a compiled index
+
+    Args:
+        compiled_path (str): path to the compiled index
+
+    Returns:
+        CompiledIndex: a read-only mapping with the same structure as the json index
+
+    """
+    return CompiledIndex(compiled_path)
+
+
+class CompiledIndex(Mapping):
+    """Read-only, memory-mapped view of a compiled index
+
+    Behaves like the dictionary loaded from the json index: ``index["tracks"]``
+    maps track ids to ``{key: [path, checksum]}`` dictionaries, which are
+    decoded only when accessed. Files with audio information in the json
+    index are decoded as ``[path, checksum, audio_info]``.
+
+    Attributes:
+        path (str): path to the compiled index file
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fhandle:
+            self._header = _read_header(fhandle)
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        self._arrays = {}
+        for name, (offset, dtype, shape) in self._header["arrays"].items():
+            dtype = np.dtype(dtype)
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            self._arrays[name] = (
+                self._data[offset : offset + nbytes].view(dtype).reshape(shape)
+            )
+        self._strings = _StringView(
+            self._arrays["strings/offsets"], self._arrays["strings/blob"]
+        )
+        self._sections = {
+            key: CompiledIndexSection(key, section, self._arrays, self._strings)
+            for key, section in self._header["sections"].items()
+        }
+
+    @property
+    def source(self):
+        """dict or None: size, modification time and md5 of the source json index"""
+        return self._header["source"]
+
+    def __getitem__(self, key):
+        if key in self._sections:
+            return self._sections[key]
+        return self._header["values"][key]
+
+    def __iter__(self):
+        return iter(self._header["keys"])
+
+    def __len__(self):
+        return len(self._header["keys"])
+
+    def __contains__(self, key):
+        return key in self._sections or key in self._header["values"]
+
+
+class _StringView(object):
+    """Decodes strings from an interned string table"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __getitem__(self, idx):
+        start, end = self.offsets[idx : idx + 2]
+        return self.blob[start:end].tobytes().decode("utf-8")
+
+    def many(self, indexes):
+        indexes = np.asarray(indexes, dtype=np.int64)
+        starts = self.offsets[indexes].tolist()
+        ends = self.offsets[indexes + 1].tolist()
+        if len(starts) == 0:
+            return []
+        lo = min(starts)
+        chunk = self.blob[lo : max(ends)].tobytes()
+        return [chunk[s - lo : e - lo].decode("utf-8") for s, e in zip(starts, ends)]
+
+
+def _audio_info_dict(values):
+    info = dict(zip(AUDIO_INFO_FIELDS, values))
+    info["duration"] = info["n_frames"] / float(info["sample_rate"])
+    return info
+
+
+class CompiledIndexSection(Mapping):
+    """The tracks or multitracks section of a compiled index"""
+
+    def __init__(self, name, header, arrays, strings):
+        self.name = name
+        self._n_rows = header["n_rows"]
+        self._file_keys = header["file_keys"]
+        self._list_keys = header["list_keys"]
+        self._columns = {key: col for col, key in enumerate(self._file_keys)}
+        self._orders = header["orders"]
+        self._row_orders = arrays["{}/orders".format(name)]
+        self._ids = arrays["{}/ids".format(name)]
+        self._hash = arrays["{}/hash".format(name)]
+        self._paths = arrays["{}/paths".format(name)]
+        self._md5 = arrays["{}/md5".format(name)]
+        self._has_md5 = arrays["{}/has_md5".format(name)]
+        self._audio_info = (
+            arrays["{}/audio_info".format(name)] if header["has_audio_info"] else None
+        )
+        self._lists = {
+            key: (
+                arrays["{}/{}:offsets".format(name, key)],
+                arrays["{}/{}:items".format(name, key)],
+            )
+            for key in self._list_keys
+        }
+        self._strings = strings
+        self._shards = header["shards"]
+        if self._shards:
+            self._shard_rows = arrays["{}/shard_rows".format(name)]
+
+    @property
+    def shards(self):
+        """dict: shard name to a read-only mapping over the shard's rows.
+        Empty if the index is not sharded.
+        """
+        return {
+            shard: CompiledIndexShard(self, self._shard_rows[offset : offset + count])
+            for shard, (offset, count) in self._shards.items()
+        }
+
+    def _find(self, row_id):
+        """Get the row number of row_id, or -1 if it is not in the index"""
+        if not isinstance(row_id, str):
+            return -1
+        n_slots = len(self._hash)
+        slot = _hash(row_id.encode("utf-8")) & (n_slots - 1)
+        while True:
+            row_num = int(self._hash[slot])
+            if row_num == -1:
+                return -1
+            if self._strings[int(self._ids[row_num])] == row_id:
+                return row_num
+            slot = (slot + 1) & (n_slots - 1)
+
+    def _keys(self, row_num):
+        """The keys of a row, in the order of the json index"""
+        return self._orders[self._row_orders[row_num]]
+
+    def _value(self, row_num, key):
+        """Decode the value of one key of a row"""
+        if key in self._lists:
+            offsets, items = self._lists[key]
+            start, end = offsets[row_num : row_num + 2]
+            return self._strings.many(items[start:end])
+        col = self._columns[key]
+        path_idx = int(self._paths[row_num, col])
+        if path_idx == ABSENT:
+            raise KeyError(key)
+        path = None if path_idx == NULL else self._strings[path_idx]
+        checksum = (
+            self._md5[row_num, col].tobytes().hex()
+            if self._has_md5[row_num, col]
+            else None
+        )
+        value = [path, checksum]
+        if self._audio_info is not None and self._audio_info[row_num, col, 0] != NULL:
+            value.append(_audio_info_dict(self._audio_info[row_num, col].tolist()))
+        return value
+
+    def _row(self, row_num):
+        return {key: self._value(row_num, key) for key in self._keys(row_num)}
+
+    def row_view(self, row_id):
+        """Get a row without decoding it
+
+        Args:
+            row_id (str): the track or multitrack id
+
+        Raises:
+            KeyError: if row_id is not in the section
+
+        Returns:
+            CompiledIndexRow: a read-only mapping which decodes each key
+            when it is accessed
+
+        """
+        row_num = self._find(row_id)
+        if row_num == -1:
+            raise KeyError(row_id)
+        return CompiledIndexRow(self, row_num)
+
+    def __getitem__(self, row_id):
+        row_num = self._find(row_id)
+        if row_num == -1:
+            raise KeyError(row_id)
+        return self._row(row_num)
+
+    def __contains__(self, row_id):
+        return self._find(row_id) != -1
+
+    def __iter__(self):
+        return iter(self._strings.many(self._ids))
+
+    def __len__(self):
+        return self._n_rows
+
+
+class CompiledIndexRow(Mapping):
+    """A row of a compiled index section, decoded one key at a time"""
+
+    __slots__ = ("_section", "_row_num")
+
+    def __init__(self, section, row_num):
+        self._section = section
+        self._row_num = row_num
+
+    def __getitem__(self, key):
+        if key not in self._section._keys(self._row_num):
+            raise KeyError(key)
+        return self._section._value(self._row_num, key)
+
+    def __contains__(self, key):
+        return key in self._section._keys(self._row_num)
+
+    def __iter__(self):
+        return iter(self._section._keys(self._row_num))
+
+    def __len__(self):
+        return len(self._section._keys(self._row_num))
+
+
+def index_row(section, row_id):
+    """Get a row of an index section, without decoding it if the index is compiled
+
+    Args:
+        section (dict or CompiledIndexSection): the tracks or multitracks
+            section of an index
+        row_id (str): the track or multitrack id
+
+    Raises:
+        KeyError: if row_id is not in the section
+
+    Returns:
+        dict or CompiledIndexRow: the row, {key: [path, checksum]}
+
+    """
+    if isinstance(section, CompiledIndexSection):
+        return section.row_view(row_id)
+    return section[row_id]
+
+
+class CompiledIndexShard(Mapping):
+    """A shard of a compiled index section, e.g. the tracks of one split"""
+
+    def __init__(self, section, rows):
+        self._section = section
+        self._rows = rows
+
+    def __getitem__(self, row_id):
+        row_num = self._section._find(row_id)
+        if row_num == -1 or not self._has_row(row_num):
+            raise KeyError(row_id)
+        return self._section._row(row_num)
+
+    def __contains__(self, row_id):
+        row_num = self._section._find(row_id)
+        return row_num != -1 and self._has_row(row_num)
+
+    def _has_row(self, row_num):
+        pos = np.searchsorted(self._rows, row_num)
+        return pos < len(self._rows) and self._rows[pos] == row_num
+
+    def __iter__(self):
+        return iter(self._section._strings.many(self._section._ids[self._rows]))
+
+    def __len__(self):
+        return len(self._rows)
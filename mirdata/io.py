@@ -1,22 +1,25 @@
 import functools
 import io
+import warnings
 from typing import BinaryIO, Callable, Optional, TextIO, TypeVar, Union
 
+import numpy as np
+
 T = TypeVar("T")  # Can be anything
 
 
-def coerce_to_string_io(
-    func: Callable[[TextIO], T]
-) -> Callable[[Optional[Union[str, TextIO]]], Optional[T]]:
+def coerce_to_string_io(func: Callable[..., T]) -> Callable[..., Optional[T]]:
     @functools.wraps(func)
-    def wrapper(file_path_or_obj: Optional[Union[str, TextIO]]) -> Optional[T]:
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, TextIO]], *args, **kwargs
+    ) -> Optional[T]:
         if not file_path_or_obj:
             return None
         if isinstance(file_path_or_obj, str):
             with open(file_path_or_obj) as f:
-                return func(f)
+                return func(f, *args, **kwargs)
         elif isinstance(file_path_or_obj, io.StringIO):
-            return func(file_path_or_obj)
+            return func(file_path_or_obj, *args, **kwargs)
         else:
             raise ValueError(
                 "Invalid argument passed to {}, argument has the type {}",
@@ -27,18 +30,18 @@ def coerce_to_string_io(
     return wrapper
 
 
-def coerce_to_bytes_io(
-    func: Callable[[BinaryIO], T]
-) -> Callable[[Optional[Union[str, BinaryIO]]], Optional[T]]:
+def coerce_to_bytes_io(func: Callable[..., T]) -> Callable[..., Optional[T]]:
     @functools.wraps(func)
-    def wrapper(file_path_or_obj: Optional[Union[str, BinaryIO]]) -> Optional[T]:
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, BinaryIO]], *args, **kwargs
+    ) -> Optional[T]:
         if not file_path_or_obj:
             return None
         if isinstance(file_path_or_obj, str):
             with open(file_path_or_obj, "rb") as f:
-                return func(f)
+                return func(f, *args, **kwargs)
         elif isinstance(file_path_or_obj, io.BytesIO):
-            return func(file_path_or_obj)
+            return func(file_path_or_obj, *args, **kwargs)
         else:
             raise ValueError(
                 "Invalid argument passed to {}, argument has the type {}",
@@ -47,3 +50,127 @@ def coerce_to_bytes_io(
             )
 
     return wrapper
+
+
+def load_numeric_table(
+    fhandle: TextIO, delimiter: Optional[str] = None, n_columns: Optional[int] = None
+) -> np.ndarray:
+    """Parse a delimited text file of numbers into a 2d array
+
+    When every row has the same number of fields, the whole file is parsed
+    by numpy in one call, instead of converting each field with ``float()``.
+    Other files are parsed line by line, like ``csv.reader`` and ``float()``:
+    fields after the first n_columns of a row, including empty fields left
+    by a trailing delimiter, are ignored. Blank lines are skipped.
+
+    Args:
+        fhandle (file-like): text file handle
+        delimiter (str or None): single-character field delimiter, e.g.
+            ``","`` or ``"\t"``. If None or ``" "``, fields are separated by
+            any whitespace.
+        n_columns (int or None): number of columns. If None, uses the number
+            of fields of the first non-blank line. If given, an empty file
+            gives an array with shape (0, n_columns).
+
+    Raises:
+        ValueError: if one of the first n_columns fields of a row is empty
+            or not a number, or if a row has less than n_columns fields
+
+    Returns:
+        np.ndarray: float array with shape (n_rows, n_columns)
+
+    """
+    text = fhandle.read()
+    if delimiter == " ":
+        delimiter = None
+    fields_text = text
+    if delimiter is not None and not delimiter.isspace():
+        fields_text = text.replace(delimiter, " ")
+
+    if not fields_text or fields_text.isspace():
+        # numpy parses a string of only whitespace as [-1.0]
+        return np.zeros((0, n_columns or 0))
+
+    if n_columns is None:
+        n_columns = len(_first_line(fields_text).split())
+
+    if _is_regular(text, delimiter, n_columns):
+        with warnings.catch_warnings():
+            # numpy warns, instead of raising, when it stops at an invalid field
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                values = np.fromstring(fields_text, dtype=float, sep=" ")
+            except (DeprecationWarning, ValueError):
+                values = None
+        if values is not None:
+            return values.reshape(-1, n_columns)
+
+    return _parse_rows(text, delimiter, n_columns)
+
+
+def _is_regular(text: str, delimiter: Optional[str], n_columns: int) -> bool:
+    """Check that every non-blank line of a table has n_columns fields
+    separated by single delimiters, so that it can be parsed in one call
+    """
+    data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    newline = ord("\n")
+    # whitespace and control characters are all <= " "
+    is_separator = data <= ord(" ")
+    is_token = data == newline
+    row = [0] * n_columns + [newline]
+    if delimiter is not None:
+        is_delimiter = data == ord(delimiter)
+        is_separator |= is_delimiter
+        is_token |= is_delimiter
+        row = [0, ord(delimiter)] * n_columns
+        row[-1] = newline
+
+    # tokens are field starts, delimiters and line ends, in order
+    is_token[0] |= not is_separator[0]
+    is_token[1:] |= is_separator[:-1] & ~is_separator[1:]
+    tokens = data[np.flatnonzero(is_token)]
+    is_field = tokens != newline
+    if delimiter is not None:
+        is_field &= tokens != ord(delimiter)
+    tokens[is_field] = 0
+    # skip blank lines, and end the last line
+    is_blank = tokens == newline
+    is_blank[1:] &= tokens[:-1] == newline
+    tokens = np.append(tokens[~is_blank], newline)
+    if len(tokens) > 1 and tokens[-2] == newline:
+        tokens = tokens[:-1]
+
+    if len(tokens) % len(row):
+        return False
+    return bool((tokens.reshape(-1, len(row)) == row).all())
+
+
+def _parse_rows(text: str, delimiter: Optional[str], n_columns: int) -> np.ndarray:
+    """Parse a table line by line, keeping the first n_columns fields of each row"""
+    rows = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        fields = line.split(delimiter)
+        if len(fields) < n_columns:
+            raise ValueError(
+                "Invalid numeric table: expected {} columns, got {!r}".format(
+                    n_columns, line
+                )
+            )
+        try:
+            rows.append([float(field) for field in fields[:n_columns]])
+        except ValueError as exc:
+            raise ValueError("Invalid numeric table: {}".format(exc))
+    return np.array(rows, dtype=float).reshape(len(rows), n_columns)
+
+
+def _first_line(text: str) -> str:
+    """Return the first non-blank line of a string without splitting all of it"""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        line = text[start:] if end < 0 else text[start:end]
+        if line.strip() or end < 0:
+            return line
+        start = end + 1
@@ -1,16 +1,19 @@
-"""Utilities for converting mirdata Annotation classes to jams format.
-"""
+"""Utilities for converting mirdata Annotation classes to jams format."""
+
 import logging
 import os
 
-import jams
-import librosa
-
 from mirdata import annotations
+from mirdata import audio_utils
+from mirdata import core
+
+jams = core.lazy_import("jams")
+librosa = core.lazy_import("librosa")
 
 
 def jams_converter(
     audio_path=None,
+    audio_info=None,
     spectrogram_path=None,
     beat_data=None,
     chord_data=None,
@@ -30,10 +33,13 @@ def jams_converter(
 
     Args:
         audio_path (str or None):
-            A path to the corresponding audio file, or None. If provided,
-            the audio file will be read to compute the duration. If None,
-            'duration' must be a field in the metadata dictionary, or the
-            resulting jam object will not validate.
+            A path to the corresponding audio file, or None. If provided
+            without audio_info, the audio file's header will be read to compute
+            the duration. If None, 'duration' must be a field in the metadata
+            dictionary, or the resulting jam object will not validate.
+        audio_info (dict or None):
+            The audio file's information, as returned by Track.get_audio_info.
+            If provided, its duration is used and the audio file is not read.
         spectrogram_path (str or None):
             A path to the corresponding spectrum file, or None.
         beat_data (list or None):
@@ -79,9 +85,14 @@ def jams_converter(
 
     # duration
     duration = None
-    if audio_path is not None:
+    if audio_path is not None and audio_info is not None:
+        duration = audio_info["duration"]
+    elif audio_path is not None:
         if os.path.exists(audio_path):
-            duration = librosa.get_duration(filename=audio_path)
+            try:
+                duration = audio_utils.info(audio_path)["duration"]
+            except audio_utils.UnsupportedAudioError:
+                duration = librosa.get_duration(filename=audio_path)
         else:
             raise OSError(
                 "jams conversion failed because the audio file "
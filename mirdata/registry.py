@@ -0,0 +1,271 @@
+"""Static registry of mirdata datasets
+
+Generated by scripts/make_registry.py, do not edit by hand.
+
+Maps each dataset name to its loader module and to information about the
+dataset which can be queried without importing the module.
+"""
+
+DATASETS = {
+    "acousticbrainz_genre": {
+        "module": "mirdata.datasets.acousticbrainz_genre",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": True,
+        "index_size": None,
+        "num_tracks": None,
+        "num_multitracks": None,
+    },
+    "beatles": {
+        "module": "mirdata.datasets.beatles",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 142490,
+        "num_tracks": 180,
+        "num_multitracks": 0,
+    },
+    "beatport_key": {
+        "module": "mirdata.datasets.beatport_key",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 598112,
+        "num_tracks": 1486,
+        "num_multitracks": 0,
+    },
+    "billboard": {
+        "module": "mirdata.datasets.billboard",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 978463,
+        "num_tracks": 890,
+        "num_multitracks": 0,
+    },
+    "cante100": {
+        "module": "mirdata.datasets.cante100",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 57600,
+        "num_tracks": 100,
+        "num_multitracks": 0,
+    },
+    "compmusic_otmm_makam": {
+        "module": "mirdata.datasets.compmusic_otmm_makam",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 412811,
+        "num_tracks": 1000,
+        "num_multitracks": 0,
+    },
+    "dali": {
+        "module": "mirdata.datasets.dali",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 1602201,
+        "num_tracks": 5358,
+        "num_multitracks": 0,
+    },
+    "giantsteps_key": {
+        "module": "mirdata.datasets.giantsteps_key",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 264004,
+        "num_tracks": 600,
+        "num_multitracks": 0,
+    },
+    "giantsteps_tempo": {
+        "module": "mirdata.datasets.giantsteps_tempo",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 333808,
+        "num_tracks": 664,
+        "num_multitracks": 0,
+    },
+    "groove_midi": {
+        "module": "mirdata.datasets.groove_midi",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 328995,
+        "num_tracks": 1150,
+        "num_multitracks": 0,
+    },
+    "gtzan_genre": {
+        "module": "mirdata.datasets.gtzan_genre",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 149239,
+        "num_tracks": 1000,
+        "num_multitracks": 0,
+    },
+    "guitarset": {
+        "module": "mirdata.datasets.guitarset",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 249306,
+        "num_tracks": 360,
+        "num_multitracks": 0,
+    },
+    "ikala": {
+        "module": "mirdata.datasets.ikala",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 86543,
+        "num_tracks": 252,
+        "num_multitracks": 0,
+    },
+    "irmas": {
+        "module": "mirdata.datasets.irmas",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 2897523,
+        "num_tracks": 9534,
+        "num_multitracks": 0,
+    },
+    "maestro": {
+        "module": "mirdata.datasets.maestro",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 515110,
+        "num_tracks": 1282,
+        "num_multitracks": 0,
+    },
+    "medley_solos_db": {
+        "module": "mirdata.datasets.medley_solos_db",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 4401861,
+        "num_tracks": 21571,
+        "num_multitracks": 0,
+    },
+    "medleydb_melody": {
+        "module": "mirdata.datasets.medleydb_melody",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 57756,
+        "num_tracks": 108,
+        "num_multitracks": 0,
+    },
+    "medleydb_pitch": {
+        "module": "mirdata.datasets.medleydb_pitch",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 30077,
+        "num_tracks": 103,
+        "num_multitracks": 0,
+    },
+    "mridangam_stroke": {
+        "module": "mirdata.datasets.mridangam_stroke",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 1118578,
+        "num_tracks": 6976,
+        "num_multitracks": 0,
+    },
+    "orchset": {
+        "module": "mirdata.datasets.orchset",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 27470,
+        "num_tracks": 64,
+        "num_multitracks": 0,
+    },
+    "phenicx_anechoic": {
+        "module": "mirdata.datasets.phenicx_anechoic",
+        "has_tracks": True,
+        "has_multitracks": True,
+        "remote_index": False,
+        "index_size": 22571,
+        "num_tracks": 38,
+        "num_multitracks": 4,
+    },
+    "rwc_classical": {
+        "module": "mirdata.datasets.rwc_classical",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 24663,
+        "num_tracks": 61,
+        "num_multitracks": 0,
+    },
+    "rwc_jazz": {
+        "module": "mirdata.datasets.rwc_jazz",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 20171,
+        "num_tracks": 50,
+        "num_multitracks": 0,
+    },
+    "rwc_popular": {
+        "module": "mirdata.datasets.rwc_popular",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 70094,
+        "num_tracks": 100,
+        "num_multitracks": 0,
+    },
+    "salami": {
+        "module": "mirdata.datasets.salami",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 1046889,
+        "num_tracks": 1359,
+        "num_multitracks": 0,
+    },
+    "saraga_carnatic": {
+        "module": "mirdata.datasets.saraga_carnatic",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 555575,
+        "num_tracks": 249,
+        "num_multitracks": 0,
+    },
+    "saraga_hindustani": {
+        "module": "mirdata.datasets.saraga_hindustani",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 145758,
+        "num_tracks": 108,
+        "num_multitracks": 0,
+    },
+    "tinysol": {
+        "module": "mirdata.datasets.tinysol",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 497182,
+        "num_tracks": 2913,
+        "num_multitracks": 0,
+    },
+    "tonality_classicaldb": {
+        "module": "mirdata.datasets.tonality_classicaldb",
+        "has_tracks": True,
+        "has_multitracks": False,
+        "remote_index": False,
+        "index_size": 705823,
+        "num_tracks": 881,
+        "num_multitracks": 0,
+    },
+}
@@ -0,0 +1,37 @@
+"""Record the sample rate, number of channels and length of each audio file
+in the json indexes of downloaded datasets.
+
+Example:
+    python scripts/add_audio_info.py orchset --data-home ~/mir_datasets/orchset
+"""
+
+import argparse
+import importlib
+import json
+
+from mirdata import index_utils
+
+
+def main(args):
+    module = importlib.import_module("mirdata.datasets.{}".format(args.dataset))
+    dataset = module.Dataset(data_home=args.data_home)
+    with open(dataset.index_path) as fhandle:
+        index = json.load(fhandle)
+    index_utils.add_audio_info(index, dataset.data_home)
+    with open(dataset.index_path, "w") as fhandle:
+        json.dump(index, fhandle, indent=2)
+    print(dataset.index_path)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Record audio file information in a dataset's json index."
+    )
+    PARSER.add_argument("dataset", type=str, help="Name of the dataset.")
+    PARSER.add_argument(
+        "--data-home",
+        type=str,
+        default=None,
+        help="Path where the dataset is stored. Default: mirdata's default.",
+    )
+    main(PARSER.parse_args())
@@ -0,0 +1,113 @@
+"""Measure audio decoding throughput of each mirdata audio backend.
+
+Decodes every audio file found under a directory (by default the test
+resources) with each backend, and reports the decoded audio duration per
+second of decoding time.
+
+Example:
+    python scripts/benchmark_audio_backends.py --sr 22050
+"""
+
+import argparse
+import glob
+import os
+import time
+import warnings
+
+from mirdata import audio_utils
+
+
+def decodable(audio_path, backends):
+    """Check if all backends can decode an audio file
+
+    Args:
+        audio_path (str): path to the audio file
+        backends (list): backend names
+
+    Returns:
+        bool: True if every backend decodes the file
+
+    """
+    for backend in backends:
+        try:
+            audio_utils.BACKENDS[backend](audio_path, True)
+        except Exception:
+            return False
+    return True
+
+
+def benchmark_backend(backend, audio_paths, sr, mono, n_repeats):
+    """Decode audio files with a single backend
+
+    Args:
+        backend (str): backend name
+        audio_paths (list): paths of the audio files
+        sr (int or None): sample rate to resample to
+        mono (bool): if True, load mono audio
+        n_repeats (int): number of times each file is decoded
+
+    Returns:
+        float: seconds of audio decoded per second
+
+    """
+    audio_utils.set_backend(backend)
+    audio_seconds = 0.0
+    start = time.perf_counter()
+    for audio_path in audio_paths:
+        for _ in range(n_repeats):
+            y, y_sr = audio_utils.load(audio_path, sr=sr, mono=mono)
+        audio_seconds += n_repeats * y.shape[-1] / float(y_sr)
+    elapsed = time.perf_counter() - start
+    audio_utils.set_backend(None)
+    return audio_seconds / elapsed
+
+
+def main(args):
+    warnings.simplefilter("ignore")
+    backends = list(audio_utils.BACKENDS)
+    audio_paths = sorted(
+        path
+        for extension in args.extensions
+        for path in glob.glob(
+            os.path.join(args.audio_dir, "**", "*.{}".format(extension)),
+            recursive=True,
+        )
+    )
+    # compare the backends on the files all of them can decode
+    audio_paths = [path for path in audio_paths if decodable(path, backends)]
+    print("{} audio files in {}".format(len(audio_paths), args.audio_dir))
+    print("{:<12}{:>24}".format("backend", "audio seconds / second"))
+    for backend in backends:
+        throughput = benchmark_backend(
+            backend, audio_paths, args.sr, not args.multichannel, args.n_repeats
+        )
+        print("{:<12}{:>24.0f}".format(backend, throughput))
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Measure audio decoding throughput of each audio backend."
+    )
+    PARSER.add_argument(
+        "--audio-dir",
+        type=str,
+        default="tests/resources",
+        help="Directory searched recursively for audio files.",
+    )
+    PARSER.add_argument(
+        "--extensions",
+        type=str,
+        nargs="+",
+        default=["wav"],
+        help="Audio file extensions to benchmark. Default: wav.",
+    )
+    PARSER.add_argument(
+        "--sr", type=int, default=None, help="Sample rate to resample to."
+    )
+    PARSER.add_argument(
+        "--multichannel", action="store_true", help="Load all channels."
+    )
+    PARSER.add_argument(
+        "--n-repeats", type=int, default=5, help="Times each file is decoded."
+    )
+    main(PARSER.parse_args())
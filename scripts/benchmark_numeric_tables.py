@@ -0,0 +1,117 @@
+"""Compare the numeric table loaders against a csv.reader / float() baseline.
+
+For each ported loader, writes an hour-long synthetic F0 file at a 128-sample
+hop in the loader's format, and times loading it with the loader and with a
+per-field python parser.
+
+Example:
+    python scripts/benchmark_numeric_tables.py --duration 3600
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from mirdata.datasets import cante100
+from mirdata.datasets import compmusic_otmm_makam
+from mirdata.datasets import ikala
+from mirdata.datasets import medleydb_pitch
+from mirdata.datasets import orchset
+from mirdata.datasets import saraga_carnatic
+from mirdata.datasets import saraga_hindustani
+
+HOP = 128
+SR = 44100
+
+# name: (loader, delimiter, number of columns)
+LOADERS = {
+    "orchset.load_melody": (orchset.load_melody, "\t", 2),
+    "medleydb_pitch.load_pitch": (medleydb_pitch.load_pitch, ",", 2),
+    "compmusic_otmm_makam.load_pitch": (compmusic_otmm_makam.load_pitch, ",", 1),
+    "saraga_carnatic.load_pitch": (saraga_carnatic.load_pitch, "\t", 2),
+    "saraga_hindustani.load_pitch": (saraga_hindustani.load_pitch, "\t", 2),
+    "cante100.load_melody": (cante100.load_melody, ",", 2),
+    "ikala.load_f0": (ikala.load_f0, None, 1),
+}
+
+
+def write_table(path, delimiter, n_columns, duration):
+    """Write a synthetic F0 table
+
+    Args:
+        path (str): output path
+        delimiter (str or None): field delimiter, None for one value per line
+        n_columns (int): 1 for frequencies only, 2 for times and frequencies
+        duration (float): duration in seconds
+
+    """
+    n_frames = int(duration * SR / HOP)
+    times = np.arange(n_frames) * HOP / SR
+    freqs = 220.0 * 2 ** np.sin(times)
+    freqs[::7] = 0.0
+    columns = [times, freqs] if n_columns == 2 else [freqs]
+    np.savetxt(path, np.stack(columns, axis=1), fmt="%.6f", delimiter=delimiter or " ")
+
+
+def baseline(path, delimiter, n_columns):
+    """Parse a table with csv.reader and float(), as the loaders used to"""
+    with open(path, "r") as fhandle:
+        columns = [[] for _ in range(n_columns)]
+        reader = csv.reader(fhandle, delimiter=delimiter or " ")
+        for line in reader:
+            for column, value in zip(columns, line):
+                column.append(float(value))
+    return [np.array(column) for column in columns]
+
+
+def main(args):
+    print(
+        "{:<34}{:>10}{:>14}{:>14}{:>10}".format(
+            "loader", "frames", "baseline (s)", "loader (s)", "speedup"
+        )
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (loader, delimiter, n_columns) in LOADERS.items():
+            path = os.path.join(tmpdir, "{}.txt".format(name))
+            write_table(path, delimiter, n_columns, args.duration)
+            base_time = min(
+                timeit.repeat(
+                    lambda: baseline(path, delimiter, n_columns),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            loader_time = min(
+                timeit.repeat(
+                    lambda: loader(path),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            print(
+                "{:<34}{:>10}{:>14.3f}{:>14.3f}{:>9.1f}x".format(
+                    name,
+                    int(args.duration * SR / HOP),
+                    base_time,
+                    loader_time,
+                    base_time / loader_time,
+                )
+            )
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(description="Benchmark the numeric table loaders.")
+    PARSER.add_argument(
+        "--duration",
+        type=float,
+        default=3600.0,
+        help="Duration of the synthetic annotations in seconds. Default: 1 hour.",
+    )
+    PARSER.add_argument(
+        "--repeat", type=int, default=3, help="Number of timing repetitions."
+    )
+    main(PARSER.parse_args())
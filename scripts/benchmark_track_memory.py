@@ -0,0 +1,82 @@
+"""Measure the memory used per Track object when loading all tracks of a dataset.
+
+Example:
+    python scripts/benchmark_track_memory.py medley_solos_db saraga_carnatic
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+import mirdata
+from mirdata import core
+
+
+def track_memory(dataset, n_tracks=None):
+    """Measure the memory allocated per Track when creating tracks
+
+    Args:
+        dataset (core.Dataset): a dataset with a local index
+        n_tracks (int or None): number of tracks to create. Default: all.
+
+    Returns:
+        * float - bytes per Track handle
+        * float - bytes per Track after resolving all of its paths into
+          strings, as when paths were set in Track.__init__
+
+    """
+    track_ids = dataset.track_ids[:n_tracks]
+    path_attributes = [
+        name
+        for name in dir(dataset._track_class)
+        if isinstance(getattr(dataset._track_class, name), core.track_path)
+    ]
+    dataset.track(track_ids[0])  # warm up class-level caches
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    tracks = [dataset.track(track_id) for track_id in track_ids]
+    handles = tracemalloc.get_traced_memory()[0] - start
+    resolved = [[getattr(track, name) for name in path_attributes] for track in tracks]
+    with_paths = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del resolved
+    return handles / len(tracks), with_paths / len(tracks)
+
+
+def main(args):
+    dataset_names = args.datasets if args.datasets else mirdata.list_datasets()
+    print(
+        "{:<24}{:>10}{:>16}{:>22}".format(
+            "dataset", "tracks", "bytes/track", "bytes/track w/ paths"
+        )
+    )
+    for dataset_name in dataset_names:
+        info = mirdata.dataset_info(dataset_name)
+        if not info["has_tracks"] or info["remote_index"]:
+            continue
+        dataset = mirdata.initialize(dataset_name)
+        handles, with_paths = track_memory(dataset, args.n_tracks)
+        n_tracks = min(info["num_tracks"], args.n_tracks or info["num_tracks"])
+        print(
+            "{:<24}{:>10}{:>16.0f}{:>22.0f}".format(
+                dataset_name, n_tracks, handles, with_paths
+            )
+        )
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Measure the memory used per Track object."
+    )
+    PARSER.add_argument(
+        "datasets", type=str, nargs="*", help="Datasets to measure. Default: all."
+    )
+    PARSER.add_argument(
+        "--n-tracks",
+        type=int,
+        default=None,
+        help="Number of tracks to create per dataset. Default: all.",
+    )
+    main(PARSER.parse_args())
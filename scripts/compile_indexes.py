@@ -0,0 +1,45 @@
+import argparse
+import importlib
+
+import mirdata
+from mirdata import index_utils
+
+
+def main(args):
+    if args.index_path is not None:
+        print(index_utils.compile_index(args.index_path))
+        return
+
+    dataset_names = args.datasets if args.datasets else mirdata.list_datasets()
+    for dataset_name in dataset_names:
+        module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
+        dataset = module.Dataset(data_home=args.data_home)
+        if dataset.remote_index and args.data_home is None:
+            print("{}: skipping remote index, pass --data-home".format(dataset_name))
+            continue
+        output_path = index_utils.compile_index(
+            dataset.index_path, shard_key=dataset._index_shard_key
+        )
+        print("{}: {}".format(dataset_name, output_path))
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Compile json indexes into memory-mappable binary indexes."
+    )
+    PARSER.add_argument(
+        "datasets", type=str, nargs="*", help="Datasets to compile. Default: all."
+    )
+    PARSER.add_argument(
+        "--data-home",
+        type=str,
+        default=None,
+        help="Dataset data_home, needed for datasets with remote indexes.",
+    )
+    PARSER.add_argument(
+        "--index-path",
+        type=str,
+        default=None,
+        help="Compile a single json index file instead of dataset indexes.",
+    )
+    main(PARSER.parse_args())
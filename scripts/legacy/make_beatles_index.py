@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 BEATLES_INDEX_PATH = '../mir_dataset_loaders/indexes/beatles_index.json'
@@ -89,6 +90,10 @@ def make_beatles_index(data_path):
                     'keys': (annot_rels[2], annot_checksum[2]),
                     'sections': (annot_rels[3], annot_checksum[3]),
                 }
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": beatles_index}, os.path.join(data_path, 'Beatles')
+    )
     with open(BEATLES_INDEX_PATH, 'w') as fhandle:
         json.dump(beatles_index, fhandle, indent=2)
 
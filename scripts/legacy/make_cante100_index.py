@@ -3,6 +3,7 @@ import collections
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 CANTE100_INDEX_PATH = '../mirdata/datasets/indexes/cante100_index.json'
@@ -74,6 +75,8 @@ def make_cante100_index(cante100_data_path):
             'notes': (inst[3], notes_checksum)
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": cante100_index}, cante100_data_path)
     with open(CANTE100_INDEX_PATH, 'w') as fhandle:
         json.dump(cante100_index, fhandle, indent=2)
 
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 DALI_INDEX_PATH = '../mirdata/indexes/dali_index.json'
 
@@ -42,6 +43,8 @@ def make_dali_index(data_path):
         )
         dali_index[trackid]['annot'].append(annot_checksum)
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": dali_index}, data_path)
     with open(DALI_INDEX_PATH, 'w') as fhandle:
         json.dump(dali_index, fhandle, indent=2)
 
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 giantsteps_key_INDEX_PATH = '../mirdata/indexes/giantsteps_key_index.json'
@@ -47,6 +48,8 @@ def make_giantsteps_key_index(data_path):
                 'meta': meta,
                 'key': (chord_path.replace(data_path + '/', ''), md5(chord_path)),
             }
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": giantsteps_key_index}, data_path)
     with open(giantsteps_key_INDEX_PATH, 'w') as fhandle:
         json.dump(giantsteps_key_index, fhandle, indent=2)
 
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 giantsteps_tempo_INDEX_PATH = '../mirdata/indexes/giantsteps_tempo_index.json'
@@ -45,6 +46,8 @@ def make_giantsteps_tempo_index(data_path):
                 'annotation_v1': (ann1_path.replace(data_path + '/', ''), md5(ann1_path)),
                 'annotation_v2': (ann2_path.replace(data_path + '/', ''), md5(ann2_path)),
             }
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": giantsteps_tempo_index}, data_path)
     with open(giantsteps_tempo_INDEX_PATH, 'w') as fhandle:
         json.dump(giantsteps_tempo_index, fhandle, indent=2)
 
@@ -3,6 +3,7 @@ import hashlib
 import json
 import csv
 import os
+from mirdata import index_utils
 
 
 GROOVE_MIDI_INDEX_PATH = '../mirdata/indexes/groove_midi_index.json'
@@ -51,6 +52,8 @@ def make_groove_midi_index(data_path):
             else:
                 groove_index[trackid]['audio'] = [None, None]
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": groove_index}, data_path)
     with open(GROOVE_MIDI_INDEX_PATH, 'w') as fhandle:
         json.dump(groove_index, fhandle, indent=2)
 
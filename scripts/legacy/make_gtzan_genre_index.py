@@ -11,6 +11,7 @@ GTZAN_GENRE_INDEX_PATH = os.path.join(
 
 sys.path.append(os.path.join(SCRIPT_DIR, "mirdata"))
 from mirdata.utils import md5
+from mirdata import index_utils
 
 
 def make_gtzan_genre_index(data_path):
@@ -25,6 +26,10 @@ def make_gtzan_genre_index(data_path):
         audio_path = os.path.join("gtzan_genre/genres", path)
         index[track_key] = {"audio": [audio_path, checksum]}
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": index}, os.path.join(data_path, os.pardir, os.pardir)
+    )
     with open(GTZAN_GENRE_INDEX_PATH, "w") as f:
         json.dump(index, f, indent=2)
 
@@ -3,6 +3,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 GUITARSET_INDEX_PATH = '../mirdata/indexes/guitarset_index.json'
@@ -74,6 +75,8 @@ def make_guitarset_index(guitarset_data_path):
             'jams': ('annotation/{}.jams'.format(track_id), annotation_checksum),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": guitarset_index}, guitarset_data_path)
     with open(GUITARSET_INDEX_PATH, 'w') as fhandle:
         json.dump(guitarset_index, fhandle, indent=2)
 
@@ -3,6 +3,7 @@ import glob
 import json
 import os
 from mirdata.utils import md5
+from mirdata import index_utils
 
 IKALA_INDEX_PATH = "../mirdata/datasets/indexes/ikala_index.json"
 
@@ -42,6 +43,7 @@ def make_ikala_index(ikala_data_path):
     ikala_index.update(index_metadata)
     ikala_index.update({"tracks": index_tracks})
 
+    index_utils.add_audio_info(ikala_index, ikala_data_path)
     with open(IKALA_INDEX_PATH, 'w') as fhandle:
         json.dump(ikala_index, fhandle, indent=2)
 
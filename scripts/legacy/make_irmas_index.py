@@ -3,6 +3,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 IRMAS_INDEX_PATH = '../mirdata/indexes/irmas_index.json'
@@ -113,6 +114,8 @@ def make_irmas_index(irmas_data_path):
         }
         index += 1
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": irmas_index}, irmas_data_path)
     with open(IRMAS_INDEX_PATH, 'w') as fhandle:
         json.dump(irmas_index, fhandle, indent=2)
 
@@ -151,6 +154,8 @@ def make_irmas_test_index(irmas_data_path):
         }
         index += 1
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": irmas_index}, irmas_data_path)
     with open(IRMAS_TEST_INDEX_PATH, 'w') as fhandle:
         json.dump(irmas_index, fhandle, indent=2)
 
@@ -3,6 +3,7 @@ import hashlib
 import json
 import csv
 import os
+from mirdata import index_utils
 
 
 MAESTRO_INDEX_PATH = '../mirdata/indexes/maestro_index.json'
@@ -49,6 +50,8 @@ def make_maestro_index(data_path):
             audio_checksum = md5(audio_path)
             maestro_index[trackid]['audio'] = [row['audio_filename'], audio_checksum]
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": maestro_index}, data_path)
     with open(MAESTRO_INDEX_PATH, 'w') as fhandle:
         json.dump(maestro_index, fhandle, indent=2)
 
@@ -4,6 +4,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 MEDLEY_SOLOS_DB_INDEX_PATH = '../mirdata/indexes/medley_solos_db_index.json'
@@ -59,6 +60,10 @@ def make_medley_solos_db_index(medley_solos_db_data_path):
                 "audio": (wav_name, audio_checksum),
             }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": medley_solos_db_index}, medley_solos_db_data_path
+    )
     with open(MEDLEY_SOLOS_DB_INDEX_PATH, 'w') as fhandle:
         json.dump(medley_solos_db_index, fhandle, indent=2)
 
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 MEDLEYDB_MELODY_INDEX_PATH = '../mirdata/indexes/medleydb_melody_index.json'
@@ -65,6 +66,10 @@ def make_medleydb_melody_index(data_path):
             ),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": melody_index}, os.path.join(data_path, 'MedleyDB-Melody')
+    )
     with open(MEDLEYDB_MELODY_INDEX_PATH, 'w') as fhandle:
         json.dump(melody_index, fhandle, indent=2)
 
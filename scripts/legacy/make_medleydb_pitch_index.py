@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 MEDLEYDB_PITCH_INDEX_PATH = '../mirdata/indexes/medleydb_pitch_index.json'
@@ -51,6 +52,10 @@ def make_medleydb_pitch_index(data_path):
             'pitch': (strip_first_dir(metadata[trackid]['pitch_path']), pitch_checksum),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": pitch_index}, os.path.join(data_path, 'MedleyDB-Pitch')
+    )
     with open(MEDLEYDB_PITCH_INDEX_PATH, 'w') as fhandle:
         json.dump(pitch_index, fhandle, indent=2)
 
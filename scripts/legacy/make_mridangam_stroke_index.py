@@ -3,6 +3,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 MRIDANGAM_INDEX_PATH = '../mirdata/indexes/mridangam_stroke_index.json'
@@ -54,6 +55,10 @@ def make_mridangam_index(mridangam_data_path):
             'audio': (rel_path, audio_checksum),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": mridangam_index}, os.path.join(mridangam_data_path, os.pardir)
+    )
     with open(MRIDANGAM_INDEX_PATH, 'w') as fhandle:
         json.dump(mridangam_index, fhandle, indent=2)
 
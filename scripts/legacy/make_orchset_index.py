@@ -3,6 +3,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 ORCHSET_INDEX_PATH = '../mirdata/indexes/orchset_index.json'
 
@@ -54,6 +55,8 @@ def make_orchset_index(data_path):
             'melody': ('GT/{}.mel'.format(track_id), melody_checksum),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": index}, data_path)
     with open(ORCHSET_INDEX_PATH, 'w') as fhandle:
         json.dump(index, fhandle, indent=2)
 
@@ -3,6 +3,7 @@ import hashlib
 import json
 import os
 import csv
+from mirdata import index_utils
 
 RWC_CLASSICAL_INDEX_PATH = "../mirdata/datasets/indexes/rwc_classical_index.json"
 
@@ -102,6 +103,10 @@ def make_rwc_classical_index(data_path):
             'beats': (annot_rels[1], annot_checksum[1]),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": rwc_classical_index}, os.path.join(data_path, 'rwc_classical')
+    )
     with open(RWC_CLASSICAL_INDEX_PATH, 'w') as fhandle:
         json.dump(rwc_classical_index, fhandle, indent=2)
 
@@ -3,6 +3,7 @@ import hashlib
 import json
 import os
 import csv
+from mirdata import index_utils
 
 RWC_JAZZ_INDEX_PATH = "../mirdata/indexes/rwc_jazz_index.json"
 
@@ -107,6 +108,10 @@ def make_rwc_jazz_index(data_path):
             'beats': (annot_rels[1], annot_checksum[1]),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": rwc_jazz_index}, os.path.join(data_path, 'RWC-Jazz')
+    )
     with open(RWC_JAZZ_INDEX_PATH, 'w') as fhandle:
         json.dump(rwc_jazz_index, fhandle, indent=2)
 
@@ -3,6 +3,7 @@ import hashlib
 import json
 import os
 import csv
+from mirdata import index_utils
 
 
 RWC_POPULAR_INDEX_PATH = "../mirdata/indexes/rwc_popular_index.json"
@@ -153,6 +154,10 @@ def make_rwc_popular_index(data_path):
             'voca_inst': (annot_rels[3], annot_checksum[3]),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": rwc_popular_index}, os.path.join(data_path, 'RWC-Popular')
+    )
     with open(RWC_POPULAR_INDEX_PATH, 'w') as fhandle:
         json.dump(rwc_popular_index, fhandle, indent=2)
 
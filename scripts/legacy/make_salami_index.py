@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 SALAMI_INDEX_PATH = '../mirdata/indexes/salami_index.json'
@@ -83,6 +84,10 @@ def make_salami_index(data_path):
             'annotator_2_lowercase': (annot_rels[3], annot_checksum[3]),
         }
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info(
+        {"tracks": salami_index}, os.path.join(data_path, 'Salami')
+    )
     with open(SALAMI_INDEX_PATH, 'w') as fhandle:
         json.dump(salami_index, fhandle, indent=2)
 
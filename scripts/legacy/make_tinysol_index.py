@@ -4,6 +4,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata import index_utils
 
 
 TINYSOL_INDEX_PATH = '../mirdata/datasets/indexes/tinysol_index.json'
@@ -45,6 +46,8 @@ def make_tinysol_index(tinysol_data_path):
             key = os.path.splitext(os.path.split(local_path)[1])[0]
             tinysol_index[key] = {"audio": (os.path.join("audio",local_path), audio_checksum)}
 
+    # legacy indexes are not split into sections
+    index_utils.add_audio_info({"tracks": tinysol_index}, tinysol_data_path)
     with open(TINYSOL_INDEX_PATH, 'w') as fhandle:
         json.dump(tinysol_index, fhandle, indent=2)
 
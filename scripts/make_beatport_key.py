@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 from mirdata.validate import md5
 
 
@@ -33,6 +34,7 @@ def make_beatport_key_index(data_path):
                 'meta': meta,
                 'key': (chord_path.replace(data_path + '/', ''), md5(chord_path)),
             }
+    index_utils.add_audio_info(beatport_key_index, data_path)
     with open(beatport_key_INDEX_PATH, 'w') as fhandle:
         json.dump(beatport_key_index, fhandle, indent=2)
 
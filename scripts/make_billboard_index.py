@@ -3,6 +3,7 @@ import hashlib
 import json
 import os
 import csv
+from mirdata import index_utils
 from mirdata.validate import md5
 
 
@@ -104,6 +105,8 @@ def make_index(data_path):
                         ),
                     }
 
+    index_utils.add_audio_info(index, data_path)
+
     with open(INDEX_PATH, "w") as fhandle:
         json.dump(index, fhandle, indent=2)
 
@@ -4,6 +4,7 @@ import hashlib
 import json
 import os
 import string
+from mirdata import index_utils
 from mirdata.validate import md5
 
 DATASET_INDEX_PATH = '../mirdata/datasets/indexes/phenicx_anechoic_index.json'
@@ -119,6 +120,8 @@ def make_dataset_index(data_path):
                 score_original_checksum,
             )
 
+    index_utils.add_audio_info(index, data_path)
+
     with open(DATASET_INDEX_PATH, 'w') as fhandle:
         json.dump(index, fhandle, indent=2)
 
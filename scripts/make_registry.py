@@ -0,0 +1,118 @@
+"""Generate mirdata/registry.py, the static registry of mirdata datasets.
+
+Run this script after adding or removing a dataset loader, or after
+updating a dataset's index.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+
+import mirdata
+
+MIRDATA_DIR = os.path.dirname(os.path.abspath(mirdata.__file__))
+REGISTRY_PATH = os.path.join(MIRDATA_DIR, "registry.py")
+
+HEADER = '''"""Static registry of mirdata datasets
+
+Generated by scripts/make_registry.py, do not edit by hand.
+
+Maps each dataset name to its loader module and to information about the
+dataset which can be queried without importing the module.
+"""
+
+DATASETS = {
+'''
+
+
+def dataset_entry(dataset_name):
+    """Describe a dataset by importing its loader module and reading its index
+
+    Args:
+        dataset_name (str): the dataset's name
+
+    Returns:
+        dict: the dataset's registry entry
+
+    """
+    module_name = "mirdata.datasets.{}".format(dataset_name)
+    dataset = importlib.import_module(module_name).Dataset()
+    entry = {
+        "module": module_name,
+        "has_tracks": dataset._track_class is not None,
+        "has_multitracks": dataset._multitrack_class is not None,
+        "remote_index": dataset.remote_index,
+        "index_size": None,
+        "num_tracks": None,
+        "num_multitracks": None,
+    }
+    if not dataset.remote_index:
+        with open(dataset.index_path) as fhandle:
+            index = json.load(fhandle)
+        entry["index_size"] = os.path.getsize(dataset.index_path)
+        entry["num_tracks"] = len(index.get("tracks", {}))
+        entry["num_multitracks"] = len(index.get("multitracks", {}))
+    return entry
+
+
+def build_registry():
+    """Describe every dataset module in mirdata/datasets
+
+    Returns:
+        dict: dataset name to registry entry
+
+    """
+    names = sorted(
+        module.name
+        for module in pkgutil.iter_modules([os.path.join(MIRDATA_DIR, "datasets")])
+    )
+    return {name: dataset_entry(name) for name in names}
+
+
+def _format_value(value):
+    if value is None or isinstance(value, bool):
+        return repr(value)
+    return json.dumps(value)
+
+
+def format_registry(registry):
+    """Format a registry as the source of mirdata/registry.py
+
+    Args:
+        registry (dict): dataset name to registry entry
+
+    Returns:
+        str: python source
+
+    """
+    lines = [HEADER]
+    for name, entry in registry.items():
+        lines.append("    {}: {{\n".format(json.dumps(name)))
+        for key, value in entry.items():
+            lines.append(
+                "        {}: {},\n".format(json.dumps(key), _format_value(value))
+            )
+        lines.append("    },\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main(args):
+    with open(args.output_path, "w") as fhandle:
+        fhandle.write(format_registry(build_registry()))
+    print(args.output_path)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Generate the static registry of mirdata datasets."
+    )
+    PARSER.add_argument(
+        "--output-path",
+        type=str,
+        default=REGISTRY_PATH,
+        help="Path of the generated registry. Default: mirdata/registry.py.",
+    )
+    main(PARSER.parse_args())
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 from mirdata.validate import md5
 
 
@@ -80,6 +81,8 @@ def make_saraga_hindustani_index(dataset_data_path):
 
                     idx = idx + 1
 
+    index_utils.add_audio_info(saraga_index, dataset_data_path_prev)
+
     with open(SARAGA_HINDUSTANI_INDEX_PATH, 'w') as fhandle:
         json.dump(saraga_index, fhandle, indent=2)
 
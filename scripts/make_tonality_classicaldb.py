@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata import index_utils
 from mirdata.validate import md5
 
 
@@ -33,6 +34,7 @@ def make_classicalDB_index(data_path):
                 'mb': (mb_path.replace(data_path + '/', ''), md5(mb_path)),
                 'HPCP': (HPCP_path.replace(data_path + '/', ''), md5(HPCP_path))
             }
+    index_utils.add_audio_info(classicalDB_index, data_path)
     with open(classicalDB_INDEX_PATH, 'w') as fhandle:
         json.dump(classicalDB_index, fhandle, indent=2)
 
@@ -35,7 +35,9 @@ def get_attributes_and_properties(class_instance):
             continue
 
         attr = getattr(class_instance.__class__, val)
-        if isinstance(attr, mirdata.core.cached_property):
+        if mirdata.core.is_track_attribute(attr):
+            continue
+        elif isinstance(attr, mirdata.core.cached_property):
             cached_properties.append(val)
         elif isinstance(attr, property):
             properties.append(val)
@@ -50,7 +52,8 @@ def get_attributes_and_properties(class_instance):
     for val in dir(class_instance):
         if val.startswith("_"):
             continue
-        if val not in non_attributes:
+        # unset slots (e.g. a MultiTrack's track_id) are listed by dir
+        if val not in non_attributes and hasattr(class_instance, val):
             attributes.append(val)
     return {
         "attributes": sorted(attributes),
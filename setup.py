@@ -33,6 +33,8 @@ if __name__ == "__main__":
         install_requires=[
             "tqdm",
             "librosa >= 0.8.0",
+            "soxr",
+            "soundfile",
             "numpy>=1.16",
             "jams",
             "requests",
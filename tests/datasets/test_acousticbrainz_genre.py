@@ -1,7 +1,10 @@
+import json
 import os
 import shutil
 
-from mirdata import download_utils
+import pytest
+
+from mirdata import download_utils, index_utils
 from mirdata.datasets import acousticbrainz_genre
 from tests.test_utils import run_track_tests
 
@@ -79,6 +82,117 @@ def test_filter_index():
     assert len(index) == 2
 
 
+def test_filter_index_shards(tmp_path):
+    data_home = "tests/resources/mir_datasets/acousticbrainz_genre"
+    dataset = acousticbrainz_genre.Dataset(data_home)
+    scanned = {
+        k: v for k, v in dataset._index["tracks"].items() if "tagtraum#train#" in k
+    }
+    assert dataset.load_tagtraum_train() == scanned
+
+    # the legacy methods return plain dictionaries
+    train = dataset.load_tagtraum_train()
+    assert type(train) is dict
+    train["new"] = {}
+    assert "new" not in dataset.load_tagtraum_train()
+    json.dumps(dataset.load_all_train())
+
+    # views are read-only and do not copy the shards
+    view = dataset.filter_index_view("tagtraum#train#")
+    assert view.items() == dataset._index_shards["tagtraum#train"].items()
+    with pytest.raises(TypeError):
+        view["new"] = {}
+    all_train = dataset.filter_index_view("#train#")
+    assert len(all_train) == 8
+    assert dict(all_train) == dataset.load_all_train()
+    assert set(all_train) == {
+        k for k in dataset._index["tracks"] if k.split("#")[1] == "train"
+    }
+    assert next(iter(all_train)) in all_train
+    assert "~faketrackid~" not in all_train
+    with pytest.raises(KeyError):
+        all_train["~faketrackid~"]
+    with pytest.raises(TypeError):
+        del all_train[next(iter(all_train))]
+    assert dict(dataset.filter_index_view("#trance#")) == dataset.filter_index(
+        "#trance#"
+    )
+
+    # partial source names are not shards, and scan the index
+    for search_key in ["fm#train#", "gtraum#validation#", "#trance#"]:
+        scanned = {k: v for k, v in dataset._index["tracks"].items() if search_key in k}
+        assert scanned
+        assert dataset.filter_index(search_key) == scanned
+        assert dict(dataset.filter_index_view(search_key)) == scanned
+
+    assert set(dataset._index_shards.keys()) == {
+        "tagtraum#train",
+        "tagtraum#validation",
+        "lastfm#train",
+        "lastfm#validation",
+        "allmusic#train",
+        "allmusic#validation",
+        "discogs#train",
+        "discogs#validation",
+    }
+
+    # search keys which are not shards scan the index
+    index = dataset.filter_index("#trance#")
+    assert len(index) == 1
+
+    # a sharded compiled index gives the same results
+    compiled_path = str(tmp_path / "acousticbrainz_genre_index.mirdx")
+    index_utils.compile_index(
+        dataset.index_path,
+        compiled_path,
+        shard_key=acousticbrainz_genre.index_shard,
+    )
+    compiled_dataset = acousticbrainz_genre.Dataset(data_home)
+    compiled_dataset._index = index_utils.load_compiled_index(compiled_path)
+    assert compiled_dataset._index["tracks"].shards
+    assert compiled_dataset.load_all_train() == dataset.load_all_train()
+    assert compiled_dataset.load_lastfm_validation() == dataset.load_lastfm_validation()
+    assert compiled_dataset.filter_index("#trance#") == index
+    assert dict(compiled_dataset.filter_index_view("#train#")) == dict(all_train)
+
+
+def test_query_track_ids():
+    data_home = "tests/resources/mir_datasets/acousticbrainz_genre"
+    dataset = acousticbrainz_genre.Dataset(data_home)
+
+    assert dataset.query_track_ids() == sorted(dataset.track_ids)
+    assert dataset.query_track_ids(genre="trance") == [
+        "tagtraum#validation#be9e01e5-8f93-494d-bbaa-ddcc5a52f629#2b6bfcfd-46a5-3f98-a58f-2c51d7c9e960#trance########"
+    ]
+    assert dataset.query_track_ids(source="lastfm", split="train") == sorted(
+        dataset.load_lastfm_train().keys()
+    )
+    assert dataset.query_track_ids(split="validation") == sorted(
+        dataset.load_all_validation().keys()
+    )
+    assert dataset.query_track_ids(genre="rock---folk rock", split="validation") == [
+        "discogs#validation#77c17f82-4e3b-412e-af94-36abb58d6ff2#695554d3-a77d-3320-886b-60c6e56f454d#rock#rock---folk rock#rock---prog rock################"
+    ]
+    assert (
+        len(dataset.query_track_ids(mbid_group="f848a1cb-11dd-3dfc-9097-47adbeb3671f"))
+        == 2
+    )
+    assert (
+        len(dataset.query_track_ids(mbid="77a9cc42-cc81-49d8-893c-34b9a5b6559d")) == 2
+    )
+    assert dataset.query_track_ids(genre="trance", split="train") == []
+    assert dataset.query_track_ids(genre="not a genre") == []
+
+
+def test_index_shard():
+    assert (
+        acousticbrainz_genre.index_shard(
+            "tagtraum#validation#be9e01e5-8f93-494d-bbaa-ddcc5a52f629#2b6bfcfd-46a5-3f98-a58f-2c51d7c9e960#trance########"
+        )
+        == "tagtraum#validation"
+    )
+
+
 def test_download(httpserver):
 
     data_home = "tests/resources/mir_datasets/acousticbrainz_genre_download"
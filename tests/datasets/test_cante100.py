@@ -1,5 +1,8 @@
 import os
+import shutil
+
 import numpy as np
+import pytest
 
 from tests.test_utils import run_track_tests
 
@@ -192,6 +195,49 @@ def test_load_spectrum():
     assert isinstance(spectrogram[0][0], float) is True
 
 
+def test_spectrogram_frames(tmpdir):
+    data_home = str(tmpdir.join("cante100"))
+    shutil.copytree(TEST_DATA_HOME, data_home)
+    dataset = cante100.Dataset(data_home)
+    track = dataset.track("008")
+    expected = cante100.load_spectrogram(track.spectrogram_path)
+
+    # text files: only the lines in the range are parsed
+    frames = track.get_spectrogram_frames(1, 3)
+    assert frames.dtype == np.float64
+    assert np.array_equal(frames, expected[1:3])
+    assert np.array_equal(track.spectrogram, expected)
+    assert track.get_spectrogram_frames(10, 20).shape == (0, 514)
+
+    assert not cante100.is_spectrogram_converted(track.spectrogram_path)
+    dataset.convert_spectrograms(["008"])
+    assert cante100.is_spectrogram_converted(track.spectrogram_path)
+    assert os.path.exists(
+        os.path.join(
+            data_home, "cante100_spectrum", "008_PacoToronjo_Fandangos.spectrum.npy"
+        )
+    )
+
+    # converted files are memory-mapped
+    spectrogram = track.spectrogram
+    assert isinstance(spectrogram, np.memmap)
+    assert spectrogram.dtype == np.float32
+    assert np.allclose(spectrogram, expected, rtol=1e-6)
+    frames = track.get_spectrogram_frames(3)
+    assert np.array_equal(frames, spectrogram[3:])
+    assert frames.shape == (2, 514)
+    assert track.get_spectrogram_frames(10, 20).shape == (0, 514)
+
+    # the text file is used again once it is newer than the .npy file
+    npy_path = cante100.spectrogram_npy_path(track.spectrogram_path)
+    os.utime(npy_path, (0, 0))
+    assert not cante100.is_spectrogram_converted(track.spectrogram_path)
+    assert track.spectrogram.dtype == np.float64
+
+    with pytest.raises(ValueError):
+        track.get_spectrogram_frames(-1)
+
+
 def test_load_audio():
     dataset = cante100.Dataset(TEST_DATA_HOME)
     track = dataset.track("008")
@@ -1,3 +1,7 @@
+import os
+import shutil
+import time
+
 import DALI
 
 from mirdata.datasets import dali
@@ -192,3 +196,60 @@ def test_load_dali_object():
             "time": [24.42030564587644, 24.568103458468812],
         },
     ]
+
+
+def test_load_annotations(mocker):
+    data_path = (
+        "tests/resources/mir_datasets/dali/annotations/"
+        + "4b196e6c99574dd49ad00d56e132712b.gz"
+    )
+    unpickle = mocker.spy(dali.pickle, "load")
+    all_annotations = dali.load_annotations(data_path)
+    assert unpickle.call_count == 1
+
+    assert list(all_annotations.keys()) == ["notes", "words", "lines", "paragraphs"]
+    assert np.array_equal(
+        all_annotations["notes"].notes, np.array([1108.731, 1108.731, 1108.731])
+    )
+    for granularity in ["words", "lines", "paragraphs"]:
+        expected = dali.load_annotations_granularity(data_path, granularity)
+        assert np.array_equal(
+            all_annotations[granularity].intervals, expected.intervals
+        )
+        assert all_annotations[granularity].lyrics == expected.lyrics
+
+    # the track unpickles its annotation file once for all properties
+    dataset = dali.Dataset("tests/resources/mir_datasets/dali")
+    track = dataset.track("4b196e6c99574dd49ad00d56e132712b")
+    unpickle.reset_mock()
+    track.notes, track.words, track.lines, track.paragraphs, track.annotation_object
+    assert unpickle.call_count == 1
+
+
+def test_convert_annotations(tmp_path, mocker):
+    data_path = str(tmp_path / "4b196e6c99574dd49ad00d56e132712b.gz")
+    shutil.copy(
+        "tests/resources/mir_datasets/dali/annotations/"
+        + "4b196e6c99574dd49ad00d56e132712b.gz",
+        data_path,
+    )
+    expected = dali.load_annotations(data_path)
+    assert not dali.is_sidecar_current(data_path)
+
+    sidecar_path = dali.convert_annotations(data_path)
+    assert sidecar_path == str(tmp_path / "4b196e6c99574dd49ad00d56e132712b.npz")
+    assert dali.is_sidecar_current(data_path)
+
+    unpickle = mocker.spy(dali.pickle, "load")
+    loaded = dali.load_annotations(data_path)
+    assert unpickle.call_count == 0
+    for granularity in ["notes", "words", "lines", "paragraphs"]:
+        assert np.array_equal(
+            loaded[granularity].intervals, expected[granularity].intervals
+        )
+    assert np.array_equal(loaded["notes"].notes, expected["notes"].notes)
+    assert loaded["words"].lyrics == ["why", "do", "they"]
+
+    # the sidecar is ignored once the annotation file is newer
+    os.utime(data_path, (time.time() + 10, time.time() + 10))
+    assert not dali.is_sidecar_current(data_path)
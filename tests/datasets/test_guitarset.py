@@ -1,5 +1,6 @@
 import numpy as np
 import jams
+import pytest
 
 from mirdata.datasets import guitarset
 from mirdata import annotations
@@ -137,6 +138,78 @@ def test_load_notes():
     assert track.notes["e"].confidence is None
 
 
+def test_load_all_strings():
+    default_trackid = "03_BN3-119-G_solo"
+    dataset = guitarset.Dataset(TEST_DATA_HOME)
+    track = dataset.track(default_trackid)
+    contours = guitarset.load_all_pitch_contours(track.jams_path)
+    notes = guitarset.load_all_notes(track.jams_path)
+    assert list(contours.keys()) == ["E", "A", "D", "G", "B", "e"]
+    assert list(notes.keys()) == ["E", "A", "D", "G", "B", "e"]
+    for string_num, string_name in enumerate(["E", "A", "D", "G", "B", "e"]):
+        expected = guitarset.load_pitch_contour(track.jams_path, string_num)
+        if expected is None:
+            assert contours[string_name] is None
+        else:
+            assert np.array_equal(contours[string_name].times, expected.times)
+            assert np.array_equal(
+                contours[string_name].frequencies, expected.frequencies
+            )
+        expected = guitarset.load_notes(track.jams_path, string_num)
+        if expected is None:
+            assert notes[string_name] is None
+        else:
+            assert np.array_equal(notes[string_name].intervals, expected.intervals)
+            assert np.array_equal(notes[string_name].notes, expected.notes)
+
+    with pytest.raises(IOError):
+        guitarset.load_all_notes("a/fake/filepath")
+
+
+def test_jams_parsed_once(mocker):
+    default_trackid = "03_BN3-119-G_solo"
+    dataset = guitarset.Dataset(TEST_DATA_HOME)
+    track = dataset.track(default_trackid)
+    load = mocker.spy(guitarset.jams, "load")
+    track.beats
+    track.leadsheet_chords
+    track.inferred_chords
+    track.key_mode
+    track.pitch_contours
+    track.notes
+    assert load.call_count == 1
+
+    # process-wide cache, shared by tracks
+    guitarset.set_jams_cache_size(2)
+    try:
+        dataset.track(default_trackid).notes
+        dataset.track(default_trackid).beats
+        guitarset.load_chords(track.jams_path)
+        assert load.call_count == 2
+        assert len(guitarset._JAMS_CACHE) == 1
+    finally:
+        guitarset.set_jams_cache_size(0)
+    assert len(guitarset._JAMS_CACHE) == 0
+
+
+def test_load_jams_none():
+    assert guitarset.load_jams(None) is None
+    assert guitarset.load_chords(None) is None
+    assert guitarset.load_pitch_contour(None, 0) is None
+    assert guitarset.load_notes(None, 0) is None
+    assert guitarset.load_all_pitch_contours(None) is None
+    assert guitarset.load_all_notes(None) is None
+
+    # tracks without a jams file have no annotations
+    track_id = "00_BN1-129-Eb_comp"
+    index = {"tracks": {track_id: {"jams": [None, None]}}}
+    track = guitarset.Track(track_id, TEST_DATA_HOME, "guitarset", index, None)
+    assert track.beats is None
+    assert track.leadsheet_chords is None
+    assert track.key_mode is None
+    assert track.notes is None
+
+
 def test_audio_mono():
     default_trackid = "03_BN3-119-G_solo"
     dataset = guitarset.Dataset(TEST_DATA_HOME)
@@ -168,6 +241,28 @@ def test_audio_hex_cln():
     assert y.shape == (6, int(44100 * 0.5))
 
 
+def test_string_audio():
+    default_trackid = "03_BN3-119-G_solo"
+    dataset = guitarset.Dataset(TEST_DATA_HOME)
+    track = dataset.track(default_trackid)
+    hex_audio, _ = track.audio_hex
+    hex_cln_audio, _ = track.audio_hex_cln
+
+    y, sr = track.get_string_audio(2)
+    assert sr == 44100
+    assert np.array_equal(y, hex_audio[2])
+
+    y, sr = track.get_string_audio([0, 5], offset=0.1, duration=0.2)
+    assert y.shape == (2, int(44100 * 0.2))
+    assert np.array_equal(y, hex_audio[[0, 5], 4410:13230])
+
+    y, _ = track.get_string_audio([4], debleeded=True)
+    assert np.array_equal(y, hex_cln_audio[[4]])
+
+    y, _ = guitarset.load_multitrack_audio(track.audio_hex_path, strings=[1, 3])
+    assert np.array_equal(y, hex_audio[[1, 3]])
+
+
 def test_to_jams():
     default_trackid = "03_BN3-119-G_solo"
     dataset = guitarset.Dataset("tests/resources/mir_datasets/guitarset")
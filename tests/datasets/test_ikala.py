@@ -1,7 +1,10 @@
+import weakref
+
 import numpy as np
 
 from mirdata.datasets import ikala
 from mirdata import annotations
+from mirdata import audio_utils
 from tests.test_utils import run_track_tests
 
 
@@ -28,6 +31,7 @@ def test_track():
         "vocal_audio": tuple,
         "instrumental_audio": tuple,
         "mix_audio": tuple,
+        "audio_sources": tuple,
     }
 
     assert track._track_paths == {
@@ -57,6 +61,69 @@ def test_track():
     assert np.array_equal(mix, instrumental + vocal)
 
 
+def test_audio_sources(mocker):
+    dataset = ikala.Dataset("tests/resources/mir_datasets/ikala")
+    track = dataset.track("10161_chorus")
+    expected_vocal, sr = ikala.load_vocal_audio(track.audio_path)
+    expected_instrumental, _ = ikala.load_instrumental_audio(track.audio_path)
+    expected_mix, _ = ikala.load_mix_audio(track.audio_path)
+    load = mocker.spy(audio_utils, "load")
+
+    vocal, instrumental, mix, sr = track.audio_sources
+    assert sr == 44100
+    assert np.array_equal(vocal, expected_vocal)
+    assert np.array_equal(instrumental, expected_instrumental)
+    assert np.allclose(mix, expected_mix, atol=1e-6)
+    assert load.call_count == 1
+
+    # the properties share one decode, and return writable copies
+    vocal, _ = track.vocal_audio
+    assert vocal.flags.writeable
+    vocal *= 0
+    assert np.array_equal(track.vocal_audio[0], expected_vocal)
+    assert np.array_equal(track.instrumental_audio[0], expected_instrumental)
+    assert np.allclose(track.mix_audio[0], expected_mix, atol=1e-6)
+    assert load.call_count == 1
+
+    # a different window decodes again
+    window_vocal, _ = track.get_audio_window(
+        offset=0.5, duration=0.5, audio_property="vocal_audio"
+    )
+    assert np.array_equal(window_vocal, expected_vocal[22050:44100])
+    assert load.call_count == 2
+
+    # with the memo, the stereo file is decoded once per track
+    dataset.set_audio_memo(True)
+    try:
+        load.reset_mock()
+        track = dataset.track("10161_chorus")
+        vocal, instrumental, mix, sr = track.audio_sources
+        assert not vocal.flags.writeable
+        assert np.array_equal(track.vocal_audio[0], vocal)
+        assert np.array_equal(track.instrumental_audio[0], instrumental)
+        assert np.array_equal(track.mix_audio[0], mix)
+        assert load.call_count == 1
+
+        # a different window decodes again
+        window_vocal, _ = track.get_audio_window(
+            offset=0.5, duration=0.5, audio_property="vocal_audio"
+        )
+        assert np.array_equal(window_vocal, vocal[22050:44100])
+        assert load.call_count == 2
+    finally:
+        dataset.set_audio_memo(None)
+
+
+def test_audio_sources_release():
+    dataset = ikala.Dataset("tests/resources/mir_datasets/ikala")
+    track = dataset.track("10161_chorus")
+    track.vocal_audio
+    # the shared decode is released with the track
+    decoded = weakref.ref(track.__dict__["_stereo_audio"][1][0])
+    del track
+    assert decoded() is None
+
+
 def test_to_jams():
 
     data_home = "tests/resources/mir_datasets/ikala"
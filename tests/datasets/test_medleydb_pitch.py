@@ -1,4 +1,7 @@
+from io import StringIO
+
 import numpy as np
+import pytest
 
 from mirdata.datasets import medleydb_pitch
 from mirdata import annotations
@@ -73,6 +76,16 @@ def test_load_pitch():
     assert np.array_equal(pitch_data.frequencies, np.array([0.0, 191.877]))
     assert np.array_equal(pitch_data.confidence, np.array([0.0, 1.0]))
 
+    # empty files and empty fields are errors
+    with pytest.raises(ValueError):
+        medleydb_pitch.load_pitch(StringIO(""))
+    with pytest.raises(ValueError):
+        medleydb_pitch.load_pitch(StringIO("0.07,,191.8\n0.08,0\n"))
+
+    # trailing delimiters are ignored
+    pitch_data = medleydb_pitch.load_pitch(StringIO("0.07,191.8,\n0.08,0,\n"))
+    assert np.array_equal(pitch_data.frequencies, np.array([191.8, 0.0]))
+
 
 def test_load_metadata():
     data_home = "tests/resources/mir_datasets/medleydb_pitch"
@@ -1,9 +1,12 @@
 import os
 import shutil
+from io import StringIO
+
 import numpy as np
+import pytest
 
 from mirdata.datasets import orchset
-from mirdata import annotations, download_utils
+from mirdata import annotations, audio_utils, download_utils
 from tests.test_utils import run_track_tests
 
 
@@ -51,6 +54,25 @@ def test_track():
     assert y_stereo.shape == (2, 44100 * 2)
 
 
+def test_audio_memo(mocker):
+    data_home = "tests/resources/mir_datasets/orchset"
+    dataset = orchset.Dataset(data_home)
+    track = dataset.track("Beethoven-S3-I-ex1")
+    stereo, sr = track.audio_stereo
+    dataset.set_audio_memo(True)
+    try:
+        track = dataset.track("Beethoven-S3-I-ex1")
+        load = mocker.spy(audio_utils, "load")
+        y_stereo, sr_stereo = track.audio_stereo
+        y_mono, sr_mono = track.audio_mono
+        assert load.call_count == 1
+        assert sr_stereo == sr_mono == sr
+        assert np.array_equal(y_stereo, stereo)
+        assert np.allclose(y_mono, stereo.mean(axis=0), atol=1e-6)
+    finally:
+        dataset.set_audio_memo(None)
+
+
 def test_to_jams():
 
     data_home = "tests/resources/mir_datasets/orchset"
@@ -87,6 +109,16 @@ def test_load_melody():
     assert np.array_equal(melody_data.frequencies, np.array([0.0, 0.0, 622.254]))
     assert np.array_equal(melody_data.confidence, np.array([0.0, 0.0, 1.0]))
 
+    # empty files and empty fields are errors
+    with pytest.raises(ValueError):
+        orchset.load_melody(StringIO(""))
+    with pytest.raises(ValueError):
+        orchset.load_melody(StringIO("0\t\t0\n0.08\t0\n"))
+
+    # extra columns are ignored
+    melody_data = orchset.load_melody(StringIO("0.07\t191.8\t1\n0.08\t0\t2\n"))
+    assert np.array_equal(melody_data.frequencies, np.array([191.8, 0.0]))
+
 
 def test_load_metadata():
     data_home = "tests/resources/mir_datasets/orchset"
@@ -575,3 +575,38 @@ def test_load_audio():
     assert audio.shape[0] == 2
 
     assert saraga_carnatic.load_audio(None) is None
+
+
+def test_load_stems():
+    data_home = "tests/resources/mir_datasets/saraga_carnatic"
+    dataset = saraga_carnatic.Dataset(data_home)
+    track = dataset.track("116_Bhuvini_Dasudane")
+
+    stems, sr = track.get_audio_stems()
+    assert sr == 44100
+    assert stems.dtype == np.float32
+    assert stems.shape == (6, 1, 88200)
+    for i, stem in enumerate(saraga_carnatic.STEMS):
+        audio_path = track.get_path("audio-{}".format(stem))
+        if audio_path is None:
+            # vocal-s is missing
+            assert np.all(stems[i] == 0)
+        else:
+            audio, _ = saraga_carnatic.load_audio(audio_path)
+            assert np.allclose(stems[i, 0], audio)
+
+    window, _ = track.get_audio_stems(offset=0.5, duration=0.25, n_workers=2)
+    assert window.shape == (6, 1, 11025)
+    assert np.allclose(window, stems[:, :, 22050 : 22050 + 11025])
+
+    # stems of different lengths and channels are padded
+    stems, sr = saraga_carnatic.load_stems(
+        [track.audio_vocal_path, None, track.audio_path], duration=1.0
+    )
+    assert stems.shape == (3, 2, 44100)
+    vocal, _ = saraga_carnatic.load_audio(track.audio_vocal_path, duration=1.0)
+    assert np.allclose(stems[0, 0], vocal) and np.allclose(stems[0, 1], vocal)
+    assert np.all(stems[1] == 0)
+
+    track = dataset.track("13_Thillana_Purnachandrika")
+    assert track.get_audio_stems() is None
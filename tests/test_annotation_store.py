@@ -0,0 +1,129 @@
+import functools
+import os
+
+import numpy as np
+import pytest
+
+from mirdata import annotation_store
+from mirdata import annotations
+
+
+def _load_beats(path, times=None):
+    return annotations.BeatData(np.array(times or [0.5, 1.0]), None)
+
+
+def test_save_load_annotation(tmpdir):
+    chords = annotations.ChordData(
+        np.array([[0.0, 1.5], [1.5, 3.0]]), ["A:maj", "N"], np.array([1.0, 0.5])
+    )
+    path = str(tmpdir.join("chords.npz"))
+    annotation_store.save_annotation(path, chords)
+
+    for mmap_mode in ["c", None]:
+        loaded = annotation_store.load_annotation(path, mmap_mode=mmap_mode)
+        assert type(loaded) == annotations.ChordData
+        assert np.array_equal(loaded.intervals, chords.intervals)
+        assert loaded.labels == ["A:maj", "N"]
+        assert np.array_equal(loaded.confidence, chords.confidence)
+        assert isinstance(loaded.intervals, np.memmap) == (mmap_mode == "c")
+
+    # memory-mapped arrays are copy-on-write
+    loaded = annotation_store.load_annotation(path)
+    loaded.intervals[0, 0] = 10.0
+    assert annotation_store.load_annotation(path).intervals[0, 0] == 0.0
+
+    with pytest.raises(ValueError):
+        annotation_store.load_annotation(path, mmap_mode="r+")
+
+
+def test_save_load_annotation_lists(tmpdir):
+    multif0 = annotations.MultiF0Data(
+        np.array([0.0, 0.1]), [[220.0, 440.0], [330.0, 0.0]], None
+    )
+    path = str(tmpdir.join("multif0.npz"))
+    annotation_store.save_annotation(path, multif0)
+    loaded = annotation_store.load_annotation(path)
+    assert loaded.frequency_list == [[220.0, 440.0], [330.0, 0.0]]
+    assert loaded.confidence_list is None
+
+    beats = annotations.BeatData(np.array([0.5, 1.0]), None)
+    beats.times = np.array([], dtype=float)
+    annotation_store.save_annotation(path, beats)
+    assert annotation_store.load_annotation(path).times.shape == (0,)
+
+    beats.positions = {"a": 1}
+    with pytest.raises(TypeError):
+        annotation_store.save_annotation(path, beats)
+
+
+def test_load_annotation_version(tmpdir, mocker):
+    path = str(tmpdir.join("beats.npz"))
+    annotation_store.save_annotation(path, annotations.BeatData(np.array([0.5])))
+    mocker.patch.object(annotation_store.version, "version", "0.0.0")
+    with pytest.raises(ValueError):
+        annotation_store.load_annotation(path)
+
+
+def test_annotation_store(tmpdir):
+    store = annotation_store.AnnotationStore(str(tmpdir.join("store")))
+    beats = annotations.BeatData(np.array([0.5, 1.0]), np.array([1, 2]))
+
+    loader = _load_beats
+    key = store.key("abc123", loader)
+    assert key == "abc123_tests.test_annotation_store._load_beats"
+    assert store.get(key) is None
+
+    assert store.put(key, beats)
+    loaded = store.get(key)
+    assert np.array_equal(loaded.times, beats.times)
+    assert np.array_equal(loaded.positions, beats.positions)
+    assert os.listdir(store.store_dir) == [key + ".npz"]
+
+    beats.positions = {"a": 1}
+    assert not store.put(store.key("def456", loader), beats)
+    assert os.listdir(store.store_dir) == [key + ".npz"]
+
+    # unreadable entries are misses
+    with open(os.path.join(store.store_dir, key + ".npz"), "wb") as fhandle:
+        fhandle.write(b"not a zip file")
+    assert store.get(key) is None
+
+    store.clear()
+    assert os.listdir(store.store_dir) == []
+
+
+def test_annotation_store_key(tmpdir):
+    store = annotation_store.AnnotationStore(str(tmpdir))
+
+    # lambdas and local functions share qualified names, so are not stored
+    assert store.key("abc123", lambda path: 1) is None
+
+    def loader(path):
+        return None
+
+    assert store.key("abc123", loader) is None
+    assert store.key("abc123", store.get) is None
+
+    # partials are keyed by their function and arguments
+    key_a = store.key("abc123", functools.partial(_load_beats, times=[1.0]))
+    key_b = store.key("abc123", functools.partial(_load_beats, times=[2.0]))
+    assert key_a.startswith("abc123_tests.test_annotation_store._load_beats-")
+    assert key_a != key_b
+    assert key_a == store.key("abc123", functools.partial(_load_beats, times=[1.0]))
+    assert store.key("abc123", functools.partial(_load_beats, [1.0])) != key_a
+    assert store.key("abc123", functools.partial(loader)) is None
+    assert store.key("abc123", functools.partial(_load_beats, object())) is None
+
+
+def test_set_store(tmpdir):
+    store = annotation_store.AnnotationStore(str(tmpdir))
+    try:
+        annotation_store.set_store(store)
+        assert annotation_store.get_store() is store
+        assert annotation_store.get_store("salami") is store
+        annotation_store.set_store(False, dataset_name="salami")
+        assert annotation_store.get_store("salami") is False
+    finally:
+        annotation_store.set_store(None)
+        annotation_store.set_store(None, dataset_name="salami")
+    assert annotation_store.get_store("salami") is None
@@ -0,0 +1,472 @@
+import io
+import os
+import time
+
+import librosa
+import numpy as np
+import pytest
+import soundfile
+
+import mirdata
+from mirdata import audio_utils
+
+TEST_WAV = "tests/resources/mir_datasets/orchset/audio/stereo/Beethoven-S3-I-ex1.wav"
+TEST_MP3 = "tests/resources/mir_datasets/beatport_key/audio/100066 Lindstrom - Monsteer (Original Mix).mp3"
+
+
+@pytest.fixture(autouse=True)
+def reset_backends():
+    yield
+    audio_utils._SELECTED_BACKENDS.clear()
+    audio_utils._CACHES.clear()
+
+
+@pytest.mark.parametrize(
+    "subtype", ["PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"]
+)
+def test_wav_memmap(tmp_path, subtype):
+    path = str(tmp_path / "test.wav")
+    audio = np.random.uniform(-0.9, 0.9, (1000, 3))
+    soundfile.write(path, audio, 8000, subtype=subtype)
+    expected, _ = soundfile.read(path, dtype="float32", always_2d=True)
+
+    if subtype == "PCM_24":
+        with pytest.raises(audio_utils.UnsupportedAudioError):
+            audio_utils.load_wav_memmap(path, mono=False)
+        return
+
+    y, sr = audio_utils.load_wav_memmap(path, mono=False)
+    assert sr == 8000
+    assert y.dtype == np.float32
+    assert y.shape == (3, 1000)
+    assert np.allclose(y, expected.T, atol=1e-7)
+
+    y_mono, _ = audio_utils.load_wav_memmap(path, mono=True)
+    assert y_mono.shape == (1000,)
+    assert np.allclose(y_mono, np.mean(expected, axis=1), atol=1e-6)
+
+
+def test_wav_memmap_unsupported(tmp_path):
+    with pytest.raises(audio_utils.UnsupportedAudioError):
+        audio_utils.load_wav_memmap(TEST_MP3, mono=True)
+
+    with open(TEST_WAV, "rb") as fhandle:
+        data = io.BytesIO(fhandle.read())
+    with pytest.raises(audio_utils.UnsupportedAudioError):
+        audio_utils.load_wav_memmap(data, mono=True)
+
+    path = str(tmp_path / "test.flac")
+    soundfile.write(path, np.zeros((100,)), 8000)
+    with pytest.raises(audio_utils.UnsupportedAudioError):
+        audio_utils.load_wav_memmap(path, mono=True)
+
+
+@pytest.mark.parametrize("backend", ["wav_memmap", "soundfile", "librosa"])
+@pytest.mark.parametrize("mono", [True, False])
+@pytest.mark.parametrize("sr", [None, 22050])
+def test_backends_match_librosa(backend, mono, sr):
+    expected, expected_sr = librosa.load(TEST_WAV, sr=sr, mono=mono)
+    audio_utils.set_backend(backend)
+    with open(TEST_WAV, "rb") as fhandle:
+        y, y_sr = audio_utils.load(fhandle, sr=sr, mono=mono)
+    assert y_sr == expected_sr
+    assert y.dtype == expected.dtype
+    assert y.shape == expected.shape
+    assert np.allclose(y, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("backend", ["wav_memmap", "soundfile", "librosa"])
+@pytest.mark.parametrize("mono", [True, False])
+@pytest.mark.parametrize("sr", [None, 22050])
+@pytest.mark.parametrize("offset,duration", [(0.5, 0.25), (1.0, None), (0.3, 100.0)])
+def test_load_window_matches_librosa(backend, mono, sr, offset, duration):
+    expected, expected_sr = librosa.load(
+        TEST_WAV, sr=sr, mono=mono, offset=offset, duration=duration
+    )
+    audio_utils.set_backend(backend)
+    y, y_sr = audio_utils.load(
+        TEST_WAV, sr=sr, mono=mono, offset=offset, duration=duration
+    )
+    assert y_sr == expected_sr
+    assert y.shape == expected.shape
+    assert np.allclose(y, expected, atol=1e-6)
+
+
+def test_window():
+    full, sr = audio_utils.load(TEST_WAV)
+    with audio_utils.window(offset=0.5, duration=0.25):
+        y, _ = audio_utils.load(TEST_WAV)
+        # loads with their own window are not affected
+        y_explicit, _ = audio_utils.load(TEST_WAV, offset=0.1, duration=0.1)
+    start = int(0.5 * sr)
+    assert np.allclose(y, full[start : start + int(0.25 * sr)])
+    assert y_explicit.shape == (int(0.1 * sr),)
+
+    y, _ = audio_utils.load(TEST_WAV)
+    assert y.shape == full.shape
+
+    # windows after the end of the file are empty
+    y, _ = audio_utils.load(TEST_WAV, offset=1000.0)
+    assert y.shape == (0,)
+
+    with pytest.raises(ValueError):
+        audio_utils.load(TEST_WAV, offset=-1.0)
+    with pytest.raises(ValueError):
+        audio_utils.load(TEST_WAV, duration=-1.0)
+    with pytest.raises(ValueError):
+        with audio_utils.window(offset=-1.0):
+            pass
+
+
+def test_load_fallback():
+    # mp3s are not wav files, and BytesIO cannot be memory-mapped
+    expected, expected_sr = librosa.load(TEST_MP3, sr=None, mono=True)
+    y, sr = audio_utils.load(TEST_MP3)
+    assert sr == expected_sr
+    assert np.allclose(y, expected)
+
+    with open(TEST_WAV, "rb") as fhandle:
+        data = io.BytesIO(fhandle.read())
+    y, sr = audio_utils.load(data, mono=False)
+    assert y.shape[0] == 2
+
+    with pytest.raises(IOError):
+        audio_utils.load("a/fake/filepath")
+
+    audio_utils.set_backend("wav_memmap")
+    with pytest.raises(audio_utils.UnsupportedAudioError):
+        audio_utils.load(TEST_MP3)
+
+
+def test_set_backend(mocker):
+    assert audio_utils.get_backend() == audio_utils.DEFAULT_BACKENDS
+    audio_utils.set_backend("soundfile")
+    assert audio_utils.get_backend() == ["soundfile"]
+    assert audio_utils.get_backend("orchset") == ["soundfile"]
+
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    dataset.set_audio_backend(["librosa"])
+    assert audio_utils.get_backend("orchset") == ["librosa"]
+    assert audio_utils.get_backend("beatles") == ["soundfile"]
+
+    load_librosa = mocker.spy(audio_utils, "load_librosa")
+    mocker.patch.dict(audio_utils.BACKENDS, {"librosa": load_librosa})
+    track = dataset.track("Beethoven-S3-I-ex1")
+    y, sr = track.audio_mono
+    assert load_librosa.call_count == 1
+    assert sr == 44100
+
+    dataset.set_audio_backend(None)
+    assert audio_utils.get_backend("orchset") == ["soundfile"]
+    audio_utils.set_backend(None)
+    assert audio_utils.get_backend("orchset") == audio_utils.DEFAULT_BACKENDS
+
+    with pytest.raises(ValueError):
+        audio_utils.set_backend("not_a_backend")
+    with pytest.raises(ValueError):
+        audio_utils.set_backend([])
+
+
+def test_register_backend(mocker):
+    def load_silence(fhandle, mono, offset, duration):
+        return np.zeros((10,), dtype=np.float32), 100
+
+    mocker.patch.dict(audio_utils.BACKENDS)
+    audio_utils.register_backend("silence", load_silence)
+    audio_utils.set_backend("silence", dataset_name="orchset")
+    y, sr = audio_utils.load(TEST_WAV, dataset_name="orchset")
+    assert sr == 100
+    assert np.all(y == 0)
+
+    y, sr = audio_utils.load(TEST_WAV, sr=200, dataset_name="orchset")
+    assert sr == 200
+    assert y.shape == (20,)
+
+
+def test_resample():
+    y = np.random.uniform(-1, 1, (2, 1000)).astype(np.float32)
+    expected = librosa.resample(y, orig_sr=1000, target_sr=300)
+    y_hat = audio_utils.resample(y, 1000, 300)
+    assert y_hat.shape == expected.shape
+    assert np.allclose(y_hat, expected, atol=1e-6)
+    assert audio_utils.resample(y, 1000, 1000) is y
+
+
+def test_resample_without_soxr(monkeypatch):
+    monkeypatch.setattr(audio_utils, "soxr", mirdata.core.lazy_import("not_soxr"))
+    y = np.random.uniform(-1, 1, (2, 1001))
+    y_hat = audio_utils.resample(y, 1000, 300)
+    assert y_hat.dtype == np.float32
+    assert y_hat.shape == (2, 301)
+    assert y_hat.flags.c_contiguous
+
+
+def test_dataset_audio_cache(tmp_path, mocker):
+    cache_dir = str(tmp_path / "cache")
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    track = dataset.track("Beethoven-S3-I-ex1")
+    expected, expected_sr = track.audio_stereo
+
+    dataset.set_audio_cache(10**8, cache_dir=cache_dir)
+    cache = audio_utils.get_cache("orchset")
+    assert cache.cache_dir == cache_dir
+    assert audio_utils.get_cache("beatles") is None
+
+    decode = mocker.spy(audio_utils, "_decode")
+    y, sr = track.audio_stereo
+    y_cached, sr_cached = track.audio_stereo
+    assert decode.call_count == 1
+    assert sr == sr_cached == expected_sr
+    assert isinstance(y_cached, np.memmap)
+    assert np.allclose(y, expected) and np.allclose(y_cached, expected)
+
+    # entries are keyed by the md5 checksum in the index
+    md5 = dataset._index["tracks"]["Beethoven-S3-I-ex1"]["audio_stereo"][1]
+    assert os.listdir(cache_dir) == ["{}_native_multi_float32_44100.npy".format(md5)]
+
+    # modifying the loaded audio does not modify the cache
+    y_cached *= 0
+    assert np.allclose(track.audio_stereo[0], expected)
+
+    # windows are read from the cached audio
+    y, _ = track.get_audio_window(0.5, 0.25, audio_property="audio_stereo")
+    start = int(0.5 * sr)
+    assert np.allclose(y, expected[:, start : start + int(0.25 * sr)])
+    assert decode.call_count == 1
+
+    # other sample rates and channels are other entries
+    y, sr = audio_utils.load(
+        track.audio_path_stereo, sr=22050, mono=True, dataset_name="orchset"
+    )
+    assert sr == 22050 and y.ndim == 1
+    assert decode.call_count == 2
+    assert len(os.listdir(cache_dir)) == 2
+
+    dataset.set_audio_cache(None)
+    assert audio_utils.get_cache("orchset") is None
+    track.audio_stereo
+    assert decode.call_count == 3
+
+    # file handles which are not backed by a file are not cached
+    audio_utils.set_cache(audio_utils.AudioCache(cache_dir, 10**8))
+    with open(TEST_WAV, "rb") as fhandle:
+        data = io.BytesIO(fhandle.read())
+    audio_utils.load(data)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_audio_cache_eviction(tmp_path):
+    cache_dir = str(tmp_path)
+    y = np.zeros((1000,), dtype=np.float32)
+    entry_size = y.nbytes + 128  # with the .npy header
+    cache = audio_utils.AudioCache(cache_dir, max_bytes=3 * entry_size)
+
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, y + i, 100)
+        # make sure modification times differ
+        mtime = time.time() - 100 + i
+        os.utime(os.path.join(cache_dir, "{}_100.npy".format(key)), (mtime, mtime))
+
+    # reading an entry makes it the most recently used
+    y_a, sr = cache.get("a")
+    assert sr == 100 and np.all(y_a == 0)
+
+    cache.put("d", y + 3, 100)
+    assert cache.get("b") == (None, None)
+    assert sorted(os.listdir(cache_dir)) == ["a_100.npy", "c_100.npy", "d_100.npy"]
+
+    # other processes see the same entries
+    other = audio_utils.AudioCache(cache_dir, max_bytes=3 * entry_size)
+    assert np.all(other.get("d")[0] == 3)
+
+    # audio larger than the cache is not stored
+    cache.put("e", np.zeros((10000,), dtype=np.float32), 100)
+    assert cache.get("e") == (None, None)
+
+    cache.clear()
+    assert os.listdir(cache_dir) == []
+    assert other.get("d") == (None, None)
+
+    with pytest.raises(ValueError):
+        audio_utils.AudioCache(cache_dir, max_bytes=-1)
+
+
+def test_audio_cache_ledger(tmp_path, mocker):
+    cache_dir = str(tmp_path)
+    y = np.zeros((1000,), dtype=np.float32)
+    cache = audio_utils.AudioCache(cache_dir, max_bytes=2 * (y.nbytes + 128))
+    cache.put("a", y, 100)
+
+    # misses and puts use the ledger instead of listing the directory
+    listdir = mocker.spy(os, "listdir")
+    for key in ["b", "c", "d"]:
+        assert cache.get("x") == (None, None)
+        cache.put(key, y, 100)
+        assert cache.get(key)[1] == 100
+    assert listdir.call_count == 0
+    assert sorted(os.listdir(cache_dir)) == ["c_100.npy", "d_100.npy"]
+    assert cache._total == sum(
+        os.path.getsize(os.path.join(cache_dir, name))
+        for name in ["c_100.npy", "d_100.npy"]
+    )
+
+    # entries changed by other processes are seen after a rescan
+    listdir.reset_mock()
+    other = audio_utils.AudioCache(cache_dir, max_bytes=2 * (y.nbytes + 128))
+    other.put("e", y + 1, 100)
+    assert np.all(cache.get("e")[0] == 1)
+    assert cache.get("c") == (None, None)
+    assert sorted(cache._entries) == ["d", "e"]
+
+
+def _expected_blocks(y, block_size, hop_size):
+    blocks = []
+    for start in range(0, y.shape[-1], hop_size):
+        blocks.append(y[..., start : start + block_size])
+        if start + block_size >= y.shape[-1]:
+            break
+    return blocks
+
+
+@pytest.mark.parametrize("backend", ["wav_memmap", "soundfile", "librosa"])
+@pytest.mark.parametrize("mono", [True, False])
+@pytest.mark.parametrize("sr", [None, 22050])
+@pytest.mark.parametrize("block_size,hop_size", [(500, 300), (500, None), (300, 500)])
+def test_stream(mocker, backend, mono, sr, block_size, hop_size):
+    # decode in chunks which are not aligned with the blocks
+    mocker.patch.object(audio_utils, "STREAM_CHUNK_SIZE", 777)
+    audio_utils.set_backend(backend)
+    y, _ = audio_utils.load(TEST_WAV, sr=sr, mono=mono)
+    blocks = list(
+        audio_utils.stream(TEST_WAV, block_size, hop_size=hop_size, sr=sr, mono=mono)
+    )
+    expected = _expected_blocks(y, block_size, hop_size or block_size)
+    assert len(blocks) == len(expected)
+    for block, expected_block in zip(blocks, expected):
+        assert block.dtype == np.float32
+        assert block.shape == expected_block.shape
+        assert np.allclose(block, expected_block, atol=1e-6)
+
+
+@pytest.mark.parametrize("mono", [True, False])
+def test_stream_without_soxr(monkeypatch, mono):
+    monkeypatch.setattr(audio_utils, "STREAM_CHUNK_SIZE", 777)
+    y, _ = audio_utils.load(TEST_WAV, sr=22050, mono=mono)
+    monkeypatch.setattr(audio_utils, "soxr", mirdata.core.lazy_import("not_soxr"))
+    blocks = list(audio_utils.stream(TEST_WAV, 500, sr=22050, mono=mono))
+    expected = _expected_blocks(y, 500, 500)
+    assert len(blocks) == len(expected)
+    for block, expected_block in zip(blocks, expected):
+        assert block.dtype == np.float32
+        assert block.shape == expected_block.shape
+
+
+def test_stream_memory(tmp_path):
+    import tracemalloc
+
+    path = str(tmp_path / "long.wav")
+    n_frames = 300 * 8000
+    soundfile.write(path, np.zeros((n_frames, 2)), 8000, subtype="PCM_16")
+    for backend in ["wav_memmap", "soundfile"]:
+        audio_utils.set_backend(backend)
+        tracemalloc.start()
+        n_blocks = 0
+        for block in audio_utils.stream(path, 4096, hop_size=1024, mono=False):
+            n_blocks += 1
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert n_blocks == (n_frames - 4096) // 1024 + 2
+        # a few chunks, rather than the whole 19 MB of float32 audio
+        assert peak < 4 * 1024**2
+
+
+def test_stream_errors():
+    with pytest.raises(ValueError):
+        audio_utils.stream(TEST_WAV, 0)
+    with pytest.raises(ValueError):
+        audio_utils.stream(TEST_WAV, 100, hop_size=0)
+    with pytest.raises(IOError):
+        audio_utils.stream("a/fake/filepath", 100)
+    audio_utils.set_backend("wav_memmap")
+    with pytest.raises(audio_utils.UnsupportedAudioError):
+        audio_utils.stream(TEST_MP3, 100)
+
+    # audio shorter than a block is a single, shorter block
+    blocks = list(audio_utils.stream(TEST_WAV, 10**6))
+    assert len(blocks) == 1
+    assert blocks[0].shape == (88200,)
+
+
+def test_info(tmp_path):
+    assert audio_utils.info(TEST_WAV) == {
+        "sample_rate": 44100,
+        "n_channels": 2,
+        "n_frames": 88200,
+        "duration": 2.0,
+    }
+    y, sr = librosa.load(TEST_MP3, sr=None, mono=False)
+    with open(TEST_MP3, "rb") as fhandle:
+        mp3_info = audio_utils.info(fhandle)
+        assert fhandle.tell() == 0
+    assert mp3_info["sample_rate"] == sr
+    assert mp3_info["n_frames"] == y.shape[-1]
+
+    path = str(tmp_path / "test.txt")
+    with open(path, "w") as fhandle:
+        fhandle.write("not audio")
+    with pytest.raises(audio_utils.UnsupportedAudioError):
+        audio_utils.info(path)
+    with pytest.raises(IOError):
+        audio_utils.info("a/fake/filepath")
+
+
+@pytest.mark.parametrize("backend", ["wav_memmap", "soundfile", "librosa"])
+def test_load_channels(tmp_path, backend):
+    path = str(tmp_path / "hex.wav")
+    y = np.random.uniform(-1, 1, size=(6, 8000)).astype(np.float32)
+    soundfile.write(path, y.T, 8000, subtype="PCM_16")
+    expected, _ = audio_utils.load(path, mono=False)
+
+    audio_utils.set_backend(backend)
+    try:
+        channel, sr = audio_utils.load_channels(path, 3)
+        assert sr == 8000
+        assert channel.shape == (8000,)
+        assert np.allclose(channel, expected[3], atol=1e-6)
+
+        channels, _ = audio_utils.load_channels(path, [5, 0], offset=0.25, duration=0.5)
+        assert channels.shape == (2, 4000)
+        assert np.allclose(channels, expected[[5, 0], 2000:6000], atol=1e-6)
+
+        with audio_utils.window(offset=0.5):
+            channels, _ = audio_utils.load_channels(path, [1])
+        assert np.allclose(channels, expected[[1], 4000:], atol=1e-6)
+
+        resampled, sr = audio_utils.load_channels(path, [0, 1], sr=4000)
+        assert sr == 4000
+        assert resampled.shape == (2, 4000)
+
+        with pytest.raises(IndexError):
+            audio_utils.load_channels(path, 6)
+    finally:
+        audio_utils.set_backend(None)
+
+    with pytest.raises(IOError):
+        audio_utils.load_channels("does/not/exist.wav", 0)
+
+
+def test_load_channels_memory(tmp_path):
+    import tracemalloc
+
+    path = str(tmp_path / "hex.wav")
+    n_frames = 8000 * 60
+    soundfile.write(
+        path, np.zeros((n_frames, 6), dtype=np.float32), 8000, subtype="PCM_16"
+    )
+    tracemalloc.start()
+    y, _ = audio_utils.load_channels(path, 0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert y.shape == (n_frames,)
+    # one float32 channel, not six
+    assert peak < 2 * n_frames * 4
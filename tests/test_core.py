@@ -1,8 +1,18 @@
+import collections
+import concurrent.futures
+import copy
+import gc
+import os
+import pickle
+import tracemalloc
+
 import pytest
 import numpy as np
 
 import mirdata
+from mirdata import audio_utils
 from mirdata import core
+from mirdata import index_utils
 
 
 def test_track():
@@ -184,6 +194,12 @@ def test_dataset_errors():
     with pytest.raises(AttributeError):
         d.load_multitracks()
 
+    with pytest.raises(AttributeError):
+        d.load_tracks(lazy=True)
+
+    with pytest.raises(AttributeError):
+        d.load_multitracks(lazy=True)
+
     with pytest.raises(AttributeError):
         d.choice_track()
 
@@ -652,3 +668,501 @@ def test_multitrack_mono():
     target1 = mtrack.get_target(["a", "c"], average=False)
     assert target1.shape == (1, 100)
     assert np.max(np.abs(target1)) <= 2
+
+
+def test_track_collection():
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    loaded = []
+
+    def load_track(track_id):
+        loaded.append(track_id)
+        return dataset.track(track_id)
+
+    tracks = core.TrackCollection(dataset._index["tracks"], load_track, cache_size=2)
+    assert len(tracks) == len(dataset.track_ids)
+    assert list(tracks) == dataset.track_ids
+    assert "Beethoven-S3-I-ex1" in tracks
+    assert "~faketrackid~?!" not in tracks
+    assert ["Beethoven-S3-I-ex1"] not in tracks
+    assert loaded == []
+
+    track_ids = dataset.track_ids[:3]
+    track = tracks[track_ids[0]]
+    assert isinstance(track, core.Track)
+    assert track.track_id == track_ids[0]
+    assert tracks[track_ids[0]] is track
+    assert loaded == track_ids[:1]
+
+    # the least recently used track is dropped
+    tracks[track_ids[1]]
+    tracks[track_ids[0]]
+    tracks[track_ids[2]]
+    assert list(tracks._cache) == [track_ids[0], track_ids[2]]
+    tracks[track_ids[1]]
+    assert loaded == [track_ids[0], track_ids[1], track_ids[2], track_ids[1]]
+
+    with pytest.raises(KeyError):
+        tracks["~faketrackid~?!"]
+
+    # slicing by a list of ids shares the cache
+    subset = tracks[track_ids[1:]]
+    assert isinstance(subset, core.TrackCollection)
+    assert list(subset) == track_ids[1:]
+    assert track_ids[0] not in subset
+    assert subset[track_ids[1]] is tracks[track_ids[1]]
+    with pytest.raises(KeyError):
+        tracks[[track_ids[0], "~faketrackid~?!"]]
+
+    uncached = core.TrackCollection(dataset._index["tracks"], load_track, 0)
+    assert uncached[track_ids[0]] is not uncached[track_ids[0]]
+    assert len(uncached._cache) == 0
+
+    with pytest.raises(ValueError):
+        core.TrackCollection(dataset._index["tracks"], load_track, -1)
+
+
+def test_dataset_load_tracks_lazy():
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    tracks = dataset.load_tracks(lazy=True)
+    assert isinstance(tracks, core.TrackCollection)
+    assert len(tracks) == len(dataset.track_ids)
+    assert tracks["Beethoven-S3-I-ex1"].track_id == "Beethoven-S3-I-ex1"
+    assert dict(tracks.items()).keys() == dataset.load_tracks().keys()
+
+    with pytest.raises(AttributeError):
+        dataset.load_multitracks(lazy=True)
+
+    dataset = mirdata.initialize(
+        "phenicx_anechoic", data_home="tests/resources/mir_datasets/phenicx_anechoic"
+    )
+    mtracks = dataset.load_multitracks(lazy=True, cache_size=1)
+    assert list(mtracks) == dataset.mtrack_ids
+    assert isinstance(mtracks["beethoven"], core.MultiTrack)
+
+    dataset._track_class = None
+    with pytest.raises(AttributeError):
+        dataset.load_tracks(lazy=True)
+
+
+def test_track_path():
+    class TestTrack(core.Track):
+        audio_path = core.track_path("audio")
+
+    index = {"tracks": {"a": {"audio": ["audio/a.wav", None]}}}
+    track = TestTrack("a", "data_home", "test", index, lambda: None)
+    assert track.audio_path == os.path.join("data_home", "audio/a.wav")
+    assert isinstance(TestTrack.audio_path, core.track_path)
+    assert core.is_track_attribute(TestTrack.audio_path)
+    assert core.is_track_attribute(TestTrack.track_id)
+    assert not core.is_track_attribute(TestTrack.get_path)
+    assert "audio_path=" in repr(track)
+
+    index["tracks"]["a"]["audio"] = [None, None]
+    assert track.audio_path is None
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_track_memory(tmp_path, compiled):
+    dataset = mirdata.initialize("medley_solos_db")
+    if compiled:
+        compiled_path = index_utils.compile_index(
+            dataset.index_path, str(tmp_path / "index.mirdx")
+        )
+        dataset._index = index_utils.load_compiled_index(compiled_path)
+    track_ids = dataset.track_ids[:2000]
+    dataset.track(track_ids[0])
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    tracks = [dataset.track(track_id) for track_id in track_ids]
+    per_track = (tracemalloc.get_traced_memory()[0] - start) / len(tracks)
+    tracemalloc.stop()
+    assert per_track < 250
+
+    # rows of a compiled index are only decoded when a path is accessed
+    assert tracks[0].audio_path == os.path.join(
+        dataset.data_home, dataset._index["tracks"][track_ids[0]]["audio"][0]
+    )
+
+
+def _track_audio_path(track):
+    return track.audio_path
+
+
+def test_pickle():
+    dataset = mirdata.initialize(
+        "saraga_carnatic", data_home="tests/resources/mir_datasets/saraga_carnatic"
+    )
+    track_id = "116_Bhuvini_Dasudane"
+    track = dataset.track(track_id)
+
+    # pickles only hold the dataset class, data_home, index path and id
+    assert len(pickle.dumps(dataset)) < 500
+    assert len(pickle.dumps(track)) < 500
+
+    dataset2 = pickle.loads(pickle.dumps(dataset))
+    assert isinstance(dataset2, type(dataset))
+    assert dataset2.data_home == dataset.data_home
+    assert dataset2.track_ids == dataset.track_ids
+
+    track2 = pickle.loads(pickle.dumps(track))
+    assert isinstance(track2, type(track))
+    assert track2.track_id == track_id
+    assert track2.audio_path == track.audio_path
+    assert track2.metadata == track.metadata
+
+    # unpickled objects of the same dataset share one Dataset per process
+    assert track2._metadata.dataset is dataset2
+    assert (
+        pickle.loads(
+            pickle.dumps(dataset.track(dataset.track_ids[1]))
+        )._metadata.dataset
+        is dataset2
+    )
+
+    # tracks which do not belong to a dataset are pickled as usual
+    index = {"tracks": {"a": {"audio": ["a.wav", None]}}}
+    plain_track = core.Track("a", "data_home", "test", index, None)
+    assert pickle.loads(pickle.dumps(plain_track))._track_paths == {
+        "audio": ["a.wav", None]
+    }
+
+    mtrack_dataset = mirdata.initialize(
+        "phenicx_anechoic", data_home="tests/resources/mir_datasets/phenicx_anechoic"
+    )
+    mtrack = mtrack_dataset.multitrack("beethoven")
+    assert len(pickle.dumps(mtrack)) < 500
+    mtrack2 = pickle.loads(pickle.dumps(mtrack))
+    assert mtrack2.mtrack_id == "beethoven"
+    assert mtrack2.track_ids == mtrack.track_ids
+    assert len(pickle.dumps(mtrack2.tracks)) < 500 * len(mtrack.track_ids)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        tracks = dataset.load_tracks()
+        audio_paths = list(executor.map(_track_audio_path, tracks.values()))
+    assert audio_paths == [track.audio_path for track in tracks.values()]
+
+
+def test_loaded_datasets_size(mocker):
+    mocker.patch.object(core, "_LOADED_DATASETS", collections.OrderedDict())
+    mocker.patch.object(core, "LOADED_DATASETS_SIZE", 2)
+    dataset_class = mirdata.initialize("orchset").__class__
+    first = core._load_dataset(dataset_class, "a")
+    assert core._load_dataset(dataset_class, "a") is first
+    core._load_dataset(dataset_class, "b")
+    core._load_dataset(dataset_class, "c")
+    assert len(core._LOADED_DATASETS) == 2
+    assert core._load_dataset(dataset_class, "a") is not first
+
+
+def test_deepcopy():
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track_id = dataset.track_ids[0]
+    dataset_copy = copy.deepcopy(dataset)
+    assert dataset_copy is not dataset
+    assert dataset_copy._index == dataset._index
+    assert dataset_copy._index is not dataset._index
+    assert dataset_copy.track(track_id)._metadata.dataset is dataset_copy
+
+    # tracks share their dataset, unless it is copied with them
+    track = dataset.track(track_id)
+    assert copy.deepcopy(track)._metadata.dataset is dataset
+    dataset_copy, track_copy = copy.deepcopy([dataset, track])
+    assert track_copy._metadata.dataset is dataset_copy
+    assert track_copy.melody_path == track.melody_path
+
+    index = {"tracks": {"a": {"audio": ["a.wav", None]}}}
+    plain_track = core.Track("a", "data_home", "test", index, None)
+    plain_copy = copy.deepcopy(plain_track)
+    assert plain_copy._track_paths == plain_track._track_paths
+    assert plain_copy._track_paths is not plain_track._track_paths
+
+
+def test_multitrack_persistent_tracks_and_mixing():
+    n_samples = 100000
+
+    class TestTrack(core.Track):
+        def __init__(
+            self, key, data_home="foo", dataset_name="foo", index=None, metadata=None
+        ):
+            self.key = key
+
+        @core.cached_property
+        def f(self):
+            n_channels = 1 if self.key == "mono" else 2
+            return np.ones((n_channels, n_samples), dtype=np.float32), 1000
+
+    class TestMultiTrack1(core.MultiTrack):
+        @property
+        def track_audio_property(self):
+            return "f"
+
+    track_ids = ["a", "b", "c", "d", "e", "f", "g", "h"]
+    index = {"multitracks": {"ab": {"tracks": track_ids + ["mono"]}}}
+    mtrack = TestMultiTrack1("ab", "foo", "test", index, TestTrack, lambda: None)
+    assert mtrack.tracks is mtrack.tracks
+    assert mtrack.tracks["a"] is mtrack.tracks["a"]
+
+    # decode the stems before measuring the mix
+    for track_id in track_ids:
+        mtrack.tracks[track_id].f
+
+    tracemalloc.start()
+    target = mtrack.get_target(track_ids, weights=np.arange(1, 9))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert target.dtype == np.float32
+    assert np.allclose(target, 1)
+    # the mix buffer and one scaled stem, instead of all stems in float64
+    assert peak < 3 * 2 * n_samples * 4
+
+    assert np.allclose(mtrack.get_target(["a", "b"], average=False), 2)
+    assert np.allclose(
+        mtrack.get_target(["a", "b"], weights=[0.5, 1.5], average=False), 2
+    )
+
+    with pytest.raises(ValueError):
+        mtrack.get_target([])
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "b"], weights=[1])
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "mono"])
+    with pytest.raises(ZeroDivisionError):
+        mtrack.get_target(["a", "b"], weights=[0, 0])
+
+
+def test_get_audio_window():
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track = dataset.track("Beethoven-S3-I-ex1")
+    full, sr = track.audio_stereo
+    y, y_sr = track.get_audio_window(
+        offset=0.5, duration=0.25, audio_property="audio_stereo"
+    )
+    start = int(0.5 * sr)
+    assert y_sr == sr
+    assert y.shape == (2, int(0.25 * sr))
+    assert np.allclose(y, full[:, start : start + int(0.25 * sr)])
+
+    y, _ = track.get_audio_window(offset=1.0, audio_property="audio_mono")
+    assert y.shape == (track.audio_mono[0].shape[0] - int(1.0 * sr),)
+    # the window only applies inside get_audio_window
+    assert track.audio_stereo[0].shape == full.shape
+
+    with pytest.raises(AttributeError):
+        track.get_audio_window(duration=1.0)
+
+
+def test_get_decoded_audio(mocker):
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track = dataset.track("Beethoven-S3-I-ex1")
+    stereo, sr = track.audio_stereo
+    load = mocker.spy(audio_utils, "load")
+
+    # without the memo, every call decodes the file
+    y, y_sr = track.get_decoded_audio("audio_stereo", mono=False)
+    assert y_sr == sr
+    assert np.array_equal(y, stereo)
+    track.get_decoded_audio("audio_stereo", mono=False)
+    assert load.call_count == 2
+    assert track.get_decoded_audio("audio_stereo", mono=True)[0].shape == (88200,)
+
+    dataset.set_audio_memo(True)
+    try:
+        load.reset_mock()
+        track = dataset.track("Beethoven-S3-I-ex1")
+        y, _ = track.get_decoded_audio("audio_stereo", mono=False)
+        mono, _ = track.get_decoded_audio("audio_stereo", mono=True)
+        assert not y.flags.writeable
+        assert np.allclose(mono, stereo.mean(axis=0), atol=1e-6)
+        assert load.call_count == 1
+
+        # the memo follows the window
+        with audio_utils.window(offset=1.0):
+            y_window, _ = track.get_decoded_audio("audio_stereo", mono=False)
+        assert np.array_equal(y_window, stereo[:, 44100:])
+        assert load.call_count == 2
+
+        # resampled audio is memoized separately
+        y_22k, sr_22k = track.get_decoded_audio("audio_stereo", sr=22050)
+        assert sr_22k == 22050
+        assert y_22k.shape == (44100,)
+        assert load.call_count == 3
+    finally:
+        dataset.set_audio_memo(None)
+
+    assert audio_utils.get_memo("orchset") is None
+
+
+def test_get_audio_info(mocker):
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track = dataset.track("Beethoven-S3-I-ex1")
+    info = track.get_audio_info("audio_stereo")
+    assert info["sample_rate"] == 44100
+    assert info["n_channels"] == 2
+    assert info["duration"] == info["n_frames"] / 44100.0
+
+    # audio info recorded in the index is used without reading the file
+    index_info = {
+        "sample_rate": 8000,
+        "n_channels": 1,
+        "n_frames": 16000,
+        "duration": 2.0,
+    }
+    mocker.patch.object(
+        track,
+        "_track_paths",
+        {"audio_mono": ["does/not/exist.wav", None, index_info], "none": [None, None]},
+    )
+    assert track.get_audio_info("audio_mono") == index_info
+    assert track.get_audio_info("none") is None
+
+
+def test_get_annotation(tmpdir, mocker):
+    from mirdata import annotation_store
+    from mirdata.datasets import salami
+
+    dataset = mirdata.initialize(
+        "salami", data_home="tests/resources/mir_datasets/salami"
+    )
+    expected = dataset.track("2").sections_annotator_1_uppercase
+    loader = mocker.spy(salami, "load_sections")
+    loader.__module__ = salami.__name__
+    loader.__qualname__ = salami.load_sections.__qualname__
+
+    dataset.set_annotation_store(True, store_dir=str(tmpdir))
+    try:
+        # parsed once, then loaded from the store by new tracks
+        for _ in range(2):
+            track = dataset.track("2")
+            sections = track.get_annotation("annotator_1_uppercase", loader)
+            assert np.array_equal(sections.intervals, expected.intervals)
+            assert sections.labels == expected.labels
+        assert loader.call_count == 1
+        assert isinstance(sections.intervals, np.memmap)
+        assert len(os.listdir(str(tmpdir))) == 1
+
+        # lambdas have no stable name, so bypass the store
+        for _ in range(2):
+            dataset.track("2").get_annotation(
+                "annotator_1_uppercase", lambda path: loader(path)
+            )
+        assert loader.call_count == 3
+        assert len(os.listdir(str(tmpdir))) == 1
+
+        # the store is keyed by the checksum in the index
+        mocker.patch.object(
+            track,
+            "_track_paths",
+            dict(
+                track._track_paths,
+                annotator_1_uppercase=[
+                    track._track_paths["annotator_1_uppercase"][0],
+                    "0" * 32,
+                ],
+            ),
+        )
+        track.get_annotation("annotator_1_uppercase", loader)
+        assert loader.call_count == 4
+        assert len(os.listdir(str(tmpdir))) == 2
+
+        dataset.set_annotation_store(False)
+        dataset.track("2").get_annotation("annotator_1_uppercase", loader)
+        assert loader.call_count == 5
+    finally:
+        dataset.set_annotation_store(None)
+
+    assert annotation_store.get_store("salami") is None
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_audio_batch(executor):
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track_id = "Beethoven-S3-I-ex1"
+    expected, sr = dataset.track(track_id).audio_mono
+
+    # missing audio files and unknown ids are reported without stopping the batch
+    track_ids = [track_id, dataset.track_ids[1], "not_a_track", track_id]
+    results = list(
+        dataset.load_audio_batch(
+            track_ids, audio_property="audio_mono", n_workers=2, executor=executor
+        )
+    )
+    assert [result[0] for result in results] == track_ids
+    for i in [0, 3]:
+        assert results[i][2] is None
+        assert results[i][1][1] == sr
+        assert np.allclose(results[i][1][0], expected)
+    assert isinstance(results[1][2], IOError) and results[1][1] is None
+    assert isinstance(results[2][2], ValueError) and results[2][1] is None
+
+    results = dataset.load_audio_batch(
+        track_ids,
+        audio_property="audio_mono",
+        n_workers=1,
+        executor=executor,
+        ordered=False,
+        offset=0.5,
+        duration=0.25,
+    )
+    results = sorted(results, key=lambda result: track_ids.index(result[0]))
+    assert [result[0] for result in results] == sorted(track_ids, key=track_ids.index)
+    assert results[2][2] is not None
+    start = int(0.5 * sr)
+    assert np.allclose(results[0][1][0], expected[start : start + int(0.25 * sr)])
+
+
+def test_load_audio_batch_errors():
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    with pytest.raises(ValueError):
+        list(dataset.load_audio_batch(executor="not_an_executor"))
+
+    # stopping early does not wait for the whole batch
+    batch = dataset.load_audio_batch(n_workers=1, audio_property="audio_mono")
+    track_id, _, _ = next(batch)
+    assert track_id == dataset.track_ids[0]
+    batch.close()
+
+
+def test_audio_blocks():
+    dataset = mirdata.initialize(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track = dataset.track("Beethoven-S3-I-ex1")
+    y, _ = track.audio_stereo
+    blocks = list(
+        track.audio_blocks(
+            4096, hop_size=2048, mono=False, path_attribute="audio_path_stereo"
+        )
+    )
+    assert blocks[0].shape == (2, 4096)
+    assert np.allclose(blocks[1], y[:, 2048 : 2048 + 4096])
+    assert np.allclose(blocks[-1], y[:, 2048 * (len(blocks) - 1) :])
+
+    blocks = list(track.audio_blocks(4096, path_attribute="audio_path_mono"))
+    assert np.allclose(np.concatenate(blocks), track.audio_mono[0])
+
+    class TestTrack(core.Track):
+        audio_path = core.track_path("audio")
+
+    index = {"tracks": {"a": {"audio": [None, None]}}}
+    track = TestTrack("a", "data_home", "test", index, None)
+    with pytest.raises(IOError):
+        track.audio_blocks(4096)
@@ -0,0 +1,282 @@
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from mirdata import index_utils
+from mirdata.datasets import orchset, phenicx_anechoic
+
+INDEXES_DIR = "mirdata/datasets/indexes"
+
+
+@pytest.mark.parametrize(
+    "index_name",
+    [
+        "orchset_index.json",
+        "phenicx_anechoic_index.json",
+        "saraga_carnatic_index.json",
+        "cante100_index.json",
+        "medley_solos_db_index.json",
+    ],
+)
+def test_compile_index(tmp_path, index_name):
+    index_path = os.path.join(INDEXES_DIR, index_name)
+    compiled_path = str(tmp_path / "compiled.mirdx")
+    assert index_utils.compile_index(index_path, compiled_path) == compiled_path
+
+    with open(index_path) as fhandle:
+        expected = json.load(fhandle)
+    compiled = index_utils.load_compiled_index(compiled_path)
+
+    assert list(compiled.keys()) == list(expected.keys())
+    for key in expected:
+        assert key in compiled
+    assert compiled == expected
+    assert list(compiled["tracks"].keys()) == list(expected["tracks"].keys())
+    assert len(compiled["tracks"]) == len(expected["tracks"])
+    assert "~faketrackid~?!" not in compiled["tracks"]
+    assert 1 not in compiled["tracks"]
+    with pytest.raises(KeyError):
+        compiled["tracks"]["~faketrackid~?!"]
+
+
+# test_acousticbrainz_genre_index.json is a truncated sample and is not valid json
+@pytest.mark.parametrize(
+    "index_name",
+    sorted(
+        name
+        for name in os.listdir(INDEXES_DIR)
+        if name != "test_acousticbrainz_genre_index.json"
+    ),
+)
+def test_compile_index_key_order(tmp_path, index_name):
+    index_path = os.path.join(INDEXES_DIR, index_name)
+    compiled_path = str(tmp_path / "compiled.mirdx")
+    index_utils.compile_index(index_path, compiled_path)
+
+    with open(index_path) as fhandle:
+        expected = json.load(fhandle)
+    compiled = index_utils.load_compiled_index(compiled_path)
+
+    for section in index_utils.SECTIONS:
+        if section not in expected:
+            continue
+        for row_id, row in expected[section].items():
+            assert list(compiled[section][row_id]) == list(row)
+
+
+def test_compile_index_absent_keys(tmp_path):
+    index = {
+        "version": "1",
+        "tracks": {
+            "a": {"audio": [None, None], "annotation": ["a/b.txt", "0" * 32]},
+            "b": {"annotation": ["a/c.txt", None]},
+        },
+    }
+    compiled_path = str(tmp_path / "compiled.mirdx")
+    index_utils.write_compiled_index(index, compiled_path)
+    compiled = index_utils.load_compiled_index(compiled_path)
+    assert compiled == index
+    assert compiled.source is None
+
+    index["tracks"]["b"]["annotation"] = ["a/c.txt", "not a checksum"]
+    with pytest.raises(ValueError):
+        index_utils.write_compiled_index(index, compiled_path)
+
+    with open(compiled_path, "wb") as fhandle:
+        fhandle.write(b"not an index")
+    with pytest.raises(ValueError):
+        index_utils.load_compiled_index(compiled_path)
+
+
+def test_compile_index_audio_info(tmp_path):
+    index_path = os.path.join(INDEXES_DIR, "orchset_index.json")
+    with open(index_path) as fhandle:
+        index = json.load(fhandle)
+    index_utils.add_audio_info(index, "tests/resources/mir_datasets/orchset")
+    track = index["tracks"]["Beethoven-S3-I-ex1"]
+    assert track["audio_mono"][2] == {
+        "sample_rate": 44100,
+        "n_channels": 1,
+        "n_frames": 88200,
+        "duration": 2.0,
+    }
+    assert track["audio_stereo"][2]["n_channels"] == 2
+    assert len(track["melody"]) == 2
+    # files missing from data_home are left unchanged
+    assert len(index["tracks"]["Beethoven-S3-I-ex2"]["audio_mono"]) == 2
+
+    compiled_path = str(tmp_path / "compiled.mirdx")
+    index_utils.write_compiled_index(index, compiled_path)
+    compiled = index_utils.load_compiled_index(compiled_path)
+    assert compiled == index
+
+
+def test_is_compiled_index_current(tmp_path):
+    index_path = str(tmp_path / "orchset_index.json")
+    shutil.copy(os.path.join(INDEXES_DIR, "orchset_index.json"), index_path)
+    compiled_path = index_utils.compiled_index_path(index_path)
+    assert compiled_path == str(tmp_path / "orchset_index.mirdx")
+    assert not index_utils.is_compiled_index_current(compiled_path, index_path)
+
+    index_utils.compile_index(index_path)
+    assert index_utils.is_compiled_index_current(compiled_path, index_path)
+
+    # touching the json index without changing it keeps the compiled index
+    stat = os.stat(index_path)
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert index_utils.is_compiled_index_current(compiled_path, index_path)
+
+    # a modified json index invalidates the compiled index
+    with open(index_path, "r+") as fhandle:
+        content = fhandle.read()
+        fhandle.seek(0)
+        fhandle.write(content.replace("Beethoven", "Beethovem", 1))
+    assert os.stat(index_path).st_size == stat.st_size
+    assert not index_utils.is_compiled_index_current(compiled_path, index_path)
+    with open(index_path, "a") as fhandle:
+        fhandle.write(" ")
+    assert not index_utils.is_compiled_index_current(compiled_path, index_path)
+
+    # a compiled index without its json index is used as is
+    os.remove(index_path)
+    assert index_utils.is_compiled_index_current(compiled_path, index_path)
+
+    with open(compiled_path, "wb") as fhandle:
+        fhandle.write(b"not an index")
+    with open(index_path, "w") as fhandle:
+        fhandle.write("{}")
+    assert not index_utils.is_compiled_index_current(compiled_path, index_path)
+
+
+def test_dataset_prefers_compiled_index(tmp_path):
+    dataset = orchset.Dataset("tests/resources/mir_datasets/orchset")
+    expected_track_ids = dataset.track_ids
+    expected_validation = dataset.validate(verbose=False)
+    index_path = str(tmp_path / "orchset_index.json")
+    shutil.copy(dataset.index_path, index_path)
+    index_utils.compile_index(index_path)
+
+    dataset = orchset.Dataset("tests/resources/mir_datasets/orchset")
+    dataset.index_path = index_path
+    assert isinstance(dataset._index, index_utils.CompiledIndex)
+    assert dataset.track_ids == expected_track_ids
+
+    track = dataset.track("Beethoven-S3-I-ex1")
+    assert track.melody_path == (
+        "tests/resources/mir_datasets/orchset/GT/Beethoven-S3-I-ex1.mel"
+    )
+    with pytest.raises(ValueError):
+        dataset.track("~faketrackid~?!")
+    assert dataset.validate(verbose=False) == expected_validation
+
+
+def test_dataset_compiled_multitracks(tmp_path):
+    dataset = phenicx_anechoic.Dataset("tests/resources/mir_datasets/phenicx_anechoic")
+    index_path = str(tmp_path / "phenicx_anechoic_index.json")
+    shutil.copy(dataset.index_path, index_path)
+    index_utils.compile_index(index_path)
+    dataset.index_path = index_path
+
+    assert isinstance(dataset._index, index_utils.CompiledIndex)
+    mtrack = dataset.multitrack("beethoven")
+    assert mtrack.track_ids[0] == "beethoven-horn"
+    assert len(mtrack.tracks) == 10
+
+
+def test_open_compiled_index_speed(tmp_path):
+    compiled_path = str(tmp_path / "medley_solos_db_index.mirdx")
+    index_utils.compile_index(
+        os.path.join(INDEXES_DIR, "medley_solos_db_index.json"), compiled_path
+    )
+    start = time.perf_counter()
+    compiled = index_utils.load_compiled_index(compiled_path)
+    assert "d07b1fc0-567d-52c2-fef4-239f31c9d40e" in compiled["tracks"]
+    assert time.perf_counter() - start < 0.5
+
+
+def test_dataset_index_cache(tmp_path):
+    data_home = str(tmp_path / "orchset")
+    shutil.copytree(
+        "tests/resources/mir_datasets/orchset",
+        data_home,
+        ignore=shutil.ignore_patterns(".mirdata_cache"),
+    )
+    index_path = str(tmp_path / "orchset_index.json")
+    shutil.copy(os.path.join(INDEXES_DIR, "orchset_index.json"), index_path)
+
+    dataset = orchset.Dataset(data_home)
+    dataset.index_path = index_path
+    cache_path = os.path.join(data_home, ".mirdata_cache", "orchset_index.mirdx")
+    assert dataset._index_cache_path == cache_path
+    assert not os.path.exists(cache_path)
+
+    # the first load parses the json index and writes the cache
+    assert isinstance(dataset._index, dict)
+    assert os.path.exists(cache_path)
+
+    # other instances reuse the cache
+    dataset2 = orchset.Dataset(data_home)
+    dataset2.index_path = index_path
+    assert isinstance(dataset2._index, index_utils.CompiledIndex)
+    assert dataset2._index == dataset._index
+    assert dataset2.track_ids == dataset.track_ids
+
+    dataset.clear_index_cache()
+    assert not os.path.exists(cache_path)
+    dataset.clear_index_cache()
+
+    assert dataset.rebuild_index_cache() == cache_path
+    assert index_utils.is_compiled_index_current(cache_path, index_path)
+
+    # a changed json index is parsed again
+    with open(index_path, "a") as fhandle:
+        fhandle.write("\n")
+    dataset3 = orchset.Dataset(data_home)
+    dataset3.index_path = index_path
+    assert isinstance(dataset3._index, dict)
+    assert index_utils.is_compiled_index_current(cache_path, index_path)
+
+
+def test_dataset_index_cache_no_data_home(tmp_path):
+    data_home = str(tmp_path / "not_downloaded")
+    dataset = orchset.Dataset(data_home)
+    assert isinstance(dataset._index, dict)
+    assert not os.path.exists(data_home)
+
+
+def test_write_index_cache_error(tmp_path, mocker):
+    mocker.patch.object(
+        index_utils, "write_compiled_index", side_effect=PermissionError
+    )
+    cache_path = str(tmp_path / ".mirdata_cache" / "orchset_index.mirdx")
+    index_path = os.path.join(INDEXES_DIR, "orchset_index.json")
+    assert not index_utils.write_index_cache({}, cache_path, index_path)
+
+
+def test_compiled_index_shards(tmp_path):
+    index = {
+        "tracks": {
+            "a#train": {"audio": ["a.wav", None]},
+            "b#test": {"audio": ["b.wav", None]},
+            "c#train": {"audio": ["c.wav", None]},
+        }
+    }
+    compiled_path = str(tmp_path / "compiled.mirdx")
+    index_utils.write_compiled_index(
+        index, compiled_path, shard_key=lambda track_id: track_id.split("#")[1]
+    )
+    shards = index_utils.load_compiled_index(compiled_path)["tracks"].shards
+    assert list(shards.keys()) == ["train", "test"]
+    assert list(shards["train"].keys()) == ["a#train", "c#train"]
+    assert len(shards["test"]) == 1
+    assert shards["train"]["c#train"] == {"audio": ["c.wav", None]}
+    assert "b#test" not in shards["train"]
+    assert "d#train" not in shards["train"]
+    with pytest.raises(KeyError):
+        shards["train"]["b#test"]
+
+    index_utils.write_compiled_index(index, compiled_path)
+    assert index_utils.load_compiled_index(compiled_path)["tracks"].shards == {}
@@ -1,5 +1,11 @@
+import os
+import pkgutil
+import subprocess
+import sys
+
 import pytest
 
+import mirdata
 from mirdata import core
 from mirdata import initialize, list_datasets
 
@@ -19,3 +25,77 @@ def test_initialize():
 
     with pytest.raises(ValueError):
         initialize("asdfasdfasdfa")
+
+
+def test_lazy_import():
+    missing = core.lazy_import("~notamodule~", install_message="please install it")
+    with pytest.raises(ImportError, match="please install it"):
+        missing.load
+    assert not hasattr(missing, "__version__")
+
+    import json
+
+    assert core.lazy_import("json") is json
+
+    lazy_colorsys = core.lazy_import("colorsys")
+    assert lazy_colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+
+
+def test_initialize_import_time():
+    # initializing every dataset and reading its index should not import the
+    # heavy audio/annotation dependencies
+    script = """
+import sys
+import time
+
+import mirdata
+
+HEAVY = ["librosa", "jams", "pretty_midi", "DALI"]
+slow = []
+for name in mirdata.list_datasets():
+    start = time.perf_counter()
+    dataset = mirdata.initialize(
+        name, data_home="tests/resources/mir_datasets/" + name
+    )
+    if not dataset.remote_index:
+        dataset.track_ids
+    if time.perf_counter() - start > 2:
+        slow.append(name)
+    loaded = [module for module in HEAVY if module in sys.modules]
+    assert not loaded, (name, loaded)
+assert not slow, slow
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_dataset_info():
+    info = mirdata.dataset_info("phenicx_anechoic")
+    assert info["module"] == "mirdata.datasets.phenicx_anechoic"
+    assert info["has_multitracks"]
+    assert info["num_tracks"] == 38
+    assert info["num_multitracks"] == 4
+
+    info["num_tracks"] = 0
+    assert mirdata.dataset_info("phenicx_anechoic")["num_tracks"] == 38
+
+    assert mirdata.dataset_info("acousticbrainz_genre")["num_tracks"] is None
+
+    with pytest.raises(ValueError):
+        mirdata.dataset_info("asdfasdfasdfa")
+
+
+def test_registry_up_to_date():
+    # run scripts/make_registry.py if this fails
+    dataset_dir = os.path.join(os.path.dirname(mirdata.__file__), "datasets")
+    assert list_datasets() == sorted(
+        module.name for module in pkgutil.iter_modules([dataset_dir])
+    )
+    for dataset_name in list_datasets():
+        info = mirdata.dataset_info(dataset_name)
+        dataset = initialize(dataset_name)
+        assert info["has_tracks"] == (dataset._track_class is not None)
+        assert info["has_multitracks"] == (dataset._multitrack_class is not None)
+        assert info["remote_index"] == dataset.remote_index
+        if not dataset.remote_index:
+            assert info["index_size"] == os.path.getsize(dataset.index_path)
+            assert info["num_tracks"] == len(dataset._index.get("tracks", {}))
@@ -1,6 +1,7 @@
 import tempfile
 from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
 
+import numpy as np
 import pytest
 
 from mirdata import io
@@ -33,6 +34,15 @@ def test_coerce_to_string_io_with_stringio():
         func(f)
 
 
+def test_coerce_to_string_io_with_args():
+    @io.coerce_to_string_io
+    def func(fh, a, b=None):
+        return fh.read(), a, b
+
+    with StringIO("abc") as f:
+        assert func(f, 1, b=2) == ("abc", 1, 2)
+
+
 def test_invalid_coerce_to_string_io():
     @io.coerce_to_string_io
     def func(fh):
@@ -69,6 +79,15 @@ def test_coerce_to_bytes_io_with_bytesio():
         func(f)
 
 
+def test_coerce_to_bytes_io_with_args():
+    @io.coerce_to_bytes_io
+    def func(fh, a, b=None):
+        return fh.read(), a, b
+
+    with BytesIO(b"abc") as f:
+        assert func(f, 1, b=2) == (b"abc", 1, 2)
+
+
 def test_invalid_coerce_to_bytes_io():
     @io.coerce_to_bytes_io
     def func(fh):
@@ -76,3 +95,84 @@ def test_invalid_coerce_to_bytes_io():
 
     with pytest.raises(ValueError):
         func(123)
+
+
+@pytest.mark.parametrize(
+    "text,delimiter",
+    [
+        ("0\t0\n0.08\t0\n0.09\t622.254\n", "\t"),
+        ("0,0\n0.08,0\n\n0.09,622.254", ","),
+        ("0 0 \n  0.08 0\n0.09   622.254\n\n", None),
+        ("0\t 0\r\n0.08\t 0\r\n0.09\t 622.254\r\n", "\t"),
+    ],
+)
+def test_load_numeric_table(text, delimiter):
+    table = io.load_numeric_table(StringIO(text), delimiter=delimiter)
+    assert table.shape == (3, 2)
+    assert table.dtype == np.float64
+    assert np.array_equal(table, [[0, 0], [0.08, 0], [0.09, 622.254]])
+
+
+def test_load_numeric_table_columns():
+    table = io.load_numeric_table(StringIO("1 \n2 \n-3.5 \n"), n_columns=1)
+    assert np.array_equal(table, [[1], [2], [-3.5]])
+
+    table = io.load_numeric_table(StringIO("1,nan\n2,inf\n"), delimiter=",")
+    assert np.isnan(table[0, 1]) and np.isinf(table[1, 1])
+
+    assert io.load_numeric_table(StringIO(""), delimiter=",").shape == (0, 0)
+    assert io.load_numeric_table(StringIO("\n"), n_columns=2).shape == (0, 2)
+    assert io.load_numeric_table(StringIO(""), ",", n_columns=3).shape == (0, 3)
+
+
+@pytest.mark.parametrize(
+    "text,n_columns",
+    [
+        ("1,2\n3,x\n", None),
+        ("1,2\n3\n", None),
+        ("1,2,3\n4\n", 2),
+        ("1,2\n3,4,5\n6\n", None),
+        ("1,,2\n3,4\n", 2),
+        ("1,2\n3,,4\n5,6\n7,8\n", None),
+        (",1,2\n3,4\n", None),
+        ("1,2\n,\n", None),
+        ("1\n,\n", 1),
+    ],
+)
+def test_load_numeric_table_invalid(text, n_columns):
+    with pytest.raises(ValueError):
+        io.load_numeric_table(StringIO(text), delimiter=",", n_columns=n_columns)
+
+
+@pytest.mark.parametrize(
+    "text,n_columns",
+    [
+        # trailing delimiters
+        ("1,2,\n3,4,\n", 2),
+        ("1,2,\n3,4,\n", None),
+        ("1,2,\n3,4\n", None),
+        # extra columns, which may not be numbers
+        ("1,2,9\n3,4,9\n", 2),
+        ("1,2,9\n3,4\n", 2),
+        ("1,2,x\n3,4,,\n", 2),
+    ],
+)
+def test_load_numeric_table_extra_fields(text, n_columns):
+    table = io.load_numeric_table(StringIO(text), delimiter=",", n_columns=n_columns)
+    assert np.array_equal(table, [[1, 2], [3, 4]])
+
+    tab_text = text.replace(",", "\t")
+    table = io.load_numeric_table(StringIO(tab_text), "\t", n_columns=n_columns)
+    assert np.array_equal(table, [[1, 2], [3, 4]])
+
+    if n_columns is not None:
+        space_text = text.replace(",", " ")
+        table = io.load_numeric_table(StringIO(space_text), n_columns=n_columns)
+        assert np.array_equal(table, [[1, 2], [3, 4]])
+
+
+def test_load_numeric_table_empty_tab_fields():
+    with pytest.raises(ValueError):
+        io.load_numeric_table(StringIO("1\t\t2\n3\t4\n"), delimiter="\t")
+    with pytest.raises(ValueError):
+        io.load_numeric_table(StringIO("1\t2\n3\n"), delimiter="\t", n_columns=2)
@@ -1107,6 +1107,12 @@ def test_duration():
     with pytest.raises(OSError):
         jams_utils.jams_converter(audio_path="i/dont/exist")
 
+    # duration from the audio info, without reading the file
+    jam = jams_utils.jams_converter(
+        audio_path="i/dont/exist", audio_info={"duration": 3.5}
+    )
+    assert jam.file_metadata.duration == 3.5
+
     jam1 = jams_utils.jams_converter(metadata={"duration": 4})
     assert jam1.file_metadata.duration == 4.0
     assert jam1.validate()